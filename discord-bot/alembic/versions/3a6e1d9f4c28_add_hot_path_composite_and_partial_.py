@@ -0,0 +1,38 @@
+"""add hot path composite and partial indexes
+
+Revision ID: 3a6e1d9f4c28
+Revises: d27a9c4e8b13
+Create Date: 2026-10-18 17:22:40.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3a6e1d9f4c28'
+down_revision: Union[str, Sequence[str], None] = 'd27a9c4e8b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # tournament_participants (tournament_id, user_id) and (tournament_id, challonge_id)
+    # are already indexed by their unique constraints.
+    op.create_index('ix_tm_t_round_completed', 'tournament_matches', ['tournament_id', 'round', 'completed'], unique=False)
+    op.create_index('ix_pokemon_storage_tier', 'pokemon', ['in_storage', 'always_stored', 'tier'], unique=False)
+    op.create_index('ix_loans_open_pokemon', 'loans', ['pokemon_id'], unique=False,
+                    postgresql_where=sa.text('returned_at IS NULL'))
+    op.create_index('ix_challonge_outbox_pending', 'challonge_outbox', ['id'], unique=False,
+                    postgresql_where=sa.text("status = 'pending'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_challonge_outbox_pending', table_name='challonge_outbox', postgresql_where=sa.text("status = 'pending'"))
+    op.drop_index('ix_loans_open_pokemon', table_name='loans', postgresql_where=sa.text('returned_at IS NULL'))
+    op.drop_index('ix_pokemon_storage_tier', table_name='pokemon')
+    op.drop_index('ix_tm_t_round_completed', table_name='tournament_matches')
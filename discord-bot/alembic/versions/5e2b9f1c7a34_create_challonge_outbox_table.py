@@ -0,0 +1,42 @@
+"""create challonge outbox table
+
+Revision ID: 5e2b9f1c7a34
+Revises: c41e8a7d2f90
+Create Date: 2026-10-18 11:02:47.915330
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2b9f1c7a34'
+down_revision: Union[str, Sequence[str], None] = 'c41e8a7d2f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('challonge_outbox',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('tournament_id', sa.Integer(), nullable=False),
+    sa.Column('challonge_match_id', sa.Integer(), nullable=False),
+    sa.Column('scores_csv', sa.Text(), nullable=False),
+    sa.Column('winner_challonge_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.Text(), server_default='pending', nullable=False),
+    sa.Column('attempts', sa.Integer(), server_default=sa.text('0'), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('next_attempt_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('sent_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['tournament_id'], ['tournaments.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('challonge_outbox')
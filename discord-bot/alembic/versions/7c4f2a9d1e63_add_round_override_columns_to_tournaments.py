@@ -0,0 +1,30 @@
+"""add round override columns to tournaments
+
+Revision ID: 7c4f2a9d1e63
+Revises: 3a6e1d9f4c28
+Create Date: 2026-10-18 21:04:12.530871
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c4f2a9d1e63'
+down_revision: Union[str, Sequence[str], None] = '3a6e1d9f4c28'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tournaments', sa.Column('current_round_override', sa.Integer(), nullable=True))
+    op.add_column('tournaments', sa.Column('max_round_override', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tournaments', 'max_round_override')
+    op.drop_column('tournaments', 'current_round_override')
@@ -0,0 +1,28 @@
+"""tp add reward channel id
+
+Revision ID: 8f3d6a2b1c57
+Revises: 5e2b9f1c7a34
+Create Date: 2026-10-18 14:41:27.502816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3d6a2b1c57'
+down_revision: Union[str, Sequence[str], None] = '5e2b9f1c7a34'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tournament_participants', sa.Column('reward_channel_id', sa.BigInteger(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tournament_participants', 'reward_channel_id')
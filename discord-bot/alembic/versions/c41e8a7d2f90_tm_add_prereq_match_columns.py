@@ -0,0 +1,34 @@
+"""tm add prereq match columns
+
+Revision ID: c41e8a7d2f90
+Revises: 1efcbc8a3af1
+Create Date: 2026-10-18 10:12:04.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8a7d2f90'
+down_revision: Union[str, Sequence[str], None] = '1efcbc8a3af1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('tournament_matches', sa.Column('player1_prereq_match_id', sa.Integer(), nullable=True))
+    op.add_column('tournament_matches', sa.Column('player2_prereq_match_id', sa.Integer(), nullable=True))
+    op.add_column('tournament_matches', sa.Column('player1_is_prereq_loser', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.add_column('tournament_matches', sa.Column('player2_is_prereq_loser', sa.Boolean(), server_default=sa.false(), nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('tournament_matches', 'player2_is_prereq_loser')
+    op.drop_column('tournament_matches', 'player1_is_prereq_loser')
+    op.drop_column('tournament_matches', 'player2_prereq_match_id')
+    op.drop_column('tournament_matches', 'player1_prereq_match_id')
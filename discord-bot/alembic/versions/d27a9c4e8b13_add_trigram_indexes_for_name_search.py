@@ -0,0 +1,42 @@
+"""add trigram indexes for name search
+
+Revision ID: d27a9c4e8b13
+Revises: 8f3d6a2b1c57
+Create Date: 2026-10-18 16:05:51.734920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd27a9c4e8b13'
+down_revision: Union[str, Sequence[str], None] = '8f3d6a2b1c57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_pokemon_name_trgm', 'pokemon', ['name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_users_username_trgm', 'users', ['username'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'username': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_username_trgm', table_name='users', postgresql_using='gin')
+    op.drop_index('ix_pokemon_name_trgm', table_name='pokemon', postgresql_using='gin')
+    # pg_trgm is left installed; other objects in the database may rely on it.
@@ -0,0 +1,29 @@
+"""add failed outbox index
+
+Revision ID: e5b8c3a1f702
+Revises: 7c4f2a9d1e63
+Create Date: 2026-10-18 23:41:07.214583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b8c3a1f702'
+down_revision: Union[str, Sequence[str], None] = '7c4f2a9d1e63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_challonge_outbox_failed', 'challonge_outbox', ['tournament_id', 'id'], unique=False,
+                    postgresql_where=sa.text("status = 'failed'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_challonge_outbox_failed', table_name='challonge_outbox', postgresql_where=sa.text("status = 'failed'"))
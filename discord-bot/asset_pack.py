@@ -0,0 +1,223 @@
+"""Offline pack of Pokémon artwork and item icons for the team image renderer.
+
+The pack is a directory with
+    index.json      normalized Pokémon / form / species name -> dex id
+    manifest.json   files in the pack with their sha256 and size
+    pokemon/<id>.png, items/<name>.png
+
+The renderer looks names up here first and only goes to the network for
+entries the pack doesn't know. Build or refresh it once, before building the
+image (it is copied in with the rest of the bot):
+
+    poetry run python asset_pack.py sync [--workers 8] [--skip-artwork] [--skip-items] [--force]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
+
+ASSET_PACK_DIR = os.getenv("ASSET_PACK_DIR", "asset_pack")
+# Hand-picked icons that PokeAPI doesn't have; checked after the pack
+LOCAL_ITEMS_DIR = "battle_items"
+LOCAL_ITEM_EXTENSIONS = (".png", ".jpeg", ".jpg")
+
+POKEAPI = "https://pokeapi.co/api/v2"
+ARTWORK_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{id}.png"
+ITEM_ICON_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/items/{name}.png"
+HTTP_TIMEOUT = 30
+
+
+class AssetPack:
+    """Read side of the pack; loads index and manifest on first use."""
+
+    def __init__(self, directory: str = ASSET_PACK_DIR) -> None:
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._index: dict[str, int] | None = None
+        self._manifest: dict | None = None
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._index is not None:
+                return
+            try:
+                with open(os.path.join(self.directory, "index.json"), encoding="utf-8") as f:
+                    index = json.load(f)
+                with open(os.path.join(self.directory, "manifest.json"), encoding="utf-8") as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                log.info(f"[asset_pack] No asset pack in {self.directory}: {e}")
+                index, manifest = {}, {"pokemon": {}, "items": {}}
+
+            self._manifest = manifest
+            self._index = index
+            log.info(f"[asset_pack] {len(index)} names, {len(manifest['pokemon'])} artworks, {len(manifest['items'])} item icons")
+
+    def _read(self, entry: dict | None) -> bytes | None:
+        if not entry:
+            return None
+        try:
+            with open(os.path.join(self.directory, entry["file"]), "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def dex_id(self, name: str) -> int | None:
+        self._load()
+        return self._index.get(name)
+
+    def pokemon_artwork(self, name: str) -> bytes | None:
+        dex_id = self.dex_id(name)
+        if dex_id is None:
+            return None
+        return self._read(self._manifest["pokemon"].get(str(dex_id)))
+
+    def item_icon(self, name: str) -> bytes | None:
+        self._load()
+        data = self._read(self._manifest["items"].get(name))
+        if data is not None:
+            return data
+
+        for extension in LOCAL_ITEM_EXTENSIONS:
+            try:
+                with open(os.path.join(LOCAL_ITEMS_DIR, f"{name}{extension}"), "rb") as f:
+                    return f.read()
+            except OSError:
+                continue
+        return None
+
+
+asset_pack = AssetPack()
+
+
+# Sync ---------------------------------------------------------------------
+
+def _id_from_url(url: str) -> int:
+    return int(url.rstrip("/").rsplit("/", 1)[-1])
+
+
+def _list(session, resource: str) -> list[dict]:
+    response = session.get(f"{POKEAPI}/{resource}?limit=100000", timeout=HTTP_TIMEOUT)
+    response.raise_for_status()
+    return response.json()["results"]
+
+
+def build_index(session) -> dict[str, int]:
+    # Every Pokémon and form by its own name ("landorus-therian")
+    index = {entry["name"]: _id_from_url(entry["url"]) for entry in _list(session, "pokemon")}
+    # Species names resolve to the default form ("tornadus" -> tornadus-incarnate)
+    for entry in _list(session, "pokemon-species"):
+        index.setdefault(entry["name"], _id_from_url(entry["url"]))
+    return index
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def _download_file(session, url: str, directory: str, relative: str, known: dict | None, force: bool) -> dict | None:
+    path = os.path.join(directory, relative)
+    if known and not force and os.path.isfile(path):
+        return known
+
+    response = session.get(url, timeout=HTTP_TIMEOUT)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    _write_atomic(path, response.content)
+    return {
+        "file": relative,
+        "sha256": hashlib.sha256(response.content).hexdigest(),
+        "size": len(response.content),
+    }
+
+
+def _download_all(session, jobs: dict[str, tuple[str, str]], directory: str, known: dict, workers: int, force: bool, label: str) -> dict:
+    """jobs: manifest key -> (url, relative path). Returns the manifest section."""
+    section = {}
+    failed = 0
+
+    def run(key):
+        url, relative = jobs[key]
+        return key, _download_file(session, url, directory, relative, known.get(key), force)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for done, future in enumerate([pool.submit(run, key) for key in jobs], start=1):
+            try:
+                key, entry = future.result()
+            except Exception as e:
+                failed += 1
+                log.warning(f"[asset_pack] {label}: {e}")
+                continue
+            if entry:
+                section[key] = entry
+            if done % 100 == 0:
+                print(f"  {label}: {done}/{len(jobs)}")
+
+    print(f"  {label}: {len(section)} files, {len(jobs) - len(section) - failed} not available, {failed} failed")
+    return section
+
+
+def sync(directory: str = ASSET_PACK_DIR, workers: int = 8, artwork: bool = True, items: bool = True, force: bool = False) -> None:
+    import requests
+
+    start = time.perf_counter()
+    session = requests.Session()
+
+    try:
+        with open(os.path.join(directory, "manifest.json"), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {"pokemon": {}, "items": {}}
+
+    print("Building name index...")
+    index = build_index(session)
+
+    if artwork:
+        print("Downloading artwork...")
+        jobs = {str(dex_id): (ARTWORK_URL.format(id=dex_id), f"pokemon/{dex_id}.png") for dex_id in sorted(set(index.values()))}
+        manifest["pokemon"] = _download_all(session, jobs, directory, manifest["pokemon"], workers, force, "artwork")
+
+    if items:
+        print("Downloading item icons...")
+        jobs = {entry["name"]: (ITEM_ICON_URL.format(name=entry["name"]), f"items/{entry['name']}.png") for entry in _list(session, "item")}
+        manifest["items"] = _download_all(session, jobs, directory, manifest["items"], workers, force, "items")
+
+    manifest["version"] = 1
+    manifest["built_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    _write_atomic(os.path.join(directory, "index.json"), json.dumps(index, sort_keys=True).encode())
+    _write_atomic(os.path.join(directory, "manifest.json"), json.dumps(manifest, indent=1, sort_keys=True).encode())
+
+    size = sum(entry["size"] for section in ("pokemon", "items") for entry in manifest[section].values())
+    print(f"Asset pack in {directory}: {len(index)} names, {len(manifest['pokemon'])} artworks, "
+          f"{len(manifest['items'])} item icons, {size / 1024 / 1024:.1f} MB, {time.perf_counter() - start:.0f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    sync_parser = subcommands.add_parser("sync", help="download or refresh the pack")
+    sync_parser.add_argument("--dir", default=ASSET_PACK_DIR)
+    sync_parser.add_argument("--workers", type=int, default=8)
+    sync_parser.add_argument("--skip-artwork", action="store_true")
+    sync_parser.add_argument("--skip-items", action="store_true")
+    sync_parser.add_argument("--force", action="store_true", help="download files already in the pack again")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    sync(args.dir, args.workers, not args.skip_artwork, not args.skip_items, args.force)
+
+
+if __name__ == "__main__":
+    main()
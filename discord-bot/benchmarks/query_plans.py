@@ -0,0 +1,211 @@
+"""Query-plan regression check for the bot's hot queries.
+
+Seeds realistic volumes (tournaments with brackets, a few thousand users and
+Pokémon, loan history, outbox rows) into the real tables, runs each hot query
+through EXPLAIN and fails if the plan doesn't use the index it was built for.
+Queries that live in helpers are executed through the helper itself and
+captured; the rest mirror the statement in the cog they come from. All of it
+runs in one transaction that is rolled back.
+
+    poetry run python -m benchmarks.query_plans [--verbose]
+"""
+import argparse
+import json
+import sys
+
+import sqlalchemy as sa
+
+from sqlalchemy import event, select, text
+from sqlalchemy.orm import Session
+from database.database import engine
+from database.models import Loan, Pokemon, Tournament, TournamentMatches
+from helpers.bracket_sync import participant_map
+from helpers.challonge_outbox import ChallongeOutboxWorker
+from helpers.match_context import load_match_context, load_tournament_participant
+from helpers.round_setup import load_round_pairings
+from helpers.tournament_state import TournamentState
+
+BENCH_SLUG = "bench_t_1"
+
+SEED = [
+    "UPDATE tournaments SET current_tournament = false",
+    """
+    INSERT INTO users (discord_id, username)
+    SELECT 900000000000000000 + i, 'bench_u_' || i FROM generate_series(1, 5000) AS i
+    """,
+    """
+    INSERT INTO tournaments (challonge_id, name, slug, url, ongoing, current_tournament)
+    SELECT 900000 + i, 'Bench ' || i, 'bench_t_' || i, 'https://challonge.com/bench_t_' || i, i = 1, i = 1
+    FROM generate_series(1, 200) AS i
+    """,
+    """
+    INSERT INTO tournament_participants (tournament_id, user_id, challonge_id)
+    SELECT t.id, u.id, t.challonge_id * 1000 + u.rn
+    FROM (SELECT id, challonge_id FROM tournaments WHERE slug LIKE 'bench_t_%') AS t
+    JOIN (SELECT id, row_number() OVER (ORDER BY id) AS rn FROM users WHERE username LIKE 'bench_u_%') AS u
+      ON u.rn BETWEEN 1 + (t.challonge_id % 70) * 64 AND 64 + (t.challonge_id % 70) * 64
+    """,
+    """
+    INSERT INTO tournament_matches (tournament_id, challonge_id, round, completed)
+    SELECT t.id, t.challonge_id * 1000 + m,
+           CASE WHEN m <= 32 THEN 1 WHEN m <= 48 THEN 2 WHEN m <= 56 THEN 3
+                WHEN m <= 60 THEN 4 WHEN m <= 62 THEN 5 ELSE 6 END,
+           NOT (t.slug = 'bench_t_1' AND m > 48)
+    FROM tournaments AS t, generate_series(1, 63) AS m
+    WHERE t.slug LIKE 'bench_t_%'
+    """,
+    """
+    INSERT INTO pokemon (name, ability, nature, tier, always_stored, in_storage)
+    SELECT 'bench_p_' || i, 'Ability', 'Jolly', CASE WHEN i % 2 = 0 THEN 'ou' ELSE 'uu' END,
+           i % 500 = 0, i % 200 = 0
+    FROM generate_series(1, 5000) AS i
+    """,
+    """
+    INSERT INTO loans (pokemon_id, user_id, returned_at)
+    SELECT p.id, u.id, CASE WHEN p.rn % 100 = 0 THEN NULL ELSE now() END
+    FROM (SELECT id, row_number() OVER (ORDER BY id) AS rn FROM pokemon WHERE name LIKE 'bench_p_%') AS p
+    JOIN (SELECT id, row_number() OVER (ORDER BY id) AS rn FROM users WHERE username LIKE 'bench_u_%') AS u
+      ON u.rn = 1 + p.rn % 5000, generate_series(1, 4)
+    """,
+    """
+    INSERT INTO challonge_outbox (tournament_id, challonge_match_id, scores_csv, status)
+    SELECT t.id, t.challonge_id * 1000 + m, '1-0', CASE WHEN t.slug = 'bench_t_1' AND m > 60 THEN 'pending' ELSE 'sent' END
+    FROM tournaments AS t, generate_series(1, 63) AS m
+    WHERE t.slug LIKE 'bench_t_%'
+    """,
+]
+
+ANALYZE = ["users", "tournaments", "tournament_participants", "tournament_matches", "pokemon", "loans", "challonge_outbox"]
+
+
+def bench_ids(session) -> tuple[int, int, int, int]:
+    tournament_id = session.scalar(select(Tournament.id).where(Tournament.slug == BENCH_SLUG))
+    match_chid = session.scalar(
+        select(TournamentMatches.challonge_id).where(TournamentMatches.tournament_id == tournament_id).limit(1))
+    discord_id = session.scalar(text(
+        "SELECT u.discord_id FROM users u JOIN tournament_participants tp ON tp.user_id = u.id "
+        "WHERE tp.tournament_id = :t LIMIT 1"), {"t": tournament_id})
+    pokemon_id = session.scalar(text("SELECT id FROM pokemon WHERE name = 'bench_p_100'"))
+    return tournament_id, match_chid, discord_id, pokemon_id
+
+
+def checks(session, conn):
+    tournament_id, match_chid, discord_id, pokemon_id = bench_ids(session)
+
+    def scalars(stmt):
+        return lambda: session.execute(stmt).all()
+
+    return [
+        # helpers
+        ("TournamentState.load", {"ix_tm_t_round_completed", "uq_tm_t_chid"},
+         lambda: TournamentState._query(Session(bind=conn))),
+        ("load_round_pairings", {"ix_tm_t_round_completed"},
+         lambda: load_round_pairings(session, tournament_id, [3])),
+        ("participant_map", {"uq_tp_tournament_chid"},
+         lambda: participant_map(session, tournament_id)),
+        ("load_tournament_participant", {"uq_tp_tournament_user"},
+         lambda: load_tournament_participant(session, BENCH_SLUG, discord_id)),
+        ("load_match_context", {"uq_tm_t_chid"},
+         lambda: load_match_context(session, tournament_id, match_chid)),
+        ("ChallongeOutboxWorker._load_batch", {"ix_challonge_outbox_pending"},
+         lambda: ChallongeOutboxWorker(None)._load_batch(session)),
+        # cogs/tournament.py: __check_uncompleted_matches
+        ("uncompleted matches in round", {"ix_tm_t_round_completed"}, scalars(
+            select(TournamentMatches).where(
+                TournamentMatches.tournament_id == tournament_id,
+                TournamentMatches.completed.is_(False),
+                TournamentMatches.round == 3))),
+        # cogs/tournament.py: check_all_played
+        ("unplayed matches", {"ix_tm_t_round_completed", "uq_tm_t_chid"}, scalars(
+            select(TournamentMatches).where(
+                TournamentMatches.tournament_id == tournament_id,
+                TournamentMatches.completed.is_(False)))),
+        # cogs/pokemon.py: fill_storage count
+        ("storage count by tier", {"ix_pokemon_storage_tier"}, scalars(
+            select(sa.func.count()).select_from(Pokemon).where(
+                Pokemon.in_storage.is_(True), Pokemon.always_stored.is_(True), Pokemon.tier == "ou"))),
+        # cogs/pokemon.py: clear_storage
+        ("clearable storage", {"ix_pokemon_storage_tier"}, scalars(
+            select(Pokemon).where(Pokemon.in_storage.is_(True), Pokemon.always_stored.is_(False)))),
+        # cogs/pokemon.py: list_storage
+        ("list storage", {"ix_pokemon_storage_tier"}, scalars(
+            select(Pokemon).where(Pokemon.in_storage.is_(True)))),
+        # open loan of a Pokémon
+        ("open loan", {"ix_loans_open_pokemon"}, scalars(
+            select(Loan).where(Loan.pokemon_id == pokemon_id, Loan.returned_at.is_(None)))),
+    ]
+
+
+def capture(conn, fn) -> list[tuple[str, object]]:
+    statements = []
+
+    def listener(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(conn, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(conn, "before_cursor_execute", listener)
+    return statements
+
+
+def index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if plan.get("Index Name") else set()
+    for child in plan.get("Plans", []):
+        names |= index_names(child)
+    return names
+
+
+def explain(conn, statement: str, parameters) -> dict:
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        raw = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+    return (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+
+
+def run(verbose: bool) -> int:
+    failures = 0
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            for sql in SEED:
+                conn.execute(text(sql))
+            for table in ANALYZE:
+                conn.execute(text(f"ANALYZE {table}"))
+
+            session = Session(bind=conn)
+            for name, expected, fn in checks(session, conn):
+                statements = capture(conn, fn)
+                if not statements:
+                    print(f"SKIP  {name}: no SELECT captured")
+                    continue
+
+                statement, parameters = statements[-1]
+                plan = explain(conn, statement, parameters)
+                used = index_names(plan)
+                ok = bool(used & expected)
+                failures += not ok
+                print(f"{'PASS' if ok else 'FAIL'}  {name:<30} expected {sorted(expected)}, used {sorted(used) or 'no index'}")
+                if verbose or not ok:
+                    print(json.dumps(plan, indent=2))
+        finally:
+            transaction.rollback()
+
+    print(f"\n{failures} failing quer{'y' if failures == 1 else 'ies'}")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--verbose", action="store_true", help="print every plan, not only failing ones")
+    args = parser.parse_args()
+    sys.exit(run(args.verbose))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""Before/after EXPLAIN benchmark for trigram name search.
+
+Seeds temporary copies of `pokemon.name` and `users.username` (100k rows by
+default), then runs the old leading-wildcard ILIKE and the new similarity
+search without and with a gin_trgm_ops index. Everything happens in one
+transaction that is rolled back, so the real tables are never touched.
+
+    poetry run python -m benchmarks.trgm_search [--rows 100000] [--verbose]
+"""
+import argparse
+import json
+
+from sqlalchemy import text
+from database.database import engine
+
+SPECIES = [
+    "Garchomp", "Dragonite", "Tyranitar", "Metagross", "Salamence",
+    "Gengar", "Scizor", "Rotom-Wash", "Ferrothorn", "Landorus-Therian",
+]
+
+TABLES = {
+    # bench table: (column, seed expression over generate_series i)
+    "bench_pokemon": (
+        "name",
+        "(:species)[1 + i % :n_species] || '-' || substr(md5(i::text), 1, 6)",
+    ),
+    "bench_users": (
+        "username",
+        "initcap(substr(md5(i::text), 1, 4 + i % 8)) || (i % 1000)::text",
+    ),
+}
+
+SEARCHES = {
+    "bench_pokemon": "garchmp",
+    "bench_users": "abc1",
+}
+
+QUERIES = {
+    "ilike (old)": (
+        "SELECT id, {column} FROM {table} "
+        "WHERE {column} ILIKE :pattern LIMIT 25"
+    ),
+    "similarity (new)": (
+        "SELECT id, {column}, similarity({column}, :term) AS score FROM {table} "
+        "WHERE ({column} % :term OR {column} ILIKE :pattern) "
+        "ORDER BY score DESC, {column} LIMIT 25"
+    ),
+}
+
+
+def node_types(plan: dict) -> list[str]:
+    name = plan["Node Type"]
+    if plan.get("Index Name"):
+        name += f" ({plan['Index Name']})"
+    types = [name]
+    for child in plan.get("Plans", []):
+        types.extend(node_types(child))
+    return types
+
+
+def explain(conn, sql: str, params: dict) -> tuple[float, list[str], str]:
+    raw = conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}"), params).scalar()
+    result = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    return result["Execution Time"], node_types(result["Plan"]), json.dumps(result["Plan"], indent=2)
+
+
+def seed(conn, rows: int) -> None:
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for table, (column, expression) in TABLES.items():
+        conn.execute(text(
+            f"CREATE TEMP TABLE {table} (id serial PRIMARY KEY, {column} varchar(64) NOT NULL) ON COMMIT DROP"))
+        conn.execute(
+            text(f"INSERT INTO {table} ({column}) SELECT {expression} FROM generate_series(1, :rows) AS i"),
+            {"rows": rows, "species": SPECIES, "n_species": len(SPECIES)}
+        )
+        conn.execute(text(f"ANALYZE {table}"))
+
+
+def run(rows: int, verbose: bool) -> None:
+    with engine.connect() as conn:
+        transaction = conn.begin()
+        try:
+            print(f"Seeding {rows:,} rows per table...")
+            seed(conn, rows)
+
+            for phase in ("before", "after"):
+                if phase == "after":
+                    for table, (column, _) in TABLES.items():
+                        conn.execute(text(
+                            f"CREATE INDEX ix_{table}_{column}_trgm ON {table} USING gin ({column} gin_trgm_ops)"))
+                        conn.execute(text(f"ANALYZE {table}"))
+
+                print(f"\n=== {phase} GIN trigram index ===")
+                for table, (column, _) in TABLES.items():
+                    term = SEARCHES[table]
+                    params = {"term": term, "pattern": f"%{term}%"}
+                    for label, template in QUERIES.items():
+                        sql = template.format(table=table, column=column)
+                        elapsed, nodes, plan = explain(conn, sql, params)
+                        print(f"{table:<14} {label:<17} {elapsed:>9.2f} ms  {' > '.join(nodes)}")
+                        if verbose:
+                            print(plan)
+        finally:
+            transaction.rollback()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--verbose", action="store_true", help="print the full JSON plans")
+    args = parser.parse_args()
+    run(args.rows, args.verbose)
+
+
+if __name__ == "__main__":
+    main()
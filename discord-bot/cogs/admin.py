@@ -2,11 +2,14 @@ import discord
 from discord.ext import commands
 from discord import app_commands
 from database.models import User
-from database.database import Session
+from database.database import Session, pool_stats
+from database.pool import pool_options
 
 from sqlalchemy import select    
 from datetime import datetime
-from helpers import EmbedFactory
+from helpers import EmbedFactory, search_users, db_executor
+from render_cache import render_cache
+from render_worker import render_worker
 
 class Admin(commands.Cog):
     def __init__(self, bot):
@@ -188,6 +191,100 @@ class Admin(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
+    @app_commands.command(name="find_user", description="Find users in the database by (part of) their IGN")
+    @app_commands.default_permissions(administrator=True)
+    async def find_user(self, interaction: discord.Interaction, ign: str):
+        with Session() as session:
+            results = search_users(session, ign, limit=10)
+
+        if not results:
+            await interaction.response.send_message(
+                embed=self.embed.warning(f"No users found matching `{ign}`."), ephemeral=True
+            )
+            return
+
+        lines = [
+            f"**{user.username}** — <@{user.discord_id}> "
+            f"({'active' if user.is_active else 'inactive'}, {score:.0%} match)"
+            for user, score in results
+        ]
+        embed = discord.Embed(
+            title=f"User Search — {ign}",
+            description="\n".join(lines),
+            color=discord.Color.blurple()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="db_pool", description="Show database connection pool statistics")
+    @app_commands.default_permissions(administrator=True)
+    async def db_pool(self, interaction: discord.Interaction):
+        embed = discord.Embed(title="Database Pool", color=discord.Color.blurple())
+        for stats in pool_stats.values():
+            snap = stats.snapshot()
+            histogram = "\n".join(f"`{label:>10}` {count:,}" for label, count in snap["histogram"])
+            embed.add_field(
+                name=f"{snap['name'].title()} engine",
+                value=(
+                    f"Checked out: **{snap['checked_out']}** / size {snap['size']}\n"
+                    f"Idle: **{snap['idle']}** · Overflow: **{snap['overflow']}**\n"
+                    f"Checkouts: {snap['checkouts']:,} · Timeouts: {snap['timeouts']:,}\n"
+                    f"Wait avg {snap['avg_wait_ms']:.2f} ms · max {snap['max_wait_ms']:.2f} ms\n"
+                    f"{histogram}"
+                ),
+                inline=True
+            )
+
+        offload = db_executor.snapshot()
+        slowest = sorted(offload["units"].items(), key=lambda item: item[1]["max_ms"], reverse=True)[:5]
+        units = "\n".join(
+            f"`{name.rsplit('.', 1)[-1]}` {unit['calls']:,}× avg {unit['avg_ms']:.1f} ms · max {unit['max_ms']:.1f} ms · queued {unit['avg_wait_ms']:.1f} ms"
+            for name, unit in slowest
+        )
+        embed.add_field(
+            name="Offload executor",
+            value=(
+                f"Running: **{offload['running']}** / {offload['workers']} ({offload['utilization']:.0%}) · Queued: **{offload['queued']}**\n"
+                f"Peak in flight: {offload['peak_in_flight']} · Saturated submits: {offload['saturated']:,}\n"
+                f"{units or 'No units run yet'}"
+            ),
+            inline=False
+        )
+
+        options = pool_options()
+        embed.set_footer(text=(
+            f"pool_size={options['pool_size']} max_overflow={options['max_overflow']} "
+            f"timeout={options['pool_timeout']:g}s recycle={options['pool_recycle']}s "
+            f"pre_ping={options['pool_pre_ping']} lifo={options['pool_use_lifo']}"
+        ))
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @app_commands.command(name="render_stats", description="Show /pp render worker and cache statistics")
+    @app_commands.default_permissions(administrator=True)
+    async def render_stats(self, interaction: discord.Interaction):
+        worker = render_worker.snapshot()
+        cache = render_cache.snapshot()
+        embed = discord.Embed(title="Team Image Rendering", color=discord.Color.blurple())
+        embed.add_field(
+            name="Render workers",
+            value=(
+                f"Running: **{worker['running']}** / {worker['workers']} · Queued: **{worker['queued']}** / {worker['queue_size']}\n"
+                f"Peak in flight: {worker['peak_in_flight']} · Rejected: {worker['rejected']:,}\n"
+                f"Completed: {worker['completed']:,} ({worker['degraded']:,} with placeholders) · Errors: {worker['errors']:,} · Timeouts: {worker['timeouts']:,} · Restarts: {worker['restarts']}\n"
+                f"Render avg {worker['avg_render_ms']:.0f} ms · max {worker['max_render_ms']:.0f} ms · queued avg {worker['avg_wait_ms']:.0f} ms"
+            ),
+            inline=False
+        )
+        disk_mb = (cache["disk_bytes"] or 0) / 1024 / 1024
+        embed.add_field(
+            name="Render cache",
+            value=(
+                f"Renders: {cache['renders']:,} · Disk hits: {cache['disk_hits']:,} · Reused attachments: {cache['attachment_hits']:,}\n"
+                f"Known pastes: {cache['pastes']:,} ({cache['paste_hits']:,} hits) · {disk_mb:.1f} MB on disk · Evictions: {cache['evictions']:,}"
+            ),
+            inline=False
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @app_commands.command(name="say_hello_world")
     async def say_hello_world(self, interaction: discord.Interaction):
         await interaction.response.send_message(
@@ -5,6 +5,14 @@ import datetime
 import io
 from generate_team_image import fetch_pokemon_sprite
 
+
+def thumbnail_sprite(pokemon_name):
+    # Just a thumbnail: send the embed without it if the download fails
+    try:
+        return fetch_pokemon_sprite(pokemon_name)
+    except Exception:
+        return None
+
 class LadderChest(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -55,7 +63,7 @@ class LadderChest(commands.Cog):
         embed.set_footer(text=f"Current month: {month_name}")
         embed.add_field(name="🗓️ Full Rotation", value="\n".join(summary_lines), inline=False)
 
-        sprite = fetch_pokemon_sprite(current_pokemon)
+        sprite = thumbnail_sprite(current_pokemon)
         if sprite:
             with io.BytesIO() as image_binary:
                 sprite.save(image_binary, format='PNG')
@@ -93,7 +101,7 @@ class LadderChest(commands.Cog):
         embed.set_footer(text=f"Current month: {month_name}")
         embed.add_field(name="🗓️ Full Rotation", value="\n".join(summary_lines), inline=False)
 
-        sprite = fetch_pokemon_sprite(current_pokemon)
+        sprite = thumbnail_sprite(current_pokemon)
         if sprite:
             with io.BytesIO() as image_binary:
                 sprite.save(image_binary, format='PNG')
@@ -2,8 +2,11 @@ import discord
 import os
 from discord import app_commands
 from discord.ext import commands
+import sqlalchemy as sa
+from sqlalchemy import select
 from database.models import Pokemon, User
 from database.database import Session
+from helpers import ChannelFactory, ChannelSpec, FuzzyNameIndex, search_pokemon
 
 
 CATEGORY_ID = int(os.environ.get("LENDING_CATEGORY", "123456789012345678"))  # Category for lending channels
@@ -25,10 +28,7 @@ class CreateChannelView(discord.ui.View):
             return await interaction.response.send_message("⚠ Category not found.", ephemeral=True)
 
         # Private to requester + staff
-        overwrites = {
-            guild.default_role: discord.PermissionOverwrite(view_channel=False),
-            interaction.user:   discord.PermissionOverwrite(view_channel=True, send_messages=True),
-        }
+        overwrites = {}
         staff_role = guild.get_role(STAFF_ROLE_ID)
         if staff_role:
             overwrites[staff_role] = discord.PermissionOverwrite(view_channel=True, send_messages=True)
@@ -36,33 +36,39 @@ class CreateChannelView(discord.ui.View):
         # Simple, safe-ish name
         name = f"lending-{interaction.user.name}".lower().replace(" ", "-")
 
-        new_channel = await guild.create_text_channel(
-            name=name,
-            category=category,
+        spec = ChannelSpec(
+            name,
+            [interaction.user],
+            CATEGORY_ID,
+            welcome=f"{interaction.user.mention} Welcome! A staff member will assist you shortly.",
+            topic=f"user:{interaction.user.id}",
             overwrites=overwrites,
-            topic=f"user:{interaction.user.id}"
+            private=True,
+            inherit_category=False
         )
+        [result] = await ChannelFactory(interaction.client).create_channels(guild, [spec])
+        if not result.ok:
+            return await interaction.response.send_message("⚠ Could not create the channel. Please contact staff.", ephemeral=True)
 
-        await interaction.response.send_message(f"✅ Created {new_channel.mention}", ephemeral=True)
-        await new_channel.send(f"{interaction.user.mention} Welcome! A staff member will assist you shortly.")
+        await interaction.response.send_message(f"✅ Created {result.channel.mention}", ephemeral=True)
 
 
 class Lending(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
+    @property
+    def name_index(self) -> FuzzyNameIndex | None:
+        crew_pokemon = self.bot.get_cog("CrewPokemon")
+        return getattr(crew_pokemon, "name_index", None)
+
     async def autocomplete_pokemon_name(self, interaction: discord.Interaction, current: str):
-        session = Session()
-        with session:
-            results = (
-                session.query(Pokemon)
-                .filter(Pokemon.name.ilike(f"%{current}%"))
-                .limit(25)
-                .all()
-            )
+        name_index = self.name_index
+        if not name_index:
+            return []
         return [
-            app_commands.Choice(name=p.name, value=p.name)
-            for p in results
+            app_commands.Choice(name=name, value=name)
+            for name in name_index.search(current)
         ]
     
     @app_commands.command(name="lending_info", description="Post a public lending info embed (no buttons).")
@@ -110,20 +116,30 @@ class Lending(commands.Cog):
         
         session = Session()
         with session:
-            is_available = (session.query(Pokemon)
-                            .filter(Pokemon.name.ilike(name))
-                            .filter(Pokemon.loaned == False)
-                            .first() is not None)
-            
-            if not is_available:
-                return await interaction.response.send_message(
-                    f"⚠ Pokémon `{name}` is not available for lending.",
-                    ephemeral=True
-                )
+            # Only the exact Pokémon (any casing) can be requested
+            requested = session.scalars(
+                select(Pokemon).where(sa.func.lower(Pokemon.name) == name.strip().lower())
+            ).all()
+            available = [pokemon for pokemon in requested if not pokemon.loaned]
+
+            if not available:
+                if requested:
+                    message = f"⚠ Pokémon `{requested[0].name}` is already loaned out."
+                else:
+                    message = f"⚠ Pokémon `{name}` was not found."
+                # Fuzzy matches are only suggestions, never requested on the user's behalf
+                suggestions = [
+                    pokemon.name for pokemon in search_pokemon(session, name, Pokemon.loaned == False, limit=5)
+                ]
+                if suggestions:
+                    message += "\nAvailable with a similar name: " + ", ".join(f"`{s}`" for s in suggestions)
+                return await interaction.response.send_message(message, ephemeral=True)
+
+            pokemon_name = available[0].name
         
         embed = discord.Embed(
             title="Request Lending",
-            description="Click the button below to create your private lending channel.",
+            description=f"**{pokemon_name}** is available.\nClick the button below to create your private lending channel.",
             color=discord.Color.green()
         )
         await interaction.response.send_message(embed=embed, view=CreateChannelView(), ephemeral=True)
@@ -4,8 +4,10 @@ import logging
 
 from discord.ext import commands
 from discord import app_commands, Embed
-from database.database import Session
-from helpers import get_timezones, discord_id_to_member, CommandLogger, EmbedFactory
+from sqlalchemy.orm import selectinload
+from database.database import AsyncSession
+from database.models import User
+from helpers import get_timezones, discord_id_to_member_async, CommandLogger, EmbedFactory
 from zoneinfo import ZoneInfo
 from datetime import datetime, timezone
 
@@ -56,8 +58,8 @@ class WinsUpdateView(discord.ui.View):
         if not isinstance(discord_member, discord.Member):
             return
         
-        with Session() as session:
-            crew_member = discord_id_to_member(session, discord_member.id)
+        async with AsyncSession() as session:
+            crew_member = await discord_id_to_member_async(session, discord_member.id)
             if not crew_member:
                 await interaction.response.send_message(
                     "❌ You are not registered in the database. Please contact staff.",
@@ -105,8 +107,8 @@ class Member(commands.Cog):
         )
 
     async def show_activity_status(self, member: discord.Member):
-        with Session() as session:
-            crew_member = discord_id_to_member(session, member.id)
+        async with AsyncSession() as session:
+            crew_member = await discord_id_to_member_async(session, member.id)
             if not crew_member:
                 # Not registered in DB
                 embed = Embed(
@@ -183,8 +185,8 @@ class Member(commands.Cog):
         if not interaction.guild:
             return
 
-        with Session.begin() as session:
-            crew_member = discord_id_to_member(session, discord_id)
+        async with AsyncSession.begin() as session:
+            crew_member = await discord_id_to_member_async(session, discord_id)
 
             if not crew_member:
                 feedback = f"You are not registered in the database. Please contact staff"
@@ -209,9 +211,9 @@ class Member(commands.Cog):
         if not user:
             return []
 
-        with Session() as session:
+        async with AsyncSession() as session:
 
-            crew_member = discord_id_to_member(session, user.id)
+            crew_member = await discord_id_to_member_async(session, user.id)
             if not crew_member:
                 return []
 
@@ -244,8 +246,8 @@ class Member(commands.Cog):
             )
             return
 
-        with Session.begin() as session:
-            crew_member = discord_id_to_member(session, interaction.user.id)
+        async with AsyncSession.begin() as session:
+            crew_member = await discord_id_to_member_async(session, interaction.user.id)
             if not crew_member:
                 await interaction.response.send_message(f"You are not registered in our database. Please contact management", ephemeral=True)
                 return
@@ -280,8 +282,8 @@ class Member(commands.Cog):
         await self.update_total_wins(interaction, wins)
 
     async def show_trainer_card(self, interaction: discord.Interaction, user: discord.Member, hidden: bool = False) -> discord.Embed | None:
-        with Session() as session:
-            row = discord_id_to_member(session, user.id)
+        async with AsyncSession() as session:
+            row = await discord_id_to_member_async(session, user.id, selectinload(User.won_tournaments))
             if not row:
                 await interaction.response.send_message(f"No record found for {user.mention}.", ephemeral=True)
                 return
@@ -336,10 +338,10 @@ class Member(commands.Cog):
 
     @app_commands.command(name="show_won_tournaments", description="List all the crew tournaments that a crew member has won")
     async def show_won_tournaments(self, interaction: discord.Interaction, trainer: discord.Member):
-        with Session() as session:
+        async with AsyncSession() as session:
             discord_user = interaction.user
-            crew_member = discord_id_to_member(session, discord_user.id)
-            crew_trainer = discord_id_to_member(session, trainer.id)
+            crew_member = await discord_id_to_member_async(session, discord_user.id)
+            crew_trainer = await discord_id_to_member_async(session, trainer.id, selectinload(User.won_tournaments))
 
             if not crew_member:
                 await interaction.response.send_message("❌ You have to be a crew member to use this command.", ephemeral=True)
@@ -396,8 +398,8 @@ class Member(commands.Cog):
             )
             return
 
-        with Session.begin() as session:
-            crew_member = discord_id_to_member(session, member.id)
+        async with AsyncSession.begin() as session:
+            crew_member = await discord_id_to_member_async(session, member.id)
             if not crew_member:
                 await interaction.followup.send(f"Crew member is not registered in our database.")
                 return
@@ -4,6 +4,7 @@ from discord import app_commands
 from discord.ext import commands
 from database.models import Pokemon
 from database.database import Session
+from helpers import FuzzyNameIndex, offload
 
 
 class CrewPokemon(commands.Cog):
@@ -11,6 +12,12 @@ class CrewPokemon(commands.Cog):
         self.bot = bot
         self.always_sync_count = 9
         self.always_bosses_count = 6
+        # Shared with the Lending cog for autocomplete
+        self.name_index = FuzzyNameIndex()
+
+    async def cog_load(self):
+        with Session() as session:
+            self.name_index.load(session.execute(sa.select(Pokemon.id, Pokemon.name)).all())
 
     @app_commands.command(name="register_pokemon", description="Register a Pokémon in the database")
     @app_commands.default_permissions(administrator=True)
@@ -39,20 +46,13 @@ class CrewPokemon(commands.Cog):
             )
             session.add(new_pokemon)
             session.commit()
+            self.name_index.add(new_pokemon.id, new_pokemon.name)
             await interaction.response.send_message(f"Pokémon {name} registered successfully.", ephemeral=True)
 
     async def autocomplete_pokemon_name(self, interaction: discord.Interaction, current: str):
-        session = Session()
-        with session:
-            results = (
-                session.query(Pokemon)
-                .filter(Pokemon.name.ilike(f"%{current}%"))
-                .limit(25)
-                .all()
-            )
         return [
-            app_commands.Choice(name=p.name, value=p.name)
-            for p in results
+            app_commands.Choice(name=name, value=name)
+            for name in self.name_index.search(current)
         ]
 
     @app_commands.command(name="remove_pokemon", description="Remove a Pokémon from the database")
@@ -67,8 +67,10 @@ class CrewPokemon(commands.Cog):
                 await interaction.response.send_message(f"Pokémon {name} does not exist in the database.", ephemeral=True)
                 return
 
+            pokemon_id = existing_pokemon.id
             session.delete(existing_pokemon)
             session.commit()
+            self.name_index.remove(pokemon_id)
             await interaction.response.send_message(f"Pokémon {name} removed successfully.", ephemeral=True)
 
     @app_commands.command(name="edit_pokemon", description="Edit a Pokémon's details in the database")
@@ -101,6 +103,8 @@ class CrewPokemon(commands.Cog):
             else:
                 setattr(existing_pokemon, field.value, value)
             session.commit()
+            if field.value == "name":
+                self.name_index.add(existing_pokemon.id, existing_pokemon.name)
             await interaction.response.send_message(f"Pokémon {name} updated successfully: {field.name} set to {value}.", ephemeral=True)
 
     @remove_pokemon.autocomplete("name")
@@ -120,64 +124,71 @@ class CrewPokemon(commands.Cog):
         ]
     )
     async def fill_storage(self, interaction: discord.Interaction, count: int, tier: app_commands.Choice[str]):
-        
-        session = Session()
-        pvp_in_storage_count = (
-                session.query(Pokemon)
-                .filter_by(in_storage=True, always_stored=True, tier=tier.value)
-                .count()
-            )
+        capacity = 25 - self.always_sync_count - self.always_bosses_count
+        filled = await self._fill_storage(count, tier.value, capacity)
 
-        if count > (25 - pvp_in_storage_count - self.always_sync_count - self.always_bosses_count):
+        if filled is None:
             await interaction.response.send_message("Count is higher than storage amount.", ephemeral=True)
             return
-        
-        with session:
 
-            candidate_pokemon = (
-                session.query(Pokemon)
-                .filter(
-                    Pokemon.tier.ilike(tier.value),
-                    Pokemon.in_storage == False,
-                    Pokemon.loaned == False,
-                    Pokemon.always_stored == False,
-                )
-                .order_by(sa.func.random())
-                .limit(count)
-                .all()
-            )
+        if not filled:
+            await interaction.response.send_message(f"No Pokémon available in tier {tier.name} for storage.", ephemeral=True)
+            return
 
+        await interaction.response.send_message(
+            f"Filled storage with {filled} Pokémon of tier {tier.name}.",
+            ephemeral=True
+        )
 
-            if not candidate_pokemon:
-                await interaction.response.send_message(f"No Pokémon available in tier {tier.name} for storage.", ephemeral=True)
-                return
+    @staticmethod
+    @offload
+    def _fill_storage(session, count: int, tier: str, capacity: int) -> int | None:
+        """Move `count` random available Pokémon of `tier` into storage; None when they wouldn't fit."""
+        pvp_in_storage_count = (
+                session.query(Pokemon)
+                .filter_by(in_storage=True, always_stored=True, tier=tier)
+                .count()
+            )
 
-            for pokemon in candidate_pokemon:
-                pokemon.in_storage = True
+        if count > capacity - pvp_in_storage_count:
+            return None
 
-            await interaction.response.send_message(
-                f"Filled storage with {len(candidate_pokemon)} Pokémon of tier {tier.name}.",
-                ephemeral=True
+        candidate_pokemon = (
+            session.query(Pokemon)
+            .filter(
+                Pokemon.tier.ilike(tier),
+                Pokemon.in_storage == False,
+                Pokemon.loaned == False,
+                Pokemon.always_stored == False,
             )
+            .order_by(sa.func.random())
+            .limit(count)
+            .all()
+        )
 
-            session.commit()
+        for pokemon in candidate_pokemon:
+            pokemon.in_storage = True
+
+        return len(candidate_pokemon)
 
     @app_commands.command(name="clear_storage", description="Clear the Pokémon storage")
     @app_commands.default_permissions(administrator=True)
     async def clear_storage(self, interaction: discord.Interaction):
-        session = Session()
+        cleared = await self._clear_storage()
+        if not cleared:
+            await interaction.response.send_message("No Pokémon in storage to clear.", ephemeral=True)
+            return
 
-        with session:
-            stored_pokemon = session.query(Pokemon).filter_by(in_storage=True, always_stored=False).all()
-            if not stored_pokemon:
-                await interaction.response.send_message("No Pokémon in storage to clear.", ephemeral=True)
-                return
+        await interaction.response.send_message(f"Cleared {cleared} Pokémon from storage.", ephemeral=True)
 
-            for pokemon in stored_pokemon:
-                pokemon.in_storage = False
+    @staticmethod
+    @offload
+    def _clear_storage(session) -> int:
+        stored_pokemon = session.query(Pokemon).filter_by(in_storage=True, always_stored=False).all()
+        for pokemon in stored_pokemon:
+            pokemon.in_storage = False
 
-            session.commit()
-            await interaction.response.send_message(f"Cleared {len(stored_pokemon)} Pokémon from storage.", ephemeral=True)
+        return len(stored_pokemon)
 
 
     @app_commands.command(name="list_storage", description="List all Pokémon in storage")
@@ -205,6 +216,9 @@ class CrewPokemon(commands.Cog):
     async def search_pokemon(self, interaction: discord.Interaction, name: str):
         session = Session()
 
+        # Accept any casing or a small typo
+        name = self.name_index.resolve(name) or name
+
         with session:
             pokemon = session.query(Pokemon).filter_by(name=name).first()
             if not pokemon:
@@ -1,8 +1,11 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-import tempfile
-from generate_team_image import generate_team_image
+import asyncio
+import io
+from generate_team_image import fetch_team
+from render_cache import render_cache, team_key
+from render_worker import render_worker, RenderQueueFull
 
 class PokepasteCog(commands.Cog):
     def __init__(self, bot):
@@ -14,10 +17,37 @@ class PokepasteCog(commands.Cog):
         await interaction.response.defer()  # in case it takes time
 
         try:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-                generate_team_image(link, filename=tmp.name)
-                tmp.seek(0)
-                await interaction.followup.send(file=discord.File(tmp.name, filename="team.png"))
+            # Pastes are immutable, so a link seen before doesn't need downloading again
+            team = render_cache.team_for(link)
+            if team is None:
+                team = await asyncio.to_thread(fetch_team, link)
+                render_cache.remember_team(link, team)
+
+            key = team_key(team)
+            # Cache reads and writes touch the disk, so they stay off the event loop too
+            attachment_url, data = await asyncio.to_thread(render_cache.lookup, key)
+            if attachment_url:
+                # Popular team: point at the image Discord already hosts
+                embed = discord.Embed(color=discord.Color.blurple())
+                embed.set_image(url=attachment_url)
+                await interaction.followup.send(embed=embed)
+                return
+
+            complete = True
+            if data is None:
+                # Rendered in a worker process; the event loop stays free meanwhile
+                data, complete = await render_worker.render(team)
+                # Renders with placeholders aren't kept: the next /pp tries the assets again
+                if complete:
+                    await asyncio.to_thread(render_cache.store, key, data)
+
+            message = await interaction.followup.send(file=discord.File(io.BytesIO(data), filename="team.png"))
+            if complete and message.attachments:
+                render_cache.remember_attachment(key, message.attachments[0].url)
+        except RenderQueueFull:
+            await interaction.followup.send("⏳ Too many team images are being generated right now, try again in a moment.")
+        except asyncio.TimeoutError:
+            await interaction.followup.send("❌ Generating the image took too long, please try again.")
         except Exception as e:
             await interaction.followup.send(f"❌ Failed to generate image: {e}")
 
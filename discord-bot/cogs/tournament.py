@@ -1,22 +1,20 @@
-import challonge.api
+import asyncio
 import discord
 import os
-import challonge
-import requests
 import sqlalchemy as sa
 import validators
 import logging
 
 from datetime import datetime, timezone
 from discord import app_commands
-from discord.ext import commands
-from sqlalchemy import select, func
-from sqlalchemy.orm import aliased
+from discord.ext import commands, tasks
+from sqlalchemy import select
+from sqlalchemy.orm import aliased, joinedload
 from database.database import Session
 from database.models import Tournament, User, TournamentParticipants, TournamentMatches
-from helpers import country_to_timezone, discord_id_to_member, participant_id_to_member, log_command_error, create_new_round_message, create_winner_message, ChannelFactory, ChannelManager, ChannelDestroyer
+from helpers import advance_match, diff_bracket, apply_bracket_diff, import_bracket, BracketCache, BracketSnapshot, ChallongeClient, ChallongeError, ChallongeOutboxWorker, TournamentState, country_to_timezone, discord_id_to_member, participant_id_to_member, log_command_error, create_new_round_message, create_winner_message, ChannelFactory, ChannelManager, ChannelDestroyer, load_match_context, load_match_context_for_players, load_tournament_participant, load_round_pairings, RoundSetupJob, TournamentNameIndex, offload
 from zoneinfo import ZoneInfo
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 from random import choice
 
 
@@ -24,6 +22,10 @@ from random import choice
 USERNAME = os.getenv("CH_USERNAME")
 API_KEY = os.getenv("CH_API_KEY")
 GUILD_ID = os.getenv("GUILD_ID", 0)
+CH_TIMEOUT = float(os.getenv("CH_TIMEOUT", 10))
+CH_REQUESTS_PER_SECOND = float(os.getenv("CH_REQUESTS_PER_SECOND", 5))
+BRACKET_CACHE_TTL = float(os.getenv("BRACKET_CACHE_TTL", 120))
+CH_OUTBOX_POLL_SECONDS = float(os.getenv("CH_OUTBOX_POLL_SECONDS", 30))
 
 SIGNUPS_CH = int(os.getenv("SIGNUPS_CH_ID", 0))
 REPORTS_CH = int(os.getenv("REPORTS_CH_ID", 0))
@@ -38,48 +40,23 @@ MATCHES_CATEGORY = int(os.getenv("MATCHES_CAT_ID", 0))
 
 log = logging.getLogger(__name__)
 
+_challonge_client: ChallongeClient | None = None
 
-def auth_tournament():
+
+def auth_tournament() -> ChallongeClient:
+    global _challonge_client
     if not USERNAME or not API_KEY:
         raise RuntimeError(
             "Missing Challonge credentials (CH_USERNAME / CH_API_KEY).")
-    challonge.set_credentials(USERNAME, API_KEY)
-
-
-def fetch_current_tournament():
-    with Session.begin() as session:
-        stmt = select(Tournament).where(Tournament.current_tournament == True)
-        current_tournament = session.scalars(stmt).first()
-        return current_tournament.slug if current_tournament else None
+    if _challonge_client is None:
+        _challonge_client = ChallongeClient(
+            USERNAME, API_KEY, timeout=CH_TIMEOUT, requests_per_second=CH_REQUESTS_PER_SECOND)
+    return _challonge_client
 
 
-def fetch_current_round():
-    with Session.begin() as session:
-        stmt = select(TournamentMatches.round).join(
-            Tournament, Tournament.id == TournamentMatches.tournament_id).where(
-                TournamentMatches.completed == False,
-                Tournament.current_tournament == True,
-                TournamentMatches.round > 0
-        )
-
-        matches = session.scalars(stmt).all()
-        if not matches:
-            return None
-
-        lowest_round = min(matches)
-
-        return lowest_round
-
-
-def fetch_max_round():
-    with Session.begin() as session:
-        stmt = select(func.max(TournamentMatches.round)).join(
-            Tournament, Tournament.id == TournamentMatches.tournament_id
-        ).where(
-            Tournament.current_tournament.is_(True),
-            TournamentMatches.round > 0
-        )
-        return session.scalar(stmt)
+# Shared by every Tournaments instance (the cog and the sign-up views)
+tournament_state = TournamentState()
+tournament_index = TournamentNameIndex(Session)
 
 
 def slugify(string) -> str | None:
@@ -91,13 +68,51 @@ def slugify(string) -> str | None:
 class Tournaments(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        auth_tournament()
-        self.current_tournament = fetch_current_tournament()
-        self.current_round = fetch_current_round()
-        self.max_round = fetch_max_round()
+        self.challonge = auth_tournament()
+        self.bracket_cache = BracketCache(
+            self.challonge, ttl=BRACKET_CACHE_TTL, unsent_results=self._unsent_results)
+        self.outbox = ChallongeOutboxWorker(
+            self.challonge, on_failure=self.__report_outbox_failure)
+        self.state = tournament_state
+        self.tournament_index = tournament_index
         self.channel_factory = ChannelFactory(bot)
         self.channel_manager = ChannelManager(bot)
         self.channel_destroyer = ChannelDestroyer(bot)
+        self._round_setup_lock = asyncio.Lock()
+        self._round_jobs: set[asyncio.Task] = set()
+
+    @property
+    def current_tournament(self) -> str | None:
+        return self.state.current_tournament
+
+    @property
+    def current_round(self) -> int | None:
+        return self.state.current_round
+
+    @property
+    def max_round(self) -> int | None:
+        return self.state.max_round
+
+    async def cog_load(self):
+        self.challonge_outbox_loop.start()
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        # Commands read the shared state synchronously; make sure it's current first
+        await self.state.refresh()
+        return True
+
+    async def cog_unload(self):
+        self.challonge_outbox_loop.cancel()
+        for task in self._round_jobs:
+            task.cancel()
+        await self.challonge.close()
+
+    @tasks.loop(seconds=CH_OUTBOX_POLL_SECONDS)
+    async def challonge_outbox_loop(self):
+        try:
+            await self.outbox.drain()
+        except Exception:
+            log.exception("[challonge_outbox] Drain failed")
     
     # Static Methods ---------------------------------
     @staticmethod
@@ -248,9 +263,8 @@ class Tournaments(commands.Cog):
         stmt = select(Tournament).where(Tournament.slug == slug)
         return session.scalars(stmt).first()
 
-    @staticmethod
-    def __get_challonge_id(slug):
-        tournament = challonge.tournaments.show(slug)
+    async def __get_challonge_id(self, slug):
+        tournament = await self.challonge.tournaments.show(slug)
         if not isinstance(tournament, Dict):
             return None
 
@@ -269,65 +283,36 @@ class Tournaments(commands.Cog):
             TournamentParticipants.tournament_id == tournament_id)
         return session.scalars(stmt).first()
 
-    @staticmethod
-    def __get_match_row_for_players(session, tournament_id, p1_id, p2_id, only_unfinished=True):
-        conditions = [
-            TournamentMatches.tournament_id == tournament_id,
-            sa.or_(
-                sa.and_(
-                    TournamentMatches.participant1_id == p1_id,
-                    TournamentMatches.participant2_id == p2_id),
-
-                sa.and_(
-                    TournamentMatches.participant1_id == p2_id,
-                    TournamentMatches.participant2_id == p1_id),
-            )
-        ]
-
-        if only_unfinished:
-            conditions.append(TournamentMatches.completed == False)
-        
-        stmt = select(TournamentMatches).where(*conditions)
-
-        return session.scalars(stmt).first()
-
-    @staticmethod
-    def __get_match_row_by_chid(session, tournament_id: int, match_ch_id: int):
-        stmt = select(TournamentMatches).where(
-            TournamentMatches.tournament_id == tournament_id,
-            TournamentMatches.challonge_id == match_ch_id,
-        )
-        return session.scalars(stmt).first()
-
-    @staticmethod
-    def __find_next_match_player(slug, player_challonge_id) -> dict[str, Any] | None:
-        next_match = None
+    async def __lookup_bracket(self, slug, lookup: Callable[[BracketSnapshot], Any]):
+        """Run `lookup` on the cached bracket, reloading once if it finds nothing."""
         try:
-            player_matches = challonge.matches.index(
-                slug, participant_id=player_challonge_id)
-        except:
-            return next_match
+            cached = self.bracket_cache.peek(slug)
+            snapshot = await self.bracket_cache.get(slug)
+            if not snapshot:
+                return None
 
-        for match in player_matches:
-            if isinstance(match, Dict) and match["state"] != "complete":
-                return match
+            result = lookup(snapshot)
+            if result is None and snapshot is cached:
+                # A miss can mean the snapshot is stale (e.g. edited on the website).
+                snapshot = await self.bracket_cache.get(slug, refresh=True)
+                result = lookup(snapshot) if snapshot else None
+        except ChallongeError:
+            return None
 
-        return None
+        return result
 
     @staticmethod
-    def __find_current_match_player(slug, player_challonge_id):
-        next_match = None
-        try:
-            player_matches = challonge.matches.index(
-                slug, participant_id=player_challonge_id)
-        except:
-            return next_match
+    @offload
+    def _unsent_results(session, slug) -> list[dict]:
+        return ChallongeOutboxWorker.unsent_results(session, slug)
 
-        for match in player_matches:
-            if isinstance(match, dict) and match["state"] == "open":
-                return match
+    async def __find_next_match_player(self, slug, player_challonge_id) -> dict[str, Any] | None:
+        return await self.__lookup_bracket(
+            slug, lambda snapshot: snapshot.next_match(player_challonge_id))
 
-        return None
+    async def __find_current_match_player(self, slug, player_challonge_id):
+        return await self.__lookup_bracket(
+            slug, lambda snapshot: snapshot.current_match(player_challonge_id))
 
     @staticmethod
     def __p_challonge_id_to_participant(session, tournament_id, p_challonge_id):
@@ -337,22 +322,9 @@ class Tournaments(commands.Cog):
         )
         return session.scalars(stmt).first()
 
-    @staticmethod
-    def get_participant_on_rank(slug, rank):
-        try:
-            participants_ch = challonge.participants.index(slug)
-        except challonge.api.ChallongeException:
-            return None
-
-        for participant in participants_ch:
-            if not isinstance(participant, Dict):
-                return None
-
-            participant_rank = participant["final_rank"]
-            if participant_rank == rank:
-                return participant["id"]
-
-        return None
+    async def get_participant_on_rank(self, slug, rank):
+        return await self.__lookup_bracket(
+            slug, lambda snapshot: snapshot.participant_on_rank(rank))
 
     @commands.Cog.listener()
     async def on_app_command_error(self, interaction: discord.Interaction, error: app_commands.AppCommandError):
@@ -373,6 +345,7 @@ class Tournaments(commands.Cog):
 
     # HELPER FUNCTIONS
     async def unregister_tournament(self, interaction: discord.Interaction):
+        await self.state.refresh()
         member = interaction.user
         slug = slugify(self.current_tournament)
         if not slug:
@@ -392,6 +365,7 @@ class Tournaments(commands.Cog):
         )
 
     async def sign_up_tournament(self, interaction: discord.Interaction):
+        await self.state.refresh()
         if interaction.channel_id != int(SIGNUPS_CH):
             await interaction.response.send_message(
                 embed=self.build_simple_embed(
@@ -451,27 +425,14 @@ class Tournaments(commands.Cog):
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
-    async def get_match_for_discord_ids(self, session, tournament_id, discord_id1, discord_id2) -> TournamentMatches | None:
-        crew_member1 = discord_id_to_member(session, discord_id1)
-        crew_member2 = discord_id_to_member(session, discord_id2)
-        
-        if not crew_member1 or not crew_member2:
-            log.info(f"FUNCTION: get_match_for_discord\n1 or more Discord Users are not crew members.\nDiscord User 1: {crew_member1}\nDiscord User2: {crew_member2}")
+    async def get_match_for_discord_ids(self, session, slug, discord_id1, discord_id2) -> TournamentMatches | None:
+        context = load_match_context_for_players(
+            session, slug, discord_id1, discord_id2, only_unfinished=False)
+        if not context:
+            log.info(f"FUNCTION: get_match_for_discord\nNo match found in {slug} for Discord Users {discord_id1} and {discord_id2}")
             return None
 
-        participant1 = self.__check_if_participant(
-                session, tournament_id, crew_member1.id)
-        participant2 = self.__check_if_participant(
-            session, tournament_id, crew_member2.id)
-
-        if not participant1 or not participant2:
-            log.info(f"FUNCTION: get_match_for_discord\n1 or more Crew members are not Participants.\nCrew Member 1: {participant1}\nCrew Member2: {participant2}")
-            return None
-
-        current_match = self.__get_match_row_for_players(
-            session, tournament_id, participant1.id, participant2.id, only_unfinished=False)
-        
-        return current_match
+        return context.match
 
     async def show_winner_details(self, guild, winner, video_link):
         staff_announcement_channel = guild.get_channel(STAFF_ANNOUNCEMENT_CH)
@@ -487,17 +448,15 @@ class Tournaments(commands.Cog):
                 f"@everyone"
             )
 
-    async def update_discord_channels(self, current_round, guild: discord.Guild, winning_member, members: list):
-        if len(members) != 2:
-            log.info(f"FUNCTION: update_discord_channels\nERROR: The length of members is NOT 2.")
+    async def update_discord_channels(self, current_round, guild: discord.Guild, winning_participant, participants: list):
+        if len(participants) != 2:
+            log.info(f"FUNCTION: update_discord_channels\nERROR: The length of participants is NOT 2.")
             return
         
-        crew_member1 = members[0]
-        crew_member2 = members[1]
-        winning_crew_member = winning_member
+        participant1 = participants[0]
+        participant2 = participants[1]
         
         # Round Conditions
-        slug = self.current_tournament
         is_semi_final = (self.max_round - current_round == 1)
         is_final = (self.max_round == current_round)
         is_bronze_match = (current_round == 0)
@@ -507,18 +466,18 @@ class Tournaments(commands.Cog):
             pass
         elif is_bronze_match:
             log.info(f"This is a Bronze Match")
-            await self.channel_factory.tournament_rewards(guild, [crew_member1, crew_member2], REWARDS_CATEGORY, slug)
+            await self.channel_factory.tournament_rewards(guild, [participant1, participant2], REWARDS_CATEGORY, slug)
         elif is_final:
             log.info(f"This is a Finals Match")
-            await self.channel_factory.tournament_rewards(guild, [crew_member1, crew_member2], REWARDS_CATEGORY, slug)
+            await self.channel_factory.tournament_rewards(guild, [participant1, participant2], REWARDS_CATEGORY, slug)
         else:
             log.info(f"Not a Bronze Match")
-            losing_crew_member = crew_member1 if crew_member1 != winning_crew_member else crew_member2
-            await self.channel_factory.tournament_rewards(guild, [losing_crew_member], REWARDS_CATEGORY, slug)
+            losing_participant = participant1 if participant1 is not winning_participant else participant2
+            await self.channel_factory.tournament_rewards(guild, [losing_participant], REWARDS_CATEGORY, slug)
 
 
-    async def check_if_finished(self, session, current_match_row, guild: discord.Guild, winning_member, members: list):
-        await self.update_discord_channels(current_match_row.round, guild, winning_member, members)
+    async def check_if_finished(self, session, current_match_row, guild: discord.Guild, winning_participant, participants: list):
+        await self.update_discord_channels(current_match_row.round, guild, winning_participant, participants)
 
         uncompleted_matches = self.__check_uncompleted_matches(
             session, current_match_row.tournament_id, current_match_row.round)
@@ -528,9 +487,7 @@ class Tournaments(commands.Cog):
                 f"COMMAND: report_win\nThe current round is: {current_match_row.round}\nThe Max round is: {self.max_round}")
             # Semi Finals when bronze match needs to be created
             if self.max_round - current_match_row.round == 1:
-                await self.channel_destroyer.delete_channels(guild, MATCHES_CATEGORY)
-                await self._setup_bronze_match(session, current_match_row.tournament_id, guild)
-                await self._setup_next_round(session, current_match_row.tournament_id, current_match_row.round, guild)
+                await self._setup_next_round(session, current_match_row.tournament_id, current_match_row.round, guild, include_bronze=True, clear_matches=True)
 
             # Finals or Bronze match
             elif current_match_row.round == self.max_round or current_match_row.round == 0:
@@ -541,13 +498,12 @@ class Tournaments(commands.Cog):
 
                 # Finalize tournament
                 log.info(f"COMMAND: report_win\nAll Matches have been played. Setting up announcement")
-                await self.show_winner_details(guild, winning_member, current_match_row.battle_url)
+                await self.show_winner_details(guild, winning_participant.user_link, current_match_row.battle_url)
                 # await self.finalize_tournament(session, tournament_id, guild)
                 return True
 
             else:
-                await self.channel_destroyer.delete_channels(guild, MATCHES_CATEGORY)
-                await self._setup_next_round(session, current_match_row.tournament_id, current_match_row.round, guild)
+                await self._setup_next_round(session, current_match_row.tournament_id, current_match_row.round, guild, clear_matches=True)
                 return False
 
 
@@ -565,80 +521,70 @@ class Tournaments(commands.Cog):
         unplayed_matches = session.scalars(stmt).all()
         return len(unplayed_matches) == 0
 
-    async def _setup_bronze_match(self, session, tournament_id, guild: discord.Guild):
-        if not guild or not self.current_tournament:
-            return
-
-        stmt = (
-            select(TournamentMatches)
-            .where(
-                TournamentMatches.tournament_id == tournament_id,
-                TournamentMatches.round == 0
-            )
-        )
-        bronze_match = session.scalars(stmt).first()
-        if not bronze_match:
-            return
-
-        user1 = participant_id_to_member(
-            session, bronze_match.tournament_id, bronze_match.participant1_id)
-        user2 = participant_id_to_member(
-            session, bronze_match.tournament_id, bronze_match.participant2_id)
-        if not user1 or not user2:
-            log.info(f"FUNCTION: _setup_bronze_match\nDEBUG: user1: {user1}\nuser2: {user2}")
-            return
-
-        channel_name = await self.channel_factory.tournament_match(guild, [user1, user2], MATCHES_CATEGORY, bronze_match.round)
-        return channel_name
+    async def _setup_next_round(self, session, tournament_id, current_round, guild: discord.Guild, *, include_bronze=False, clear_matches=False, progress_channel=None) -> asyncio.Task | None:
+        """Start the background job that opens the next round's match channels.
 
-    async def _setup_next_round(self, session, tournament_id, current_round, guild: discord.Guild):
+        Player pairings are read here in one query, inside the caller's
+        transaction; the job itself only talks to Discord.
+        """
         if not guild or not self.current_tournament or not self.max_round:
             log.info("FUNCTION: _setup_next_round\nERROR: Didn't pass first check")
-            return
+            return None
         if not isinstance(current_round, int):
             log.info(
                 "FUNCTION: _setup_next_round\nError: current round is not an instance of type int")
-            return
+            return None
 
         next_round = current_round + 1
+        rounds = [0, next_round] if include_bronze else [next_round]
 
-        # Fetch matches for next_round
-        stmt = select(TournamentMatches).where(
-            TournamentMatches.tournament_id == tournament_id,
-            TournamentMatches.round == next_round
-        )
-        tournament_matches = session.scalars(stmt).all()
-
-        if not tournament_matches:
+        pairings = load_round_pairings(session, tournament_id, rounds)
+        if not any(pairing.round == next_round for pairing in pairings):
             log.info(
                 f"[next_round] No matches for round {next_round}; t_id={tournament_id}")
-            return
+            return None
 
-        # Update state
-        self.current_round = next_round
+        # An admin override of an earlier round no longer applies; callers
+        # invalidate the state once the transaction has committed
+        session.execute(
+            sa.update(Tournament)
+            .where(Tournament.id == tournament_id, Tournament.current_round_override < next_round)
+            .values(current_round_override=None)
+        )
         log.info(
-            f"FUNCTION: _setup_next_round\nself.current round is now: {self.current_round} ")
-
-        created = 0
-        for match in tournament_matches:
-            user1 = participant_id_to_member(
-                session, match.tournament_id, match.participant1_id)
-            user2 = participant_id_to_member(
-                session, match.tournament_id, match.participant2_id)
-            if not user1 or not user2:
-                log.info(
-                    f"[next_round] Skipping match {match.challonge_id}: p1={match.participant1_id}, p2={match.participant2_id}")
-                continue
-
-            channel_name = await self.channel_factory.tournament_match(guild, [user1, user2], MATCHES_CATEGORY, match.round)
-            if channel_name:
-                created += 1
+            f"FUNCTION: _setup_next_round\nThe current round is now: {next_round} ")
+
+        job = RoundSetupJob(
+            self.channel_factory,
+            guild,
+            pairings,
+            MATCHES_CATEGORY,
+            title=f"Round {next_round} setup — {self.current_tournament}",
+            slug=self.current_tournament,
+            progress_channel=progress_channel or self.bot.get_channel(LOGS_CH)
+        )
+        task = asyncio.create_task(self.__run_round_setup(
+            job, guild, current_round, next_round, self.max_round, self.current_tournament, clear_matches))
+        self._round_jobs.add(task)
+        task.add_done_callback(self._round_jobs.discard)
+        return task
+
+    async def __run_round_setup(self, job: RoundSetupJob, guild: discord.Guild, previous_round, next_round, max_round, slug, clear_matches):
+        try:
+            # One round at a time, so a teardown never races the previous setup
+            async with self._round_setup_lock:
+                if clear_matches:
+                    await self.channel_destroyer.delete_channels(guild, MATCHES_CATEGORY)
+                created = await job.run()
+        except Exception:
+            log.exception(f"[next_round] Round {next_round} setup failed")
+            return
 
         if created:
             announcement_channel = guild.get_channel(ANNOUNCEMENT_CH)
             if isinstance(announcement_channel, discord.TextChannel):
                 msg = create_new_round_message(
-                    current_round, self.current_round, self.max_round, self.current_tournament)
+                    previous_round, next_round, max_round, slug)
                 await announcement_channel.send(msg)
         else:
             log.info(
@@ -763,44 +709,24 @@ class Tournaments(commands.Cog):
         except Exception:
             pass
 
-    async def __autocomplete_all_tournament_names(self, interaction: discord.Interaction, current: str):
-        session = Session()
-        with session:
-            stmt = select(Tournament).order_by(Tournament.ongoing)
-            tournaments = session.scalars(stmt).all()
+    def __tournament_choices(self, current: str, **filters) -> list[app_commands.Choice[str]]:
+        return [
+            app_commands.Choice(name=t.name, value=t.slug)
+            for t in self.tournament_index.search(current, **filters)
+        ]
 
-            return [
-                app_commands.Choice(name=t.name, value=t.slug)
-                for t in tournaments
-            ]
+    async def __autocomplete_all_tournament_names(self, interaction: discord.Interaction, current: str):
+        return self.__tournament_choices(current)
 
     async def __autocomplete_unfinished_names(self, interaction: discord.Interaction, current: str):
-        session = Session()
-        with session:
-            stmt = select(Tournament).where(
-                Tournament.winner_id == None
-            )
-            tournaments = session.scalars(stmt).all()
-
-            return [
-                app_commands.Choice(name=t.name, value=t.slug)
-                for t in tournaments
-            ]
+        return self.__tournament_choices(current, finished=False)
 
     async def __autocomplete_new_tournaments(self, interaction: discord.Interaction, current: str):
-        session = Session()
-        with session:
-            stmt = select(Tournament).where(Tournament.ongoing == False)
-            tournaments = session.scalars(stmt).all()
-
-            return [
-                app_commands.Choice(name=t.name, value=t.slug)
-                for t in tournaments
-            ]
+        return self.__tournament_choices(current, ongoing=False)
 
     # TOURNAMENT MANAGEMENT -----------------------
     async def __prep_next_match_winner(self, session, slug, winner_challonge_id):
-        next_match = self.__find_next_match_player(slug, winner_challonge_id)
+        next_match = await self.__find_next_match_player(slug, winner_challonge_id)
         if not next_match:
             return False
 
@@ -825,30 +751,48 @@ class Tournaments(commands.Cog):
 
         return True
 
-    async def insert_matches_in_db(self, session, tournament_matches, tournament):
-        for match in tournament_matches:
-            challonge_p1_id = match["player1_id"]
-            challonge_p2_id = match["player2_id"]
-
-            stmt1 = select(TournamentParticipants).where(
-                TournamentParticipants.challonge_id == challonge_p1_id
-            )
-
-            stmt2 = select(TournamentParticipants).where(
-                TournamentParticipants.challonge_id == challonge_p2_id
-            )
+    @staticmethod
+    def __queue_score_update(session, tournament, match_challonge_id, score, winning_participant, losing_participant) -> tuple:
+        """Queue the result for Challonge; returns the arguments for `__cache_match_result`.
+
+        The bracket cache is shared, so callers apply them once the transaction has committed.
+        """
+        ChallongeOutboxWorker.enqueue(
+            session, tournament.id, match_challonge_id, score, winning_participant.challonge_id)
+        return (tournament.slug, match_challonge_id, score, winning_participant.challonge_id,
+                losing_participant.challonge_id if losing_participant else None)
+
+    def __cache_match_result(self, slug, match_challonge_id, score, winner_challonge_id, loser_challonge_id):
+        # Keep the cached bracket in step until Challonge has the result
+        self.bracket_cache.apply_match(slug, {
+            "id": match_challonge_id,
+            "state": "complete",
+            "scores_csv": score,
+            "winner_id": winner_challonge_id,
+            "loser_id": loser_challonge_id,
+        })
+
+    async def __report_outbox_failure(self, entry, error: str):
+        await self._log_to_logs(
+            title="⚠️ Challonge Update Failed",
+            description="A match result could not be pushed to Challonge. Fix it on the website, then run `/sync_db_to_challonge` with `override_failed` so the database follows.",
+            fields={
+                "Challonge Match": str(entry.challonge_match_id),
+                "Score": entry.scores_csv,
+                "Attempts": str(entry.attempts),
+                "Error": error[:1000],
+            },
+        )
 
-            player1 = session.scalars(stmt1).first()
-            player2 = session.scalars(stmt2).first()
+    async def __advance_bracket(self, session, slug, match_row, winning_participant, losing_participant) -> bool:
+        next_rows = advance_match(session, match_row)
+        if next_rows is None:
+            # Bracket imported without feeder data: ask Challonge instead.
+            ok = await self.__prep_next_match_winner(session, slug, winning_participant.challonge_id)
+            await self.__prep_next_match_winner(session, slug, losing_participant.challonge_id)
+            return ok
 
-            tournament_match = TournamentMatches(
-                tournament_id=tournament.id,
-                participant1_id=player1.id if player1 else None,
-                participant2_id=player2.id if player2 else None,
-                challonge_id=match["id"],
-                round=match["round"]
-            )
-            session.add(tournament_match)
+        return any(winning_participant.id in (row.participant1_id, row.participant2_id) for row in next_rows)
 
     @app_commands.command(name="get_max_round", description="Fetch the max round number of the current Tournament")
     @app_commands.default_permissions(administrator=True)
@@ -861,16 +805,17 @@ class Tournaments(commands.Cog):
 
     @app_commands.command(name="set_max_round", description="Set the max round number of the current Tournament")
     @app_commands.default_permissions(administrator=True)
+    @app_commands.describe(max_round="Round number, or `auto` to derive it from the bracket again")
     async def set_max_round(self, interaction: discord.Interaction, max_round: str):
-        if not max_round.isdigit():
+        if not max_round.isdigit() and max_round.lower() != "auto":
             await interaction.response.send_message(f"Please enter a digit. e.g. 69", ephemeral=True)
             return
 
-        self.max_round = int(max_round)
-        if not self.current_tournament:
+        if not await self.state.override_max_round(int(max_round) if max_round.isdigit() else None):
             await interaction.response.send_message(f"There is currently no tournament running", ephemeral=True)
+            return
 
-        await interaction.response.send_message(f"The max round number is: {self.current_round}", ephemeral=True)
+        await interaction.response.send_message(f"The max round number is: {self.max_round}", ephemeral=True)
 
     @app_commands.command(name="get_current_round", description="Fetch the current round number of the current Tournament")
     @app_commands.default_permissions(administrator=True)
@@ -883,13 +828,15 @@ class Tournaments(commands.Cog):
 
     @app_commands.command(name="set_current_round", description="Set the current round number of the current Tournament")
     @app_commands.default_permissions(administrator=True)
+    @app_commands.describe(match_round="Round number, or `auto` to derive it from the bracket again")
     async def set_current_round(self, interaction: discord.Interaction, match_round: str):
-        if not match_round.isdigit():
+        if not match_round.isdigit() and match_round.lower() != "auto":
             await interaction.response.send_message(f"Please enter a digit. e.g. 69", ephemeral=True)
             return
-        self.current_round = int(match_round)
-        if not self.current_tournament:
+
+        if not await self.state.override_current_round(int(match_round) if match_round.isdigit() else None):
             await interaction.response.send_message(f"There is currently no tournament running", ephemeral=True)
+            return
 
         await interaction.response.send_message(f"The current round number is: {self.current_round}", ephemeral=True)
 
@@ -915,8 +862,9 @@ class Tournaments(commands.Cog):
                     t.current_tournament = False
 
             tournament.current_tournament = True
-            self.current_tournament = slug
-            self.max_round = fetch_max_round()
+
+        self.state.invalidate()
+        await self.state.refresh()
 
         await interaction.response.send_message(
             embed=self.build_simple_embed(
@@ -970,14 +918,14 @@ class Tournaments(commands.Cog):
                 return
 
             try:
-                challonge.tournaments.create(
+                await self.challonge.tournaments.create(
                     name=name,
                     url=slug,
                     tournament_type="single elimination",
                     hold_third_place_match=True
                 )
 
-            except challonge.api.ChallongeException as e:
+            except ChallongeError as e:
                 await interaction.response.send_message(
                     embed=self.build_simple_embed(
                         "❌ Cannot Create", f"{e}", discord.Color.red()),
@@ -988,7 +936,7 @@ class Tournaments(commands.Cog):
             tournament_url = f"https://challonge.com/{slug}"
 
             new_tournament = Tournament(
-                challonge_id=self.__get_challonge_id(slug),
+                challonge_id=await self.__get_challonge_id(slug),
                 name=name,
                 slug=slug,
                 url=tournament_url
@@ -997,6 +945,7 @@ class Tournaments(commands.Cog):
             session.add(new_tournament)
             tournament_url = new_tournament.url
 
+        self.tournament_index.invalidate()
         await interaction.response.send_message(
             embed=self.build_simple_embed(
                 "✅ Tournament Created", f"**{slug}**\nSee bracket: {tournament_url}", discord.Color.green()),
@@ -1019,20 +968,17 @@ class Tournaments(commands.Cog):
 
             remote_delete_error_msg = None
             try:
-                challonge.tournaments.destroy(slug)
-            except challonge.api.ChallongeException as e:
-                remote_delete_error_msg = str(e)
-            except requests.HTTPError as e:
-                if e.response is not None and e.response.status_code == 404:
-                    pass
-                else:
+                await self.challonge.tournaments.destroy(slug)
+            except ChallongeError as e:
+                if e.status != 404:
                     remote_delete_error_msg = str(e)
+            self.bracket_cache.invalidate(slug)
 
             deleted_tournament_slug = tournament.slug
             session.delete(tournament)
-            if slug == self.current_tournament:
-                self.current_tournament = None
 
+        self.state.invalidate()
+        self.tournament_index.invalidate()
         msg = f"Tournament **{deleted_tournament_slug}** deleted."
         if remote_delete_error_msg:
             msg = msg + "\n\n**Remote delete failed**:\n" + remote_delete_error_msg
@@ -1047,7 +993,7 @@ class Tournaments(commands.Cog):
     @app_commands.default_permissions(administrator=True)
     async def start_tournament(self, interaction: discord.Interaction, name: str):
         slug = slugify(name)
-        with Session.begin() as session:
+        with Session() as session:
             tournament = self.__check_if_tournament(session, slug)
             if not tournament:
                 await interaction.response.send_message(
@@ -1065,43 +1011,57 @@ class Tournaments(commands.Cog):
                 )
                 return
 
-            try:
-                challonge.participants.randomize(slug)
-                challonge.tournaments.start(slug)
-            except challonge.api.ChallongeException as e:
-                await interaction.response.send_message(
-                    embed=self.build_simple_embed(
-                        "❌ Could Not Start", f"{e}", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
-            error_message = None
+        try:
+            await self.challonge.participants.randomize(slug)
+            await self.challonge.tournaments.start(slug)
+        except ChallongeError as e:
+            await interaction.response.send_message(
+                embed=self.build_simple_embed(
+                    "❌ Could Not Start", f"{e}", discord.Color.red()),
+                ephemeral=True
+            )
+            return
+        error_message = None
 
-            try:
-                tournament_matches = challonge.matches.index(slug)
-                await self.insert_matches_in_db(session, tournament_matches, tournament)
-            except challonge.api.ChallongeException as e:
-                error_message = str(e)
+        try:
+            snapshot = await self.bracket_cache.get(slug, refresh=True)
+            tournament_matches = list(snapshot.matches.values()) if snapshot else []
+        except ChallongeError as e:
+            tournament_matches = []
+            error_message = str(e)
 
-            tournament.ongoing = True
-            msg = f"Tournament **{name}** has now started."
+        await self._import_and_start(slug, tournament_matches)
+        self.state.invalidate()
+        msg = f"Tournament **{name}** has now started."
 
-            if error_message:
-                msg += "\n\n**Warning**:\n" + error_message
+        if error_message:
+            msg += "\n\n**Warning**:\n" + error_message
 
+        self.tournament_index.invalidate()
         await interaction.response.send_message(
             embed=self.build_simple_embed(
                 "🚀 Tournament Started", msg, discord.Color.green()),
             ephemeral=True)
 
+    @staticmethod
+    @offload
+    def _import_and_start(session, slug, challonge_matches) -> int:
+        """Insert the bracket's matches and mark the tournament ongoing; returns the number of matches imported."""
+        tournament = session.scalars(select(Tournament).where(Tournament.slug == slug)).first()
+        imported = import_bracket(session, tournament.id, challonge_matches)
+        tournament.ongoing = True
+        return imported
+
     @app_commands.command(name="end_tournament", description="End a specific ongoing tournament")
     @app_commands.default_permissions(administrator=True)
     async def end_tournament(self, interaction: discord.Interaction):
         slug = slugify(self.current_tournament)
 
         try:
-            challonge.tournaments.finalize(slug)
-        except challonge.api.ChallongeException as e:
+            await self.challonge.tournaments.finalize(slug)
+            # Final ranks only exist after finalizing.
+            self.bracket_cache.invalidate(slug)
+        except ChallongeError as e:
             await interaction.response.send_message(
                 embed=self.build_simple_embed(
                     "❌ Could Not End", f"{e}", discord.Color.red()),
@@ -1119,7 +1079,7 @@ class Tournaments(commands.Cog):
                 )
                 return
 
-            challonge_winner_id = self.get_participant_on_rank(slug, 1)
+            challonge_winner_id = await self.get_participant_on_rank(slug, 1)
             if not challonge_winner_id:
                 await interaction.response.send_message(
                     embed=self.build_simple_embed(
@@ -1150,7 +1110,7 @@ class Tournaments(commands.Cog):
 
             tournament.winner_id = crew_member.id
             tournament.ongoing = False
-            self.current_tournament = None
+            tournament.current_tournament = False
             await interaction.response.send_message(
                 embed=self.build_simple_embed(
                     "🏁 Tournament Ended",
@@ -1160,6 +1120,9 @@ class Tournaments(commands.Cog):
                 ephemeral=True
             )
 
+        self.state.invalidate()
+        self.tournament_index.invalidate()
+
     # Auto complete handlers -----------------------------------------------
 
     @set_current_tournament.autocomplete("name")
@@ -1178,9 +1141,10 @@ class Tournaments(commands.Cog):
 
     async def __delete_player_from_bracket(self, player_challonge_id, slug):
         try:
-            challonge.participants.destroy(slug, player_challonge_id)
+            await self.challonge.participants.destroy(slug, player_challonge_id)
+            self.bracket_cache.invalidate(slug)
             return "Player successfully remove from challonge bracket"
-        except challonge.api.ChallongeException as e:
+        except ChallongeError as e:
             return f"Unable to remove player from challonge bracket. Reason: \n{e}"
 
     async def __remove_player_from_tournament(self, member, slug):
@@ -1226,15 +1190,16 @@ class Tournaments(commands.Cog):
                 return tournament, f"{member.name} is already signed up for tournament: {tournament.name}"
 
             try:
-                new_participant_object = challonge.participants.create(
+                new_participant_object = await self.challonge.participants.create(
                     slug, crew_member.username)
                 if not isinstance(new_participant_object, Dict):
                     return None, "new_participant_object is not a dict"
 
                 player_challonge_id = int(
                     new_participant_object["id"])
+                self.bracket_cache.invalidate(slug)
 
-            except challonge.api.ChallongeException as e:
+            except ChallongeError as e:
                 return tournament, f"Unable to add '{member.name}' as a participant. Reason: \n{e}"
 
             new_participant = TournamentParticipants(
@@ -1337,9 +1302,9 @@ class Tournaments(commands.Cog):
 
         await interaction.response.defer(ephemeral=True, thinking=True)
 
-        with Session.begin() as session:
-            tournament = self.__check_if_tournament(session, slug)
-            if not tournament:
+        tournament_id, participant_challonge_id, registered = await self._find_reporter(slug, reporter_discord_id)
+        if not registered:
+            if tournament_id is None:
                 await interaction.followup.send(
                     embed=self.build_simple_embed(
                         "ℹ️ Info", "There is currently no tournament running.", discord.Color.blurple()),
@@ -1347,138 +1312,155 @@ class Tournaments(commands.Cog):
                 )
                 return
 
-            crew_member = discord_id_to_member(
-                session, reporter_discord_id)
-            winning_crew_member = discord_id_to_member(
-                session, winner_discord_id)
-            if not crew_member or not winning_crew_member:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "You are not registered in our database. Please contact management.", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
-
-            participant = self.__check_if_participant(
-                session, tournament.id, crew_member.id)
-            winning_participant = self.__check_if_participant(
-                session, tournament.id, winning_crew_member.id)
-            if not participant or not winning_participant:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "You are not registered for this tournament.", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
-
-            next_match_ch = self.__find_current_match_player(
-                slug, participant.challonge_id)
-            if not next_match_ch:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "No match could be found for this user.", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
-
-            challonge_match_id = next_match_ch["id"]
-
-            player1_ch_id = next_match_ch["player1_id"] if next_match_ch["player1_id"] else None
-
-            player2_ch_id = next_match_ch["player2_id"] if next_match_ch["player2_id"] else None
-            round_match = next_match_ch["round"]
-
-            participant1 = self.__p_challonge_id_to_participant(
-                session, tournament.id, player1_ch_id)
-            participant2 = self.__p_challonge_id_to_participant(
-                session, tournament.id, player2_ch_id)
-
-            crew_member1 = self.__user_id_to_member(
-                session, participant1.user_id)
-            crew_member2 = self.__user_id_to_member(
-                session, participant2.user_id)
-
-            score = "1-0" if participant1 == winning_participant else "0-1"
-
-            try:
-                challonge.matches.update(
-                    slug, challonge_match_id, scores_csv=score, winner_id=winning_participant.challonge_id)
-            except challonge.api.ChallongeException as e:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Unable to Update", f"{e}", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
+            await interaction.followup.send(
+                embed=self.build_simple_embed(
+                    "❌ Error", "You are not registered for this tournament.", discord.Color.red()),
+                ephemeral=True
+            )
+            return
 
-            current_match_row = self.__get_match_row_by_chid(
-                session, tournament.id, challonge_match_id)
-            if not current_match_row:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "No match could be found.", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
+        next_match_ch = await self.__find_current_match_player(
+            slug, participant_challonge_id)
+        if not next_match_ch:
+            await interaction.followup.send(
+                embed=self.build_simple_embed(
+                    "❌ Error", "No match could be found for this user.", discord.Color.red()),
+                ephemeral=True
+            )
+            return
 
-            current_match_row.winner_participant_id = winning_participant.id
-            current_match_row.score = score
-            current_match_row.completed = True
+        challonge_match_id = next_match_ch["id"]
+        round_match = next_match_ch["round"]
 
-            if video_link:
-                current_match_row.battle_url = video_link
+        result = await self._record_result(
+            tournament_id, challonge_match_id, winner_discord_id, video_link)
+        if result["error"]:
+            await interaction.followup.send(
+                embed=self.build_simple_embed(
+                    "❌ Error", result["error"], discord.Color.red()),
+                ephemeral=True
+            )
+            return
 
-            # Next Match Winner
-            await self.__prep_next_match_winner(session, slug, winning_participant.challonge_id)
+        self.__cache_match_result(
+            slug, challonge_match_id, result["score"], result["winner_challonge_id"], result["loser_challonge_id"])
+
+        if not result["advanced"]:
+            # Bracket imported without feeder data: ask Challonge instead.
+            with Session.begin() as session:
+                await self.__prep_next_match_winner(session, slug, result["winner_challonge_id"])
+                if result["loser_challonge_id"] is not None:
+                    await self.__prep_next_match_winner(session, slug, result["loser_challonge_id"])
+
+        # Build the single embed
+        announce = discord.Embed(
+            title=f"🏆 Match Result Reported — Round {round_match}",
+            description=f"**{result['player1']}** vs **{result['player2']}**",
+            color=discord.Color.orange()
+        )
+        announce.add_field(
+            name="Winner", value=winner.mention, inline=True)
+        announce.add_field(name="Score", value=result["score"], inline=True)
+        announce.add_field(name="VOD", value=video_link, inline=False)
+        if result["tournament_url"]:
+            announce.add_field(
+                name="Bracket", value=f"[View on Challonge]({result['tournament_url']})", inline=False
+            )
 
-            # Next Match Loser
-            losing_participant = participant1 if participant2 == winning_participant else participant2
-            await self.__prep_next_match_winner(session, slug, losing_participant.challonge_id)
+        # Send to logs channel
+        try:
+            log_ch = self.bot.get_channel(LOGS_CH) or await self.bot.fetch_channel(LOGS_CH)
+            if log_ch:
+                await log_ch.send(embed=announce)
+        except Exception:
+            pass
 
-            session.flush()
+        self.outbox.kick()
+        self.state.invalidate()
+        await self.state.refresh()
 
-            # Build the single embed
-            announce = discord.Embed(
-                title=f"🏆 Match Result Reported — Round {round_match}",
-                description=f"**{crew_member1.username}** vs **{crew_member2.username}**",
-                color=discord.Color.orange()
+        # Create reward channel
+        if not interaction.guild:
+            await interaction.followup.send(
+                embed=self.build_simple_embed(
+                    "❌ Error", "Discord Server could not be found", discord.Color.red()),
+                ephemeral=True
             )
-            announce.add_field(
-                name="Winner", value=winner.mention, inline=True)
-            announce.add_field(name="Score", value=score, inline=True)
-            announce.add_field(name="VOD", value=video_link, inline=False)
-            if getattr(tournament, "url", None):
-                announce.add_field(
-                    name="Bracket", value=f"[View on Challonge]({tournament.url})", inline=False
-                )
+            return
+
+        with Session.begin() as session:
+            context = load_match_context(session, tournament_id, challonge_match_id)
+            winning_participant = context.participant_for(winner_discord_id)
+            is_finished = await self.check_if_finished(session, context.match, interaction.guild, winning_participant, context.participants)
+        # Starting the next round may have cleared a round override
+        self.state.invalidate()
 
-            # Send to logs channel
+        if is_finished == True:
             try:
                 log_ch = self.bot.get_channel(LOGS_CH) or await self.bot.fetch_channel(LOGS_CH)
                 if log_ch:
-                    await log_ch.send(embed=announce)
+                    await log_ch.send(f"All Rounds have been played. Tournament '{self.current_tournament}' can be closed.")
             except Exception:
                 pass
 
-            # Create reward channel
-            if not interaction.guild:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "Discord Server could not be found", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
+        await interaction.followup.send(embed=announce, ephemeral=True)
 
-            is_finished = await self.check_if_finished(session, current_match_row, interaction.guild, winning_crew_member, [crew_member1, crew_member2])
-            if is_finished == True:
-                try:
-                    log_ch = self.bot.get_channel(LOGS_CH) or await self.bot.fetch_channel(LOGS_CH)
-                    if log_ch:
-                        await log_ch.send(f"All Rounds have been played. Tournament '{self.current_tournament}' can be closed.")
-                except Exception:
-                    pass
-            
-            await interaction.followup.send(embed=announce, ephemeral=True)
+    @staticmethod
+    @offload
+    def _find_reporter(session, slug, discord_id) -> tuple[int | None, int | None, bool]:
+        """(tournament id, participant challonge id, registered) for whoever runs /report_win."""
+        participant = load_tournament_participant(session, slug, discord_id)
+        if participant:
+            return participant.tournament_id, participant.challonge_id, True
+
+        tournament_id = session.scalar(select(Tournament.id).where(Tournament.slug == slug))
+        return tournament_id, None, False
+
+    @staticmethod
+    @offload
+    def _record_result(session, tournament_id, challonge_match_id, winner_discord_id, video_link) -> dict:
+        """Store a reported result, queue it for Challonge and advance the bracket in one transaction.
+
+        Returns plain values, or a dict with "error" set when the match or the
+        winner doesn't check out.
+        """
+        context = load_match_context(session, tournament_id, challonge_match_id)
+        if not context or len(context.participants) < 2:
+            return {"error": "No match could be found."}
+        if context.match.completed:
+            return {"error": "This match has already been reported."}
+
+        winning_participant = context.participant_for(winner_discord_id)
+        if not winning_participant:
+            return {"error": "The winner must be one of the two players of this match."}
+
+        losing_participant = context.opponent_of(winning_participant)
+        score = context.score_for(winning_participant)
+
+        match_row = context.match
+        match_row.winner_participant_id = winning_participant.id
+        match_row.score = score
+        match_row.completed = True
+        if video_link:
+            match_row.battle_url = video_link
+
+        # Challonge gets the score from the outbox worker after commit
+        ChallongeOutboxWorker.enqueue(
+            session, tournament_id, challonge_match_id, score, winning_participant.challonge_id)
+
+        # Place winner and loser in their next matches; None when the bracket has no feeder data
+        next_rows = advance_match(session, match_row)
+
+        return {
+            "error": None,
+            "tournament_url": context.tournament.url,
+            "player1": context.user1.username,
+            "player2": context.user2.username,
+            "score": score,
+            "winner_challonge_id": winning_participant.challonge_id,
+            "loser_challonge_id": losing_participant.challonge_id if losing_participant else None,
+            "advanced": next_rows is not None,
+        }
 
     @app_commands.command(name="update_match", description="Update the score of a match")
     @app_commands.default_permissions(administrator=True)
@@ -1495,48 +1477,19 @@ class Tournaments(commands.Cog):
         
         await interaction.response.defer(ephemeral=True, thinking=True)
 
+        match_result = None
         with Session.begin() as session:
-            tournament = self.__check_if_tournament(session, slug)
-            if not tournament:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "ℹ️ Info", "There is currently no tournament set as current tournament.", discord.Color.blurple()),
-                    ephemeral=True
-                )
-                return
-
-            crew_member1 = discord_id_to_member(session, player1.id)
-            crew_member2 = discord_id_to_member(session, player2.id)
-            winning_crew_member = discord_id_to_member(
-                session, winner.id)
-            
-            if not crew_member1 or not crew_member2 or not winning_crew_member:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "1 or more discord users are not crew members", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
-
-            participant1 = self.__check_if_participant(
-                session, tournament.id, crew_member1.id)
-            participant2 = self.__check_if_participant(
-                session, tournament.id, crew_member2.id)
-            winning_participant = self.__check_if_participant(
-                session, tournament.id, winning_crew_member.id)
-
-
-            if not participant1 or not participant2:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Error", "One or more crew members are not participants of this tournament.", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
+            context = load_match_context_for_players(
+                session, slug, player1.id, player2.id)
+            if not context:
+                if not self.__check_if_tournament(session, slug):
+                    await interaction.followup.send(
+                        embed=self.build_simple_embed(
+                            "ℹ️ Info", "There is currently no tournament set as current tournament.", discord.Color.blurple()),
+                        ephemeral=True
+                    )
+                    return
 
-            current_match = self.__get_match_row_for_players(
-                session, tournament.id, participant1.id, participant2.id)
-            if not current_match:
                 await interaction.followup.send(
                     embed=self.build_simple_embed(
                         "❌ Error", f"This match between **{player1.display_name}** and **{player2.display_name}** does not exist.", discord.Color.red()),
@@ -1544,36 +1497,30 @@ class Tournaments(commands.Cog):
                 )
                 return
 
-            score = "1-0" if winning_participant.id == current_match.participant1_id else "0-1"
+            tournament = context.tournament
+            current_match = context.match
+            crew_member1, crew_member2 = context.user1, context.user2
+            winning_participant = context.participant_for(winner.id)
 
-            try:
-                challonge.matches.update(
-                    slug, current_match.challonge_id, scores_csv=score, winner_id=winning_participant.challonge_id)
-                current_match.completed = True
-                current_match.score = score
-                current_match.winner_participant_id = winning_participant.id
+            score = context.score_for(winning_participant)
 
-                # Winner's next match
-                ok = await self.__prep_next_match_winner(session, slug, winning_participant.challonge_id)
+            current_match.completed = True
+            current_match.score = score
+            current_match.winner_participant_id = winning_participant.id
 
-                # Loser's next match
-                losing_participant = participant1 if participant2 == winning_participant else participant2
-                await self.__prep_next_match_winner(session, slug, losing_participant.challonge_id)
+            losing_participant = context.opponent_of(winning_participant)
+            match_result = self.__queue_score_update(
+                session, tournament, current_match.challonge_id, score, winning_participant, losing_participant)
 
-            except challonge.api.ChallongeException as e:
-                await interaction.followup.send(
-                    embed=self.build_simple_embed(
-                        "❌ Update Failed", f"{e}", discord.Color.red()),
-                    ephemeral=True
-                )
-                return
+            # Place winner and loser in their next matches
+            ok = await self.__advance_bracket(session, slug, current_match, winning_participant, losing_participant)
 
             if not interaction.guild:
                 log.info(f"COMMAND: update_match\nERROR: interaction.guild is None")
                 return
             
             log.info(f"COMMAND: update_match\nDEBUG: crew member1: {crew_member1.discord_id}\ncrew member2: {crew_member2.discord_id}")
-            is_finished = await self.check_if_finished(session, current_match, interaction.guild, winning_crew_member, [crew_member1, crew_member2])
+            is_finished = await self.check_if_finished(session, current_match, interaction.guild, winning_participant, context.participants)
             if is_finished == True:
                 try:
                     log_ch = self.bot.get_channel(LOGS_CH) or await self.bot.fetch_channel(LOGS_CH)
@@ -1592,61 +1539,140 @@ class Tournaments(commands.Cog):
                 ephemeral=True
             )
 
+        if match_result:
+            self.__cache_match_result(*match_result)
+        self.outbox.kick()
+        self.state.invalidate()
+
     @app_commands.command(name="sync_db_to_challonge", description="Synchronize the Database to the bracket in Challonge for current tournament")
     @app_commands.default_permissions(administrator=True)
-    async def sync_db_to_challonge(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        dry_run="Only show what would change",
+        override_failed="Let Challonge overwrite matches whose result push failed (after fixing them on the website)")
+    async def sync_db_to_challonge(self, interaction: discord.Interaction, dry_run: bool = False, override_failed: bool = False):
         slug = slugify(self.current_tournament)
 
-        with Session.begin() as session:
-            tournament = self.__check_if_tournament(session, slug)
-            if not tournament:
-                await interaction.response.send_message(
-                    embed=self.build_simple_embed(
-                        "ℹ️ Info", "There is currently no tournament running.", discord.Color.blurple()),
-                    ephemeral=True
-                )
-                return
+        await interaction.response.defer(ephemeral=True, thinking=True)
 
-            try:
-                all_matches = challonge.matches.index(slug)
-                for match in all_matches:
-                    if not isinstance(match, Dict):
-                        return
-
-                    p1_challonge_id = match["player1_id"]
-                    p2_challonge_id = match["player2_id"]
-                    winner_challonge_id = match["winner_id"]
-                    score_challonge_match = match["scores_csv"]
-
-                    participant1 = self.__p_challonge_id_to_participant(
-                        session, tournament.id, p1_challonge_id)
-                    participant2 = self.__p_challonge_id_to_participant(
-                        session, tournament.id, p2_challonge_id)
-                    winning_participant = self.__p_challonge_id_to_participant(
-                        session, tournament.id, winner_challonge_id
-                    )
+        try:
+            # The bracket as Challonge has it: unsent results are skipped by the diff instead
+            snapshot = await self.bracket_cache.get(slug, refresh=True, overlay=False) if slug else None
+        except ChallongeError:
+            snapshot = None
+        if snapshot:
+            self.bracket_cache.invalidate(slug)
+
+        synced = await self._sync_bracket(slug, list(snapshot.matches.values()), dry_run, override_failed) if snapshot else None
+        if not synced:
+            await interaction.followup.send(
+                embed=self.build_simple_embed(
+                    "ℹ️ Info", "There is currently no tournament running.", discord.Color.blurple()),
+                ephemeral=True
+            )
+            return
 
-                    match_row = self.__get_match_row_by_chid(
-                        session, tournament.id, match["id"])
-                    match_row.participant1_id = participant1.id if participant1 else None
-                    match_row.participant2_id = participant2.id if participant2 else None
-                    match_row.winner_participant_id = winning_participant.id if winning_participant else None
-                    match_row.score = score_challonge_match if score_challonge_match else None
+        changes, missing, skipped = synced
+        if not dry_run:
+            self.state.invalidate()
+
+        lines = []
+        for change in changes[:15]:
+            fields = ", ".join(
+                f"{column}: {old} → {new}" for column, (old, new) in change["changed"].items())
+            lines.append(f"• R{change['round']} `{change['challonge_id']}` — {fields}")
+        if len(changes) > 15:
+            lines.append(f"… and {len(changes) - 15} more")
+        if missing:
+            lines.append(f"\n⚠️ {len(missing)} Challonge match(es) missing in the database: {', '.join(map(str, missing[:10]))}")
+        if skipped:
+            listed = ", ".join(f"`{match_id}` ({status})" for match_id, status in list(skipped.items())[:10])
+            more = f" … and {len(skipped) - 10} more" if len(skipped) > 10 else ""
+            lines.append(f"\n⏳ {len(skipped)} match(es) skipped, their reported result isn't on Challonge yet: {listed}{more}")
+            if "failed" in skipped.values():
+                lines.append("Fix failed results on the website, then run again with `override_failed`.")
+
+        if dry_run:
+            title = "🔍 Sync Preview"
+            summary = f"{len(changes)} match(es) would be updated."
+        else:
+            title = "🔄 Sync Complete"
+            summary = f"Database synchronized with Challonge. {len(changes)} match(es) updated."
 
-                    match_row.completed = True if match["state"] == "complete" else False
-                    self.current_round = fetch_current_round()
+        description = summary + ("\n\n" + "\n".join(lines) if lines else "")
+        await interaction.followup.send(
+            embed=self.build_simple_embed(
+                title, description[:4000], discord.Color.green()),
+            ephemeral=True
+        )
 
-            except challonge.api.ChallongeException:
-                await interaction.response.send_message(
-                    embed=self.build_simple_embed(
-                        "ℹ️ Info", "There is currently no tournament running.", discord.Color.blurple()),
-                    ephemeral=True
-                )
-                return
+    @staticmethod
+    @offload
+    def _sync_bracket(session, slug, challonge_matches, dry_run, override_failed=False) -> tuple[list, list, dict] | None:
+        """Diff (and unless `dry_run`, apply) the Challonge bracket against the database; None without a tournament.
+
+        Matches with an unsent result in the outbox are skipped and returned
+        with their status, so Challonge can't revert a locally reported
+        winner. `override_failed` only keeps pending ones back and marks the
+        failed ones resolved.
+        """
+        tournament_id = session.scalar(select(Tournament.id).where(Tournament.slug == slug))
+        if tournament_id is None:
+            return None
 
+        skipped = ChallongeOutboxWorker.unsent(
+            session, tournament_id, ("pending",) if override_failed else ("pending", "failed"))
+        changes, missing = diff_bracket(session, tournament_id, challonge_matches, skip=skipped)
+        if not dry_run:
+            apply_bracket_diff(session, changes)
+            if override_failed:
+                ChallongeOutboxWorker.resolve_failed(session, tournament_id)
+        return changes, missing, skipped
+
+    @app_commands.command(name="challonge_stats", description="Show Challonge request counters since the bot started")
+    @app_commands.default_permissions(administrator=True)
+    async def challonge_stats(self, interaction: discord.Interaction):
+        stats = self.challonge.stats
+        description = "\n".join([
+            f"**Requests issued:** {stats['issued']}",
+            f"**Coalesced (shared in-flight GET):** {stats['coalesced']}",
+            f"**Throttled (waited for budget):** {stats['throttled']}",
+            f"**Rate limited (429 from Challonge):** {stats['rate_limited']}",
+            f"**Budget:** {CH_REQUESTS_PER_SECOND:g} requests/second",
+        ])
         await interaction.response.send_message(
+            embed=self.build_simple_embed("📊 Challonge Traffic", description, discord.Color.blurple()),
+            ephemeral=True
+        )
+
+    @app_commands.command(name="clear_match_channels", description="Delete match channels of the current tournament, optionally only one round")
+    @app_commands.default_permissions(administrator=True)
+    async def clear_match_channels(self, interaction: discord.Interaction, match_round: Optional[int] = None):
+        if not interaction.guild or not self.current_tournament:
+            await interaction.response.send_message(
+                embed=self.build_simple_embed(
+                    "ℹ️ Info", "There is currently no tournament set as current tournament.", discord.Color.blurple()),
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True, thinking=True)
+
+        result = await self.channel_destroyer.delete_channels(
+            interaction.guild, MATCHES_CATEGORY, slug=self.current_tournament, match_round=match_round)
+
+        description = "\n".join([
+            f"**Deleted:** {result.deleted}",
+            f"**Skipped:** {result.skipped}",
+            f"**Failed:** {result.failed}",
+        ])
+        if result.errors:
+            description += "\n\n" + "\n".join(result.errors[:10])
+
+        scope = f"Round {match_round}" if match_round is not None else "All rounds"
+        await interaction.followup.send(
             embed=self.build_simple_embed(
-                "🔄 Sync Complete", "Database synchronized with Challonge.", discord.Color.green()),
+                f"🧹 Match Channels Cleared — {scope}", description,
+                discord.Color.green() if not result.failed else discord.Color.orange()),
             ephemeral=True
         )
 
@@ -1898,7 +1924,7 @@ class Tournaments(commands.Cog):
 
             tournament, tournament_participant = row
 
-            challonge_match = self.__find_next_match_player(
+            challonge_match = await self.__find_next_match_player(
                 slug, tournament_participant.challonge_id)
             if not challonge_match or not challonge_match["id"]:
                 # No match for player
@@ -2035,9 +2061,7 @@ class Tournaments(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         
         with Session.begin() as session:
-            tournament = self.__check_if_tournament(session, self.current_tournament)
-
-            current_match = await self.get_match_for_discord_ids(session, tournament.id, discord_user1.id, discord_user2.id)
+            current_match = await self.get_match_for_discord_ids(session, self.current_tournament, discord_user1.id, discord_user2.id)
             if not current_match:
                 await interaction.followup.send(
                     embed=self.build_simple_embed(
@@ -2056,9 +2080,7 @@ class Tournaments(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
 
         with Session() as session:
-            tournament = self.__check_if_tournament(session, self.current_tournament)
-
-            current_match = await self.get_match_for_discord_ids(session, tournament.id, discord_user1.id, discord_user2.id)
+            current_match = await self.get_match_for_discord_ids(session, self.current_tournament, discord_user1.id, discord_user2.id)
             if not current_match:
                 await interaction.followup.send(
                     embed=self.build_simple_embed(
@@ -2111,55 +2133,34 @@ class Tournaments(commands.Cog):
         slug = tournament.slug
         status = "✅"
 
-        crew_member1 = discord_id_to_member(session, discord_user1.id)
-        crew_member2 = discord_id_to_member(session, discord_user2.id)
-        winning_crew_member = discord_id_to_member(
-            session, winner.id)
-        
-        if not crew_member1 or not crew_member2 or not winning_crew_member:
-            return "❌ Error", f"1 or more discord users are not crew members"
-
-        participant1 = self.__check_if_participant(
-            session, tournament.id, crew_member1.id)
-        participant2 = self.__check_if_participant(
-            session, tournament.id, crew_member2.id)
-        winning_participant = self.__check_if_participant(
-            session, tournament.id, winning_crew_member.id)
-
+        context = load_match_context_for_players(
+            session, slug, discord_user1.id, discord_user2.id)
+        if not context:
+            return "❌ Error", f"This match between **{discord_user1.display_name}** and **{discord_user2.display_name}** does not exist.", None
 
-        if not participant1 or not participant2:
-            return "❌ Error", "One or more crew members are not participants of this tournament."
+        current_match = context.match
+        crew_member1, crew_member2 = context.user1, context.user2
+        winning_participant = context.participant_for(winner.id)
 
-        current_match = self.__get_match_row_for_players(
-            session, tournament.id, participant1.id, participant2.id)
-        if not current_match:
-            return "❌ Error", f"This match between **{discord_user1.display_name}** and **{discord_user2.display_name}** does not exist."
-
-        score = "1-0" if winning_participant.id == current_match.participant1_id else "0-1"
+        score = context.score_for(winning_participant)
         
-        try:
-            challonge.matches.update(
-                slug, current_match.challonge_id, scores_csv=score, winner_id=winning_participant.challonge_id)
-            current_match.completed = True
-            current_match.score = score
-            current_match.winner_participant_id = winning_participant.id
+        current_match.completed = True
+        current_match.score = score
+        current_match.winner_participant_id = winning_participant.id
 
-            # Winner's next match
-            ok = await self.__prep_next_match_winner(session, slug, winning_participant.challonge_id)
-
-            # Loser's next match
-            losing_participant = participant1 if participant2 == winning_participant else participant2
-            await self.__prep_next_match_winner(session, slug, losing_participant.challonge_id)
+        losing_participant = context.opponent_of(winning_participant)
+        match_result = self.__queue_score_update(
+            session, tournament, current_match.challonge_id, score, winning_participant, losing_participant)
 
-        except challonge.api.ChallongeException as e:
-            return "❌ Update Failed", f"{e}"
+        # Place winner and loser in their next matches
+        ok = await self.__advance_bracket(session, slug, current_match, winning_participant, losing_participant)
 
         if not guild:
             log.info(f"COMMAND: update_match\nERROR: interaction.guild is None")
             return
         
         log.info(f"COMMAND: update_match\nDEBUG: crew member1: {crew_member1.discord_id}\ncrew member2: {crew_member2.discord_id}")
-        is_finished = await self.check_if_finished(session, current_match, guild, winning_crew_member, [crew_member1, crew_member2])
+        is_finished = await self.check_if_finished(session, current_match, guild, winning_participant, context.participants)
         if is_finished == True:
             try:
                 log_ch = self.bot.get_channel(LOGS_CH) or await self.bot.fetch_channel(LOGS_CH)
@@ -2172,7 +2173,8 @@ class Tournaments(commands.Cog):
         if not ok:
             msg += "\n\n⚠️ Could not find and update winner’s next match."
 
-        return status, msg
+        # For the caller to apply to the bracket cache after commit
+        return status, msg, match_result
     
     @app_commands.command(name="random_match_winner", description="Randomly choose a winner of a match in the current tournament")
     @app_commands.default_permissions(administrator=True)
@@ -2211,7 +2213,7 @@ class Tournaments(commands.Cog):
                 return
 
             embed_color = discord.Color.green()
-            status, msg = await self.helper(session, guild, tournament, discord_user1, discord_user2, winner)
+            status, msg, match_result = await self.helper(session, guild, tournament, discord_user1, discord_user2, winner)
             
             if "❌" in status:
                 embed_color = discord.Color.red()
@@ -2221,6 +2223,11 @@ class Tournaments(commands.Cog):
                     "✅ Match Updated", msg, embed_color), ephemeral=False
             )
 
+        if match_result:
+            self.__cache_match_result(*match_result)
+        self.outbox.kick()
+        self.state.invalidate()
+
     @app_commands.command(name="create_reward_channels", description="Create channels for unreceived rewards")
     @app_commands.default_permissions(administrator=True)
     async def create_reward_channels(self, interaction: discord.Interaction):
@@ -2230,27 +2237,29 @@ class Tournaments(commands.Cog):
         if not guild:
             return
         
-        with Session() as session:
+        with Session.begin() as session:
             tournament =  self.__check_if_tournament(session, slug)
             if not tournament:
                 await interaction.response.send_message(f"There is currently no tournament going on.")
+                return
 
             await interaction.response.defer(ephemeral=True, thinking=True)
             
             stmt = (
-                select(User)
-                .join(TournamentParticipants, TournamentParticipants.user_id == User.id)
+                select(TournamentParticipants)
+                .options(joinedload(TournamentParticipants.user_link))
                 .where(
                     TournamentParticipants.tournament_id == tournament.id,
                     TournamentParticipants.reward_received == False
                 )
             )
-            crew_members = list(session.scalars(stmt).all()) 
-            if len(crew_members) == 0:
+            participants = list(session.scalars(stmt).all())
+            if len(participants) == 0:
                 await interaction.followup.send(f"There are no participants that still need to receive a reward")
+                return
 
-            channel_amount = await self.channel_factory.tournament_rewards(guild, crew_members, REWARDS_CATEGORY, slug)
-            await interaction.followup.send(f"{channel_amount} reward channels have been created", ephemeral=True)
+            channel_amount = await self.channel_factory.tournament_rewards(guild, participants, REWARDS_CATEGORY, slug)
+            await interaction.followup.send(f"{channel_amount} reward channels are ready", ephemeral=True)
 
 
     @app_commands.command(name="reward_participant", description="Confirm that a player has received a reward in the current tournament")
@@ -2379,9 +2388,15 @@ class Tournaments(commands.Cog):
         await interaction.response.defer(ephemeral=True, thinking=True)
         with Session.begin() as session:
             tournament = self.__check_if_tournament(session, self.current_tournament)
-            await self._setup_next_round(session, tournament.id, (self.current_round - 1), interaction.guild)
+            task = await self._setup_next_round(session, tournament.id, (self.current_round - 1), interaction.guild, progress_channel=interaction.channel)
+        self.state.invalidate()
+        await self.state.refresh()
+
+        if not task:
+            await interaction.followup.send(f"No match channels to create for round: {self.current_round}")
+            return
 
-        await interaction.followup.send(f"Match Channels created for round: {self.current_round}")
+        await interaction.followup.send(f"Creating match channels for round: {self.current_round}. Progress is posted in this channel.")
 
     @app_commands.command(name="request_datetime", description="Post a time that auto-localizes for everyone. Format: YYYY-MM-DD HH:MM (24h)")
     async def request_datetime(self, interaction: discord.Interaction, opponent: discord.Member, requested_dt: str):
@@ -2,7 +2,7 @@
 from .members import User
 from .pokemon import Pokemon
 from .lending import Loan
-from .tournament import Tournament, TournamentParticipants, TournamentMatches
+from .tournament import Tournament, TournamentParticipants, TournamentMatches, ChallongeOutbox
 from .giveaways import GiveAway, GiveAwayEntry
 
 __all__ = ["User", 
@@ -11,6 +11,7 @@ __all__ = ["User",
            "Tournament",
            "TournamentParticipants",
            "TournamentMatches",
+           "ChallongeOutbox",
            "GiveAway",
            "GiveAwayEntry"
            ]
@@ -12,6 +12,13 @@ if TYPE_CHECKING:
 
 class Loan(Base):
     __tablename__ = "loans"
+    __table_args__ = (
+        # Open loans only; returned ones are history
+        sa.Index(
+            "ix_loans_open_pokemon", "pokemon_id",
+            postgresql_where=sa.text("returned_at IS NULL")
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     pokemon_id: Mapped[int] = mapped_column(sa.ForeignKey("pokemon.id"), nullable=False)
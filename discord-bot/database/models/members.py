@@ -13,6 +13,14 @@ if TYPE_CHECKING:
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Trigram index for similarity / ILIKE '%...%' username search (needs pg_trgm)
+        sa.Index(
+            "ix_users_username_trgm", "username",
+            postgresql_using="gin",
+            postgresql_ops={"username": "gin_trgm_ops"}
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     discord_id: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, unique=True)
@@ -10,6 +10,19 @@ if TYPE_CHECKING:
 
 class Pokemon(Base):
     __tablename__ = "pokemon"
+    __table_args__ = (
+        # Trigram index for similarity / ILIKE '%...%' name search (needs pg_trgm)
+        sa.Index(
+            "ix_pokemon_name_trgm", "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"}
+        ),
+        # Storage management filters on these together
+        sa.Index(
+            "ix_pokemon_storage_tier",
+            "in_storage", "always_stored", "tier"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(sa.String(64), nullable=False)
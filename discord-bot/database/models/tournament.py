@@ -16,6 +16,11 @@ class TournamentMatches(Base):
             "tournament_id", "challonge_id",
             name="uq_tm_t_chid"
         ),
+        # Round setup / "is the round finished" lookups
+        sa.Index(
+            "ix_tm_t_round_completed",
+            "tournament_id", "round", "completed"
+        ),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True)
@@ -37,6 +42,16 @@ class TournamentMatches(Base):
     score: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
     battle_url: Mapped[str] = mapped_column(sa.Text, nullable=True)
 
+    # Feeder matches (challonge match ids) for each slot
+    player1_prereq_match_id: Mapped[int | None] = mapped_column(
+        sa.Integer, nullable=True)
+    player2_prereq_match_id: Mapped[int | None] = mapped_column(
+        sa.Integer, nullable=True)
+    player1_is_prereq_loser: Mapped[bool] = mapped_column(
+        sa.Boolean, nullable=False, server_default=sa.false())
+    player2_is_prereq_loser: Mapped[bool] = mapped_column(
+        sa.Boolean, nullable=False, server_default=sa.false())
+
     # Relationship
     tournament_link: Mapped["Tournament"] = relationship(
         back_populates="matches_rows"
@@ -96,6 +111,9 @@ class TournamentParticipants(Base):
     reward_received_on: Mapped[datetime | None] = mapped_column(
         sa.DateTime(timezone=True), nullable=True)
 
+    reward_channel_id: Mapped[int | None] = mapped_column(
+        sa.BigInteger, nullable=True)
+
     tournament_link: Mapped["Tournament"] = relationship(
         back_populates="participant_rows"
     )
@@ -140,6 +158,14 @@ class Tournament(Base):
     winner_id: Mapped[int] = mapped_column(
         sa.ForeignKey("users.id"), nullable=True)
 
+    # Set by admins (/set_current_round, /set_max_round); NULL means derived
+    # from tournament_matches. The current round override is cleared when the
+    # next round is set up.
+    current_round_override: Mapped[int | None] = mapped_column(
+        sa.Integer, nullable=True)
+    max_round_override: Mapped[int | None] = mapped_column(
+        sa.Integer, nullable=True)
+
     winner: Mapped["User"] = relationship(
         back_populates="won_tournaments"
     )
@@ -159,3 +185,50 @@ class Tournament(Base):
             f"<Tournament(id={self.id}, name='{self.name}', slug='{self.slug}', "
             f"ongoing={self.ongoing}, current={self.current_tournament}, url={self.url} )>"
         )
+
+
+class ChallongeOutbox(Base):
+    __tablename__ = "challonge_outbox"
+    __table_args__ = (
+        # The worker only ever reads pending rows, oldest first
+        sa.Index(
+            "ix_challonge_outbox_pending", "id",
+            postgresql_where=sa.text("status = 'pending'")
+        ),
+        # Pending rows queue behind an unresolved failure of their tournament
+        sa.Index(
+            "ix_challonge_outbox_failed", "tournament_id", "id",
+            postgresql_where=sa.text("status = 'failed'")
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    tournament_id: Mapped[int] = mapped_column(sa.ForeignKey(
+        "tournaments.id", ondelete="CASCADE"), nullable=False)
+    challonge_match_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    scores_csv: Mapped[str] = mapped_column(sa.Text, nullable=False)
+    winner_challonge_id: Mapped[int | None] = mapped_column(sa.Integer, nullable=True)
+
+    # pending -> sent | failed; failed -> resolved (fixed on Challonge by an admin)
+    status: Mapped[str] = mapped_column(
+        sa.Text, nullable=False, server_default="pending")
+    attempts: Mapped[int] = mapped_column(
+        sa.Integer, nullable=False, server_default=sa.text("0"))
+    last_error: Mapped[str | None] = mapped_column(sa.Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False)
+    sent_at: Mapped[datetime | None] = mapped_column(
+        sa.DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return (
+            "<ChallongeOutbox("
+            f"id={self.id}, "
+            f"tournament_id={self.tournament_id}, "
+            f"challonge_match_id={self.challonge_match_id}, "
+            f"status={self.status}, "
+            f"attempts={self.attempts}"
+            ")>"
+        )
@@ -0,0 +1,104 @@
+import os
+import threading
+import time
+
+from bisect import bisect_left
+from sqlalchemy import exc
+
+# Upper bounds (seconds) of the checkout wait histogram; the last bucket is open-ended
+WAIT_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 2.0)
+WAIT_LABELS = (*(f"≤ {bound * 1000:g} ms" for bound in WAIT_BUCKETS), f"> {WAIT_BUCKETS[-1] * 1000:g} ms")
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def pool_options() -> dict:
+    """Pool sizing for create_engine/create_async_engine, read from DB_POOL_* env vars.
+
+    The bot and the cron container share one Postgres, so
+    (DB_POOL_SIZE + DB_POOL_MAX_OVERFLOW) per engine is what counts against
+    max_connections.
+    """
+    return {
+        "pool_size": int(os.getenv("DB_POOL_SIZE", 5)),
+        "max_overflow": int(os.getenv("DB_POOL_MAX_OVERFLOW", 10)),
+        "pool_timeout": float(os.getenv("DB_POOL_TIMEOUT", 30)),
+        # -1 disables recycling
+        "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 1800)),
+        # Pre-ping tests each connection on checkout (one round trip); without
+        # it, stale connections are only caught by pool_recycle
+        "pool_pre_ping": _env_bool("DB_POOL_PRE_PING", True),
+        # LIFO keeps a few connections hot and lets the rest time out server-side
+        "pool_use_lifo": _env_bool("DB_POOL_USE_LIFO", False),
+    }
+
+
+class PoolStats:
+    """Checkout counters and wait-time histogram for one engine's pool."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.buckets = [0] * (len(WAIT_BUCKETS) + 1)
+        self.pool = None
+
+    def observe(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            self.buckets[bisect_left(WAIT_BUCKETS, seconds)] += 1
+
+    def snapshot(self) -> dict:
+        pool = self.pool
+        with self._lock:
+            observed = self.checkouts + self.timeouts
+            return {
+                "name": self.name,
+                "size": pool.size() if pool else 0,
+                "checked_out": pool.checkedout() if pool else 0,
+                "idle": pool.checkedin() if pool else 0,
+                # Negative until the pool has opened pool_size connections
+                "overflow": pool.overflow() if pool else 0,
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": (self.total_wait / observed * 1000) if observed else 0.0,
+                "max_wait_ms": self.max_wait * 1000,
+                "histogram": list(zip(WAIT_LABELS, self.buckets)),
+            }
+
+
+def timed_pool_class(base, stats: PoolStats):
+    """Subclass of `base` that reports how long each checkout waited to `stats`.
+
+    Passed as `poolclass`; `Pool.recreate()` (engine.dispose) keeps the class,
+    so timing survives a dispose.
+    """
+
+    def __init__(self, *args, **kwargs):
+        base.__init__(self, *args, **kwargs)
+        stats.pool = self
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = base._do_get(self)
+        except exc.TimeoutError:
+            stats.observe(time.perf_counter() - start, timed_out=True)
+            raise
+        stats.observe(time.perf_counter() - start)
+        return connection
+
+    return type(f"Timed{base.__name__}", (base,), {"__init__": __init__, "_do_get": _do_get})
@@ -3,7 +3,10 @@ from PIL import Image, ImageDraw, ImageFont
 import re
 import io
 import os
-from functools import lru_cache
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from sprite_store import sprite_store
+from asset_pack import asset_pack
 
 # Load a nicer font (replace path with your local font)
 FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
@@ -11,6 +14,16 @@ FONT_SMALL = ImageFont.truetype(FONT_PATH, 30)
 FONT_MEDIUM = ImageFont.truetype(FONT_PATH, 36)
 FONT_LARGE = ImageFont.truetype(FONT_PATH, 44)
 
+HTTP_TIMEOUT = 10
+POKEAPI_URL = "https://pokeapi.co/api/v2/pokemon/{name}"
+ARTWORK_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{id}.png"
+ITEM_ICON_URL = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/items/{name}.png"
+
+# Sprites and item icons of a team are fetched in parallel; whatever isn't
+# back after ASSET_FETCH_DEADLINE seconds is drawn as a placeholder
+ASSET_FETCH_WORKERS = int(os.getenv("ASSET_FETCH_WORKERS", 8))
+ASSET_FETCH_DEADLINE = float(os.getenv("ASSET_FETCH_DEADLINE", 8))
+
 
 def get_required_team_width(team):
     max_width = 0
@@ -42,29 +55,31 @@ def normalize_item_name(item_name):
     return normalized
 
 
-@lru_cache(maxsize=None)
+def download(url):
+    """Bytes at `url`; None on a 404, raises on other failures."""
+    response = requests.get(url, timeout=HTTP_TIMEOUT)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return response.content
+
+
 def fetch_item_icon(item_name):
     if not item_name:
         return None
 
     normalized = normalize_item_name(item_name)
+    if not normalized:
+        return None
 
-    # Try PokéAPI first
-    url = f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/items/{normalized}.png"
-    try:
-        response = requests.get(url)
-        if response.ok:
-            return Image.open(io.BytesIO(response.content)).convert("RGBA")
-    except Exception as e:
-        print(f"Error fetching from PokeAPI: {e}")
-
-    # If online fetch fails, try local fallback
-    local_path = os.path.join("battle_items", f"{normalized}.png")
-    if os.path.isfile(local_path):
-        try:
-            return Image.open(local_path).convert("RGBA")
-        except Exception as e:
-            print(f"Error loading local item icon for {item_name}: {e}")
+    # Asset pack and battle_items/ first; PokéAPI only for items neither knows
+    icon = sprite_store.get(
+        f"item/{normalized}",
+        lambda: download(ITEM_ICON_URL.format(name=normalized)),
+        local=lambda: asset_pack.item_icon(normalized)
+    )
+    if icon:
+        return icon
 
     print(f"Item icon not found: {item_name}")
     return None
@@ -108,17 +123,93 @@ def draw_pill(draw, xy, text, font, fill=(255, 255, 255), bg=(50, 50, 50, 200),
     return w + 6, h  # return both width and height
 
 
+def normalize_pokemon_name(pokemon_name):
+    return re.sub(r"\s*\(.*\)$", "",
+                  pokemon_name.lower()).replace(" ", "-")
+
+
+def download_pokemon_sprite(normalized):
+    dex_id = asset_pack.dex_id(normalized)
+    if dex_id is not None:
+        return download(ARTWORK_URL.format(id=dex_id))
+
+    response = requests.get(POKEAPI_URL.format(name=normalized), timeout=HTTP_TIMEOUT)
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return download(ARTWORK_URL.format(id=response.json()["id"]))
+
+
 def fetch_pokemon_sprite(pokemon_name):
-    normalized = re.sub(r"\s*\(.*\)$", "",
-                        pokemon_name.lower()).replace(" ", "-")
-    response = requests.get(f"https://pokeapi.co/api/v2/pokemon/{normalized}")
-    if response.ok:
-        poke_id = response.json()["id"]
-        sprite_url = f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{poke_id}.png"
-        sprite_response = requests.get(sprite_url)
-        if sprite_response.ok:
-            return Image.open(io.BytesIO(sprite_response.content)).convert("RGBA")
-    return None
+    normalized = normalize_pokemon_name(pokemon_name)
+    if not normalized:
+        return None
+    return sprite_store.get(
+        f"pokemon/{normalized}",
+        lambda: download_pokemon_sprite(normalized),
+        local=lambda: asset_pack.pokemon_artwork(normalized)
+    )
+
+
+_asset_pool = None
+_asset_pool_pid = None
+
+
+def asset_pool():
+    # Created lazily and per process: executor threads don't survive a fork
+    global _asset_pool, _asset_pool_pid
+    if _asset_pool is None or _asset_pool_pid != os.getpid():
+        _asset_pool = ThreadPoolExecutor(max_workers=ASSET_FETCH_WORKERS, thread_name_prefix="team-assets")
+        _asset_pool_pid = os.getpid()
+    return _asset_pool
+
+
+def prefetch_assets(team, deadline=ASSET_FETCH_DEADLINE):
+    """Sprites and item icons for the whole team, fetched concurrently.
+
+    Returns ({("sprite", name): image, ("item", item): image}, complete).
+    Entries are None when there is no image, or when the fetch failed or
+    missed the deadline; `complete` is False in the last two cases, since
+    a later try may succeed. Late fetches keep running and still land in
+    the sprite cache for the next render.
+    """
+    jobs = {}
+    for pokemon in team:
+        jobs[("sprite", pokemon["name"])] = (fetch_pokemon_sprite, pokemon["name"])
+        if pokemon["item"]:
+            jobs[("item", pokemon["item"])] = (fetch_item_icon, pokemon["item"])
+
+    start = time.perf_counter()
+    pool = asset_pool()
+    futures = {pool.submit(fn, arg): key for key, (fn, arg) in jobs.items()}
+    done, pending = wait(futures, timeout=deadline)
+
+    assets = {key: None for key in jobs}
+    complete = not pending
+    for future in done:
+        try:
+            assets[futures[future]] = future.result()
+        except Exception as e:
+            complete = False
+            print(f"Error fetching {futures[future]}: {e}")
+    for future in pending:
+        future.cancel()
+        print(f"Asset fetch missed the {deadline:g}s deadline: {futures[future]}")
+
+    print(f"Fetched {len(done)}/{len(jobs)} team assets in {time.perf_counter() - start:.2f}s")
+    return assets, complete
+
+
+def placeholder_sprite(width, height):
+    sprite = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(sprite)
+    size = min(width, height)
+    x = (width - size) // 2
+    y = (height - size) // 2
+    draw.ellipse([x, y, x + size - 1, y + size - 1], fill=(45, 45, 60, 255), outline=(90, 90, 110, 255), width=4)
+    bbox = FONT_LARGE.getbbox("?")
+    draw.text((x + (size - bbox[2]) // 2, y + (size - bbox[3]) // 2), "?", font=FONT_LARGE, fill=(150, 150, 170, 255))
+    return sprite
 
 
 def parse_pokepaste(text):
@@ -150,17 +241,19 @@ def parse_pokepaste(text):
     return team
 
 
-def draw_team_block(pokemon, pill_max_width, width=1600, height=360):
+def draw_team_block(pokemon, pill_max_width, width=1600, height=360, sprite=None, icon=None):
+    """Draw one team member; `sprite` and `icon` come from `prefetch_assets`."""
     block = Image.new("RGBA", (width, height), (20, 20, 30, 255))
     draw = ImageDraw.Draw(block)
 
-    sprite = fetch_pokemon_sprite(pokemon["name"])
-    if sprite:
-        max_sprite_width = int(width * 0.22)
-        max_sprite_height = int(height * 0.75)
-        sprite.thumbnail((max_sprite_width, max_sprite_height), Image.Resampling.LANCZOS)
-        sprite_y = (height - sprite.height) // 2
-        block.paste(sprite, (int(width * 0.02), sprite_y), sprite)
+    max_sprite_width = int(width * 0.22)
+    max_sprite_height = int(height * 0.75)
+    if not sprite:
+        # Unknown name, failed or too slow: draw a placeholder instead
+        sprite = placeholder_sprite(int(max_sprite_height * 0.8), int(max_sprite_height * 0.8))
+    sprite.thumbnail((max_sprite_width, max_sprite_height), Image.Resampling.LANCZOS)
+    sprite_y = (height - sprite.height) // 2
+    block.paste(sprite, (int(width * 0.02), sprite_y), sprite)
 
 
 
@@ -174,7 +267,6 @@ def draw_team_block(pokemon, pill_max_width, width=1600, height=360):
     draw.text((name_x, name_y), name_text, font=FONT_LARGE, fill="white")
 
     # Draw item icon next to Pokémon name
-    icon = fetch_item_icon(pokemon["item"])
     if icon:
         icon_size = int(FONT_LARGE.size * 1.3)  # e.g. 30% bigger than text height
         icon = icon.resize((icon_size, icon_size), Image.Resampling.LANCZOS)
@@ -230,14 +322,26 @@ def draw_team_block(pokemon, pill_max_width, width=1600, height=360):
 
 def fetch_team(url):
     raw_url = url if url.endswith("/raw") else f"{url.rstrip('/')}/raw"
-    return parse_pokepaste(requests.get(raw_url).text)
+    return parse_pokepaste(requests.get(raw_url, timeout=HTTP_TIMEOUT).text)
 
 
-def generate_team_image(url, filename="team.png"):
-    team = fetch_team(url)
+def render_team(team):
+    """Encoded PNG of the image for a parsed team, and whether every asset resolved.
+
+    An incomplete image has placeholders for sprites or icons that failed
+    or were too slow, and shouldn't be cached.
+    """
     pill_max_width = get_team_max_pill_width(team)
     dynamic_width = get_required_team_width(team)
-    blocks = [draw_team_block(p, pill_max_width, width=int(dynamic_width), height=360) for p in team]
+    assets, complete = prefetch_assets(team)
+    blocks = [
+        draw_team_block(
+            p, pill_max_width, width=int(dynamic_width), height=360,
+            sprite=assets[("sprite", p["name"])],
+            icon=assets.get(("item", p["item"]))
+        )
+        for p in team
+    ]
 
     padding = 30
     block_width = blocks[0].width
@@ -250,7 +354,16 @@ def generate_team_image(url, filename="team.png"):
         img.paste(block, (0, y_offset))
         y_offset += block.height + padding
 
-    img.save(filename)
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue(), complete
+
+
+def generate_team_image(url, filename="team.png"):
+    team = fetch_team(url)
+    data, _ = render_team(team)
+    with open(filename, "wb") as f:
+        f.write(data)
     print(f"Saved team image to {filename}")
 
 
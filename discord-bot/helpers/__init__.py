@@ -1,26 +1,67 @@
 from .timezone_helper import get_timezones, country_to_timezone
-from .member_helper import discord_id_to_member, participant_id_to_member
+from .member_helper import discord_id_to_member, participant_id_to_member, discord_id_to_member_async, participant_id_to_member_async
 from .discord_helper import log_command_error
 from .embed_factory import EmbedFactory
-from .channel_management import ChannelFactory, ChannelManager, ChannelDestroyer
+from .channel_management import ChannelFactory, ChannelManager, ChannelDestroyer, ChannelSpec, ChannelResult, TeardownResult
 from .tournament_announcements import create_new_round_message, create_winner_message
 from .datetime_helper import convert_datetime, parse_duration_string, get_timeout_seconds
 from .command_logger import CommandLogger
+from .challonge_client import ChallongeClient, ChallongeError
+from .challonge_outbox import ChallongeOutboxWorker
+from .bracket_cache import BracketCache, BracketSnapshot
+from .bracket_engine import advance_match, prereq_fields
+from .tournament_state import TournamentState
+from .tournament_index import TournamentNameIndex
+from .name_index import FuzzyNameIndex
+from .search import search_pokemon, search_users
+from .bracket_sync import diff_bracket, apply_bracket_diff, import_bracket
+from .round_setup import RoundSetupJob, load_round_pairings
+from .db_offload import DbExecutor, db_executor, offload
+from .match_context import MatchContext, load_match_context, load_match_context_for_players, load_tournament_participant
 
 __all__ = [
     "get_timezones",
     "country_to_timezone",
     "discord_id_to_member",
     "participant_id_to_member",
+    "discord_id_to_member_async",
+    "participant_id_to_member_async",
     "log_command_error",
     "EmbedFactory",
     "ChannelFactory",
     "ChannelManager",
     "ChannelDestroyer",
+    "ChannelSpec",
+    "ChannelResult",
+    "TeardownResult",
     "create_new_round_message",
     "create_winner_message",
     "convert_datetime",
     "parse_duration_string",
     "get_timeout_seconds",
-    "CommandLogger"
+    "CommandLogger",
+    "ChallongeClient",
+    "ChallongeError",
+    "ChallongeOutboxWorker",
+    "BracketCache",
+    "BracketSnapshot",
+    "advance_match",
+    "prereq_fields",
+    "diff_bracket",
+    "apply_bracket_diff",
+    "import_bracket",
+    "TournamentState",
+    "TournamentNameIndex",
+    "FuzzyNameIndex",
+    "search_pokemon",
+    "search_users",
+    "MatchContext",
+    "load_match_context",
+    "load_match_context_for_players",
+    "load_tournament_participant",
+    "RoundSetupJob",
+    "load_round_pairings",
+    "DbExecutor",
+    "db_executor",
+    "offload",
 ]
@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+
+from typing import Any, Awaitable, Callable
+
+from .challonge_client import ChallongeClient
+
+log = logging.getLogger(__name__)
+
+
+class BracketSnapshot:
+    """In-memory copy of one Challonge bracket (matches and participants)."""
+
+    def __init__(self, slug: str, tournament: dict[str, Any]) -> None:
+        self.slug = slug
+        self.challonge_id = tournament.get("id")
+        self.state = tournament.get("state")
+        self.loaded_at = time.monotonic()
+
+        self.matches: dict[int, dict[str, Any]] = {
+            match["id"]: match for match in tournament.get("matches") or []
+            if isinstance(match, dict)
+        }
+        self.participants: dict[int, dict[str, Any]] = {
+            participant["id"]: participant for participant in tournament.get("participants") or []
+            if isinstance(participant, dict)
+        }
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+    def matches_for(self, participant_id) -> list[dict[str, Any]]:
+        return [
+            match for match in self.matches.values()
+            if participant_id is not None and participant_id in (match.get("player1_id"), match.get("player2_id"))
+        ]
+
+    def next_match(self, participant_id) -> dict[str, Any] | None:
+        for match in self.matches_for(participant_id):
+            if match.get("state") != "complete":
+                return match
+        return None
+
+    def current_match(self, participant_id) -> dict[str, Any] | None:
+        for match in self.matches_for(participant_id):
+            if match.get("state") == "open":
+                return match
+        return None
+
+    def participant_on_rank(self, rank) -> int | None:
+        for participant in self.participants.values():
+            if participant.get("final_rank") == rank:
+                return participant["id"]
+        return None
+
+    def apply_match(self, match: dict[str, Any]) -> None:
+        """Store an updated match and move its winner/loser the way Challonge does."""
+        match_id = match.get("id")
+        if match_id is None:
+            return
+
+        self.matches[match_id] = {**self.matches.get(match_id, {}), **match}
+        if match.get("state") != "complete":
+            return
+
+        winner_id = match.get("winner_id")
+        loser_id = match.get("loser_id")
+        if loser_id is None and winner_id is not None:
+            # Queued results only know the winner; the loser is the other player
+            stored = self.matches[match_id]
+            loser_id = next((player for player in (stored.get("player1_id"), stored.get("player2_id"))
+                             if player is not None and player != winner_id), None)
+            stored["loser_id"] = loser_id
+
+        for other in self.matches.values():
+            for slot in ("player1", "player2"):
+                if other.get(f"{slot}_prereq_match_id") != match_id:
+                    continue
+                is_loser_slot = other.get(f"{slot}_is_prereq_match_loser")
+                other[f"{slot}_id"] = loser_id if is_loser_slot else winner_id
+
+            if other.get("state") == "pending" and other.get("player1_id") and other.get("player2_id"):
+                other["state"] = "open"
+
+
+class BracketCache:
+    """Per-tournament bracket snapshots, loaded with one `tournaments.show` call.
+
+    Snapshots are kept current from our own `matches.update` results and are
+    only re-downloaded after `ttl` seconds or when a caller asks for a refresh.
+    Results that haven't reached Challonge yet come from `unsent_results(slug)`
+    (match dicts in the order they were reported) and are re-applied to every
+    download, so a reported match never shows as open again.
+    """
+
+    def __init__(self, client: ChallongeClient, ttl: float = 120.0,
+                 unsent_results: Callable[[str], Awaitable[list[dict[str, Any]]]] | None = None) -> None:
+        self.client = client
+        self.ttl = ttl
+        self.unsent_results = unsent_results
+        self._snapshots: dict[str, BracketSnapshot] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def _load(self, slug: str, overlay: bool) -> BracketSnapshot | None:
+        tournament = await self.client.tournaments.show(
+            slug, include_matches=1, include_participants=1)
+        if not isinstance(tournament, dict):
+            return None
+
+        snapshot = BracketSnapshot(slug, tournament)
+        if overlay and self.unsent_results:
+            for match in await self.unsent_results(slug):
+                snapshot.apply_match(match)
+        return snapshot
+
+    async def get(self, slug: str, *, refresh: bool = False, overlay: bool = True) -> BracketSnapshot | None:
+        """The bracket of `slug`, downloaded when missing, older than `ttl` or `refresh` is set.
+
+        `overlay=False` downloads the bracket exactly as Challonge has it,
+        without unsent results, and doesn't cache it.
+        """
+        if not overlay:
+            return await self._load(slug, overlay=False)
+
+        snapshot = self._snapshots.get(slug)
+        if snapshot and not refresh and snapshot.age < self.ttl:
+            return snapshot
+
+        lock = self._locks.setdefault(slug, asyncio.Lock())
+        async with lock:
+            # Another coroutine may have reloaded while we were waiting.
+            current = self._snapshots.get(slug)
+            if current and current is not snapshot and current.age < self.ttl:
+                return current
+
+            snapshot = await self._load(slug, overlay=True)
+            if not snapshot:
+                return None
+
+            self._snapshots[slug] = snapshot
+            log.info(f"[bracket_cache] Loaded {slug}: {len(snapshot.matches)} matches, {len(snapshot.participants)} participants")
+            return snapshot
+
+    def peek(self, slug: str) -> BracketSnapshot | None:
+        return self._snapshots.get(slug)
+
+    def apply_match(self, slug: str, match: Any) -> None:
+        snapshot = self._snapshots.get(slug)
+        if snapshot and isinstance(match, dict):
+            snapshot.apply_match(match)
+
+    def invalidate(self, slug: str | None = None) -> None:
+        if slug is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(slug, None)
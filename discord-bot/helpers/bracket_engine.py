@@ -0,0 +1,68 @@
+import sqlalchemy as sa
+
+from typing import Any
+from sqlalchemy import select
+from database.models import TournamentMatches
+
+
+def prereq_fields(challonge_match: dict[str, Any]) -> dict[str, Any]:
+    """Feeder-match columns for a `TournamentMatches` row, taken from a Challonge match."""
+    return {
+        "player1_prereq_match_id": challonge_match.get("player1_prereq_match_id"),
+        "player2_prereq_match_id": challonge_match.get("player2_prereq_match_id"),
+        "player1_is_prereq_loser": bool(challonge_match.get("player1_is_prereq_match_loser")),
+        "player2_is_prereq_loser": bool(challonge_match.get("player2_is_prereq_match_loser")),
+    }
+
+
+def loser_participant_id(match_row: TournamentMatches) -> int | None:
+    if not match_row.winner_participant_id:
+        return None
+    if match_row.winner_participant_id == match_row.participant1_id:
+        return match_row.participant2_id
+    return match_row.participant1_id
+
+
+def bracket_has_feeders(session, tournament_id: int) -> bool:
+    stmt = select(sa.exists().where(
+        TournamentMatches.tournament_id == tournament_id,
+        sa.or_(
+            TournamentMatches.player1_prereq_match_id.is_not(None),
+            TournamentMatches.player2_prereq_match_id.is_not(None),
+        )
+    ))
+    return bool(session.scalar(stmt))
+
+
+def advance_match(session, match_row: TournamentMatches) -> list[TournamentMatches] | None:
+    """Move the winner and loser of a completed match into the matches it feeds.
+
+    Runs inside the caller's session, so placement commits together with the
+    reported result. Returns the updated rows, or None when the tournament was
+    imported without feeder data and placement has to come from Challonge.
+    """
+    if not match_row.completed or not match_row.winner_participant_id:
+        return []
+
+    if not bracket_has_feeders(session, match_row.tournament_id):
+        return None
+
+    winner_id = match_row.winner_participant_id
+    loser_id = loser_participant_id(match_row)
+
+    stmt = select(TournamentMatches).where(
+        TournamentMatches.tournament_id == match_row.tournament_id,
+        sa.or_(
+            TournamentMatches.player1_prereq_match_id == match_row.challonge_id,
+            TournamentMatches.player2_prereq_match_id == match_row.challonge_id,
+        )
+    )
+    next_rows = session.scalars(stmt).all()
+
+    for row in next_rows:
+        if row.player1_prereq_match_id == match_row.challonge_id:
+            row.participant1_id = loser_id if row.player1_is_prereq_loser else winner_id
+        if row.player2_prereq_match_id == match_row.challonge_id:
+            row.participant2_id = loser_id if row.player2_is_prereq_loser else winner_id
+
+    return list(next_rows)
@@ -0,0 +1,124 @@
+from typing import Any, Collection
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from database.models import TournamentParticipants, TournamentMatches
+from .bracket_engine import prereq_fields
+
+
+def participant_map(session, tournament_id: int) -> dict[int, int]:
+    """Map every participant's challonge id to its `tournament_participants.id`."""
+    stmt = select(TournamentParticipants.challonge_id, TournamentParticipants.id).where(
+        TournamentParticipants.tournament_id == tournament_id,
+        TournamentParticipants.challonge_id.is_not(None)
+    )
+    return {challonge_id: participant_id for challonge_id, participant_id in session.execute(stmt)}
+
+
+def expected_columns(challonge_match: dict[str, Any], participants: dict[int, int]) -> dict[str, Any]:
+    """The `tournament_matches` values a Challonge match should produce."""
+    return {
+        "participant1_id": participants.get(challonge_match.get("player1_id")),
+        "participant2_id": participants.get(challonge_match.get("player2_id")),
+        "winner_participant_id": participants.get(challonge_match.get("winner_id")),
+        "score": challonge_match.get("scores_csv") or None,
+        "completed": challonge_match.get("state") == "complete",
+        **prereq_fields(challonge_match),
+    }
+
+
+def diff_bracket(session, tournament_id: int, challonge_matches: list[dict[str, Any]],
+                 skip: Collection[int] = ()) -> tuple[list[dict[str, Any]], list[int]]:
+    """Compare Challonge matches against `tournament_matches` with two queries.
+
+    Returns the rows that need updating (primary key plus every synced
+    column, ready for a bulk UPDATE) and the challonge ids of matches that
+    have no row in the database. Matches in `skip` are left out: their
+    local result hasn't reached Challonge yet, so Challonge is behind.
+    """
+    participants = participant_map(session, tournament_id)
+
+    stmt = select(TournamentMatches).where(TournamentMatches.tournament_id == tournament_id)
+    rows = {row.challonge_id: row for row in session.scalars(stmt)}
+
+    changes = []
+    missing = []
+    for match in challonge_matches:
+        if not isinstance(match, dict) or match["id"] in skip:
+            continue
+
+        row = rows.get(match["id"])
+        if not row:
+            missing.append(match["id"])
+            continue
+
+        expected = expected_columns(match, participants)
+        changed = {
+            column: (getattr(row, column), value)
+            for column, value in expected.items()
+            if getattr(row, column) != value
+        }
+        if changed:
+            changes.append({
+                "id": row.id,
+                "challonge_id": row.challonge_id,
+                "round": row.round,
+                "changed": changed,
+                "values": expected,
+            })
+
+    return changes, missing
+
+
+def apply_bracket_diff(session, changes: list[dict[str, Any]]) -> int:
+    """Write the rows returned by `diff_bracket` in one bulk UPDATE by primary key."""
+    if not changes:
+        return 0
+
+    session.execute(
+        update(TournamentMatches),
+        [{"id": change["id"], **change["values"]} for change in changes]
+    )
+    return len(changes)
+
+
+def import_bracket(session, tournament_id: int, challonge_matches: list[dict[str, Any]]) -> int:
+    """Insert every Challonge match of a tournament in one multi-row INSERT.
+
+    Re-running the import is idempotent: existing rows (`uq_tm_t_chid`) only
+    get their bracket placement refreshed, reported results are left alone.
+    """
+    participants = participant_map(session, tournament_id)
+
+    rows = [
+        {
+            "tournament_id": tournament_id,
+            "challonge_id": match["id"],
+            "round": match["round"],
+            "participant1_id": participants.get(match.get("player1_id")),
+            "participant2_id": participants.get(match.get("player2_id")),
+            **prereq_fields(match),
+        }
+        for match in challonge_matches
+        if isinstance(match, dict)
+    ]
+    if not rows:
+        return 0
+
+    stmt = pg_insert(TournamentMatches).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_tm_t_chid",
+        set_={
+            column: stmt.excluded[column]
+            for column in (
+                "round",
+                "participant1_id",
+                "participant2_id",
+                "player1_prereq_match_id",
+                "player2_prereq_match_id",
+                "player1_is_prereq_loser",
+                "player2_is_prereq_loser",
+            )
+        }
+    )
+    session.execute(stmt)
+    return len(rows)
@@ -0,0 +1,283 @@
+import asyncio
+import aiohttp
+import copy
+import json
+import logging
+import time
+
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+log = logging.getLogger(__name__)
+
+CHALLONGE_API_URL = "https://api.challonge.com/v1"
+
+
+class ChallongeError(Exception):
+    """Raised when Challonge answers with an error or cannot be reached."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _prepare_params(params: dict, prefix: str | None = None) -> list[tuple[str, str]]:
+    """Flatten keyword arguments into Challonge's `prefix[key]` form fields."""
+    prepared = []
+    for key, value in params.items():
+        if value is None:
+            continue
+
+        name = f"{prefix}[{key}]" if prefix else key
+
+        if isinstance(value, bool):
+            prepared.append((name, str(value).lower()))
+        elif isinstance(value, datetime):
+            prepared.append((name, value.isoformat()))
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                prepared.append((f"{name}[]", str(item)))
+        else:
+            prepared.append((name, str(value)))
+
+    return prepared
+
+
+def _unwrap(data: Any) -> Any:
+    """Strip Challonge's `{"match": {...}}` envelopes, including nested ones."""
+    if isinstance(data, list):
+        return [_unwrap(item) for item in data]
+
+    if isinstance(data, dict):
+        if len(data) == 1:
+            (key, value), = data.items()
+            if key in ("tournament", "match", "participant") and isinstance(value, dict):
+                return _unwrap(value)
+        return {key: _unwrap(value) for key, value in data.items()}
+
+    return data
+
+
+class _Resource:
+    def __init__(self, client: "ChallongeClient") -> None:
+        self.client = client
+
+
+class _Tournaments(_Resource):
+    async def show(self, tournament, **params):
+        return await self.client.fetch("GET", f"tournaments/{tournament}", **params)
+
+    async def create(self, name, url, tournament_type="single elimination", **params):
+        return await self.client.fetch(
+            "POST", "tournaments", "tournament",
+            name=name, url=url, tournament_type=tournament_type, **params)
+
+    async def destroy(self, tournament, **params):
+        return await self.client.fetch("DELETE", f"tournaments/{tournament}", **params)
+
+    async def start(self, tournament, **params):
+        return await self.client.fetch("POST", f"tournaments/{tournament}/start", **params)
+
+    async def finalize(self, tournament, **params):
+        return await self.client.fetch("POST", f"tournaments/{tournament}/finalize", **params)
+
+
+class _Matches(_Resource):
+    async def index(self, tournament, **params):
+        return await self.client.fetch("GET", f"tournaments/{tournament}/matches", **params)
+
+    async def show(self, tournament, match_id, **params):
+        return await self.client.fetch("GET", f"tournaments/{tournament}/matches/{match_id}", **params)
+
+    async def update(self, tournament, match_id, **params):
+        return await self.client.fetch(
+            "PUT", f"tournaments/{tournament}/matches/{match_id}", "match", **params)
+
+
+class _Participants(_Resource):
+    async def index(self, tournament, **params):
+        return await self.client.fetch("GET", f"tournaments/{tournament}/participants", **params)
+
+    async def create(self, tournament, name, **params):
+        return await self.client.fetch(
+            "POST", f"tournaments/{tournament}/participants", "participant", name=name, **params)
+
+    async def destroy(self, tournament, participant_id, **params):
+        return await self.client.fetch(
+            "DELETE", f"tournaments/{tournament}/participants/{participant_id}", **params)
+
+    async def randomize(self, tournament, **params):
+        return await self.client.fetch("POST", f"tournaments/{tournament}/participants/randomize", **params)
+
+
+class ChallongeScheduler:
+    """Rate limiting and request coalescing for all traffic of one client.
+
+    Requests are spaced to stay within `requests_per_second`; a 429 pauses
+    every request until Challonge's Retry-After has passed. Identical GETs
+    that are in flight at the same time share a single HTTP request.
+    """
+
+    def __init__(self, requests_per_second: float = 5.0) -> None:
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+        self._inflight: dict[Any, asyncio.Future] = {}
+        self.stats = {
+            "issued": 0,
+            "coalesced": 0,
+            "throttled": 0,
+            "rate_limited": 0,
+        }
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot, self._paused_until)
+            self._next_slot = start + self.interval
+
+        delay = start - now
+        if delay > 0:
+            self.stats["throttled"] += 1
+            await asyncio.sleep(delay)
+        self.stats["issued"] += 1
+
+    def pause(self, seconds: float) -> None:
+        self.stats["rate_limited"] += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    async def run(self, key, request: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `request`, or join an identical one already in flight when `key` is set."""
+        if key is None:
+            return await request()
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.stats["coalesced"] += 1
+            # Callers may mutate what they get back, so followers receive a copy.
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        future = asyncio.ensure_future(request())
+        self._inflight[key] = future
+        future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(future)
+
+
+class ChallongeClient:
+    """Asyncio Challonge API client mirroring pychallonge's module layout.
+
+    `client.matches.index(slug)` behaves like `challonge.matches.index(slug)`,
+    but runs over a pooled keep-alive aiohttp session instead of blocking the
+    event loop on `requests`.
+    """
+
+    def __init__(
+            self,
+            username: str,
+            api_key: str,
+            *,
+            timeout: float = 10.0,
+            pool_size: int = 10,
+            requests_per_second: float = 5.0,
+            max_retries: int = 3) -> None:
+        self.username = username
+        self.api_key = api_key
+        self.timeout = timeout
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.scheduler = ChallongeScheduler(requests_per_second)
+        self._session: aiohttp.ClientSession | None = None
+
+        self.tournaments = _Tournaments(self)
+        self.matches = _Matches(self)
+        self.participants = _Participants(self)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return dict(self.scheduler.stats)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the running event loop.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(self.username, self.api_key),
+                connector=aiohttp.TCPConnector(limit=self.pool_size, keepalive_timeout=30),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def fetch(self, method: str, uri: str, params_prefix: str | None = None, *, timeout: float | None = None, **params) -> Any:
+        prepared = _prepare_params(params, params_prefix)
+        key = (uri, tuple(sorted(prepared))) if method == "GET" else None
+        return await self.scheduler.run(key, lambda: self._request(method, uri, prepared, timeout))
+
+    async def _request(self, method: str, uri: str, prepared: list[tuple[str, str]], timeout: float | None) -> Any:
+        url = f"{CHALLONGE_API_URL}/{uri}.json"
+
+        request_kwargs: dict[str, Any] = {}
+        if method in ("POST", "PUT"):
+            request_kwargs["data"] = prepared
+        else:
+            request_kwargs["params"] = prepared
+        if timeout is not None:
+            request_kwargs["timeout"] = aiohttp.ClientTimeout(total=timeout)
+
+        for attempt in range(self.max_retries + 1):
+            await self.scheduler.acquire()
+            session = self._get_session()
+
+            try:
+                async with session.request(method, url, **request_kwargs) as response:
+                    if response.status == 429 and attempt < self.max_retries:
+                        retry_after = self._retry_after(response, attempt)
+                        log.info(f"[challonge] 429 on {method} {uri}; pausing {retry_after:.1f}s")
+                        self.scheduler.pause(retry_after)
+                        continue
+
+                    if response.status >= 400:
+                        raise ChallongeError(await self._error_message(response), status=response.status)
+
+                    body = await response.text()
+
+            except asyncio.TimeoutError as e:
+                raise ChallongeError(f"Challonge request timed out: {method} {uri}") from e
+            except aiohttp.ClientError as e:
+                raise ChallongeError(f"Challonge request failed: {e}") from e
+
+            break
+
+        if not body.strip():
+            return None
+
+        try:
+            payload = json.loads(body)
+        except ValueError as e:
+            raise ChallongeError(f"Challonge returned invalid JSON for {method} {uri}") from e
+
+        return _unwrap(payload)
+
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse, attempt: int) -> float:
+        try:
+            return max(float(response.headers.get("Retry-After", "")), 0.0)
+        except ValueError:
+            return float(2 ** attempt)
+
+    @staticmethod
+    async def _error_message(response: aiohttp.ClientResponse) -> str:
+        try:
+            payload = await response.json(content_type=None)
+        except (aiohttp.ContentTypeError, ValueError):
+            return f"HTTP {response.status}"
+
+        errors = payload.get("errors") if isinstance(payload, dict) else None
+        if isinstance(errors, list) and errors:
+            return "\n".join(str(error) for error in errors)
+
+        return f"HTTP {response.status}"
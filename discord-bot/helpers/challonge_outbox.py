@@ -0,0 +1,199 @@
+import asyncio
+import logging
+
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable
+from sqlalchemy import select, update, exists
+from sqlalchemy.orm import aliased
+from database.models import ChallongeOutbox, Tournament
+from .challonge_client import ChallongeClient, ChallongeError
+from .db_offload import DbExecutor, db_executor
+
+log = logging.getLogger(__name__)
+
+
+class ChallongeOutboxWorker:
+    """Pushes queued score updates from `challonge_outbox` to Challonge.
+
+    Commands write the result and an outbox row in the same transaction and
+    return; this worker sends the update afterwards with exponential backoff,
+    so a slow or failing Challonge never holds a database transaction open.
+    Its own queries run on `executor`, off the event loop.
+    """
+
+    def __init__(
+            self,
+            client: ChallongeClient,
+            executor: DbExecutor = db_executor,
+            on_failure: Callable[[ChallongeOutbox, str], Awaitable[None]] | None = None,
+            *,
+            max_attempts: int = 6,
+            base_delay: float = 5.0,
+            max_delay: float = 600.0,
+            batch_size: int = 20) -> None:
+        self.client = client
+        self.executor = executor
+        self.on_failure = on_failure
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.batch_size = batch_size
+        self._lock = asyncio.Lock()
+        self._kick_task: asyncio.Task | None = None
+
+    @staticmethod
+    def enqueue(session, tournament_id: int, challonge_match_id: int, scores_csv: str, winner_challonge_id: int | None) -> ChallongeOutbox:
+        entry = ChallongeOutbox(
+            tournament_id=tournament_id,
+            challonge_match_id=challonge_match_id,
+            scores_csv=scores_csv,
+            winner_challonge_id=winner_challonge_id
+        )
+        session.add(entry)
+        return entry
+
+    @staticmethod
+    def unsent(session, tournament_id: int, statuses: tuple[str, ...] = ("pending", "failed")) -> dict[int, str]:
+        """Challonge match ids whose reported result hasn't reached Challonge, with their outbox status."""
+        stmt = (
+            select(ChallongeOutbox.challonge_match_id, ChallongeOutbox.status)
+            .where(ChallongeOutbox.tournament_id == tournament_id, ChallongeOutbox.status.in_(statuses))
+            .order_by(ChallongeOutbox.id)
+        )
+        # A pending row outranks an older failed one for the same match
+        unsent = {}
+        for match_id, status in session.execute(stmt):
+            if unsent.get(match_id) != "pending":
+                unsent[match_id] = status
+        return unsent
+
+    @staticmethod
+    def unsent_results(session, slug: str) -> list[dict]:
+        """Results of `slug` that haven't reached Challonge, as match dicts in the order they were reported."""
+        stmt = (
+            select(ChallongeOutbox.challonge_match_id, ChallongeOutbox.scores_csv, ChallongeOutbox.winner_challonge_id)
+            .join(Tournament, Tournament.id == ChallongeOutbox.tournament_id)
+            .where(Tournament.slug == slug, ChallongeOutbox.status.in_(("pending", "failed")))
+            .order_by(ChallongeOutbox.id)
+        )
+        # The latest report of a match wins and takes that report's place in the order
+        results = {}
+        for match_id, scores_csv, winner_id in session.execute(stmt):
+            results.pop(match_id, None)
+            results[match_id] = {
+                "id": match_id,
+                "state": "complete",
+                "scores_csv": scores_csv,
+                "winner_id": winner_id,
+            }
+        return list(results.values())
+
+    @staticmethod
+    def resolve_failed(session, tournament_id: int) -> int:
+        """Mark failed rows as resolved once an admin has fixed the result on Challonge."""
+        result = session.execute(
+            update(ChallongeOutbox)
+            .where(ChallongeOutbox.tournament_id == tournament_id, ChallongeOutbox.status == "failed")
+            .values(status="resolved")
+        )
+        return result.rowcount
+
+    def kick(self) -> None:
+        """Drain right away instead of waiting for the next poll. Call after commit."""
+        if self._kick_task and not self._kick_task.done():
+            return
+        self._kick_task = asyncio.create_task(self.drain())
+
+    def _backoff(self, attempts: int) -> timedelta:
+        return timedelta(seconds=min(self.base_delay * (2 ** (attempts - 1)), self.max_delay))
+
+    def _load_batch(self, session) -> list:
+        earlier_failure = aliased(ChallongeOutbox)
+        stmt = (
+            select(ChallongeOutbox.id, ChallongeOutbox.challonge_match_id, ChallongeOutbox.scores_csv,
+                   ChallongeOutbox.winner_challonge_id, ChallongeOutbox.next_attempt_at, Tournament.slug)
+            .join(Tournament, Tournament.id == ChallongeOutbox.tournament_id)
+            .where(
+                ChallongeOutbox.status == "pending",
+                # Later results depend on the failed one; they wait until it's resolved
+                ~exists().where(
+                    earlier_failure.tournament_id == ChallongeOutbox.tournament_id,
+                    earlier_failure.status == "failed",
+                    earlier_failure.id < ChallongeOutbox.id
+                )
+            )
+            .order_by(ChallongeOutbox.id)
+            .limit(self.batch_size)
+        )
+        return [tuple(row) for row in session.execute(stmt)]
+
+    async def drain(self) -> int:
+        async with self._lock:
+            now = datetime.now(timezone.utc)
+            batch = await self.executor.run(self._load_batch)
+
+            sent = 0
+            blocked_slugs = set()
+            for entry_id, match_id, scores_csv, winner_id, next_attempt_at, slug in batch:
+                # Challonge only accepts a result once the feeding matches are in,
+                # so updates for one tournament are pushed strictly in order.
+                if slug in blocked_slugs:
+                    continue
+                if next_attempt_at > now:
+                    blocked_slugs.add(slug)
+                    continue
+
+                error = None
+                retryable = True
+                try:
+                    await self.client.matches.update(
+                        slug, match_id, scores_csv=scores_csv, winner_id=winner_id)
+                except ChallongeError as e:
+                    error = str(e)
+                    retryable = e.status is None or e.status == 429 or e.status >= 500
+
+                if error is None:
+                    sent += 1
+                else:
+                    # Retrying or failed for good, what comes after it can't go first
+                    blocked_slugs.add(slug)
+
+                await self._record_attempt(entry_id, error, retryable)
+
+            return sent
+
+    def _store_attempt(self, session, entry_id: int, error: str | None, retryable: bool) -> ChallongeOutbox | None:
+        """Book one attempt; returns the entry, detached, when it has now failed for good."""
+        entry = session.get(ChallongeOutbox, entry_id)
+        if not entry:
+            return None
+
+        entry.attempts += 1
+        if error is None:
+            entry.status = "sent"
+            entry.sent_at = datetime.now(timezone.utc)
+            entry.last_error = None
+            return None
+
+        entry.last_error = error
+        if retryable and entry.attempts < self.max_attempts:
+            entry.next_attempt_at = datetime.now(timezone.utc) + self._backoff(entry.attempts)
+            log.info(f"[challonge_outbox] Retrying match {entry.challonge_match_id} after attempt {entry.attempts}: {error}")
+            return None
+
+        entry.status = "failed"
+        session.flush()
+        session.expunge(entry)
+        return entry
+
+    async def _record_attempt(self, entry_id: int, error: str | None, retryable: bool) -> None:
+        failed_entry = await self.executor.run(self._store_attempt, entry_id, error, retryable)
+        if failed_entry is None:
+            return
+
+        log.info(f"[challonge_outbox] Giving up on match {failed_entry.challonge_match_id}: {error}")
+        if self.on_failure:
+            try:
+                await self.on_failure(failed_entry, error)
+            except Exception:
+                log.exception("[challonge_outbox] Failure callback raised")
@@ -1,54 +1,160 @@
+import asyncio
 import discord
 import logging
+import os
+
+from typing import Awaitable, Callable
 
 log = logging.getLogger(__name__)
 
 
-class ChannelFactory:
-    def __init__(self, bot) -> None:
-        self.bot = bot
+# Channel creation shares one route bucket per guild, so every factory draws
+# from the same budget instead of each caller picking its own concurrency.
+CHANNEL_CREATE_CONCURRENCY = int(os.getenv("CHANNEL_CREATE_CONCURRENCY", 4))
+_create_budget = asyncio.Semaphore(max(1, CHANNEL_CREATE_CONCURRENCY))
 
-    async def _base(self, guild: discord.Guild, users: list[discord.Member], name, category_id=None) -> discord.TextChannel | None:
-        channel_name = name
-        discord_category = None
-        text_channel = None
+MEMBER_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True, send_messages=True, read_message_history=True)
 
-        if not guild:
-            return None
 
-        if category_id:
-            discord_category = discord.utils.get(
-                guild.categories, id=category_id)
-            text_channel = await guild.create_text_channel(channel_name, category=discord_category)
-            for user in users:
-                await text_channel.set_permissions(user, view_channel=True, send_messages=True, read_message_history=True)
-        else:
-            return
+def _normalize_channel_name(name: str) -> str:
+    return name.strip().lower().replace(" ", "-")
 
-        return text_channel
 
-    async def tournament_match(self, guild: discord.Guild, users: list, category_id, match_round):
-        if len(users) != 2:
-            return False
+def channel_topic(**tags) -> str:
+    """Machine-readable channel topic (`key:value` pairs) used to find channels again later."""
+    return " ".join(f"{key}:{value}" for key, value in tags.items() if value is not None)
 
-        if not guild:
-            return None
 
-        discord_id1 = users[0].discord_id
-        discord_id2 = users[1].discord_id
+def channel_tags(channel: discord.TextChannel) -> dict[str, str]:
+    tags = {}
+    for token in (channel.topic or "").split():
+        key, sep, value = token.partition(":")
+        if sep:
+            tags[key] = value
+    return tags
 
-        discord_user1 = guild.get_member(discord_id1)
-        discord_user2 = guild.get_member(discord_id2)
 
-        if not discord_user1 or not discord_user2:
-            return None
+class ChannelSpec:
+    """A text channel to create: where it goes, who can see it and what to post first."""
+
+    def __init__(
+            self,
+            name: str,
+            members: list[discord.abc.Snowflake],
+            category_id: int,
+            *,
+            welcome: str | None = None,
+            topic: str | None = None,
+            overwrites: dict | None = None,
+            private: bool = False,
+            inherit_category: bool = True,
+            reuse_existing: bool = False) -> None:
+        self.name = name
+        self.members = members
+        self.category_id = category_id
+        self.welcome = welcome
+        self.topic = topic
+        self.overwrites = overwrites or {}
+        self.private = private
+        self.inherit_category = inherit_category
+        self.reuse_existing = reuse_existing
+
+
+class ChannelResult:
+    def __init__(self, spec: ChannelSpec, channel: discord.TextChannel | None = None, *, existed: bool = False, error: str | None = None) -> None:
+        self.spec = spec
+        self.channel = channel
+        self.existed = existed
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.channel is not None
+
 
-        discord_users = [discord_user1, discord_user2]
+class ChannelFactory:
+    def __init__(self, bot) -> None:
+        self.bot = bot
 
-        channel_name = f"{discord_user1.display_name}-vs-{discord_user2.display_name}"
-        text_channel = await self._base(guild, discord_users, channel_name, category_id)
-        if text_channel:
-            await text_channel.send(
+    @staticmethod
+    def _overwrites(guild: discord.Guild, category: discord.CategoryChannel, spec: ChannelSpec) -> dict:
+        # Same permissions a synced channel would get, plus the members
+        overwrites = dict(category.overwrites) if spec.inherit_category else {}
+        if spec.private:
+            overwrites[guild.default_role] = discord.PermissionOverwrite(view_channel=False)
+        for member in spec.members:
+            overwrites[member] = MEMBER_OVERWRITE
+        overwrites.update(spec.overwrites)
+        return overwrites
+
+    async def _create(self, guild: discord.Guild, spec: ChannelSpec) -> ChannelResult:
+        category = discord.utils.get(guild.categories, id=spec.category_id)
+        if not category:
+            return ChannelResult(spec, error=f"Category {spec.category_id} not found")
+
+        if spec.reuse_existing:
+            name = _normalize_channel_name(spec.name)
+            existing = discord.utils.find(
+                lambda channel: channel.name in (spec.name, name), guild.text_channels)
+            if existing:
+                log.info(f"Skipping channel creation. Reason: Channel {existing.name} already exists.")
+                return ChannelResult(spec, existing, existed=True)
+
+        options = {}
+        if spec.topic:
+            options["topic"] = spec.topic
+
+        async with _create_budget:
+            try:
+                text_channel = await guild.create_text_channel(
+                    spec.name,
+                    category=category,
+                    overwrites=self._overwrites(guild, category, spec),
+                    **options
+                )
+            except discord.HTTPException as e:
+                log.info(f"Failed to create channel {spec.name}: {e}")
+                return ChannelResult(spec, error=str(e))
+
+        if spec.welcome:
+            try:
+                await text_channel.send(spec.welcome)
+            except discord.HTTPException as e:
+                log.info(f"Failed to send welcome message in {text_channel.name}: {e}")
+
+        return ChannelResult(spec, text_channel)
+
+    async def create_channels(
+            self,
+            guild: discord.Guild,
+            specs: list[ChannelSpec],
+            on_result: Callable[[ChannelResult], Awaitable[None]] | None = None) -> list[ChannelResult]:
+        """Create every channel concurrently within the shared budget.
+
+        Each channel is created with its permission overwrites in one call.
+        Results come back in the order of `specs`; `on_result` is awaited as
+        each one finishes.
+        """
+        if not guild:
+            return [ChannelResult(spec, error="No guild") for spec in specs]
+
+        async def create(spec):
+            result = await self._create(guild, spec)
+            if on_result:
+                await on_result(result)
+            return result
+
+        return list(await asyncio.gather(*(create(spec) for spec in specs)))
+
+    @staticmethod
+    def match_spec(discord_user1: discord.Member, discord_user2: discord.Member, category_id, match_round, slug=None) -> ChannelSpec:
+        return ChannelSpec(
+            f"{discord_user1.display_name}-vs-{discord_user2.display_name}",
+            [discord_user1, discord_user2],
+            category_id,
+            topic=channel_topic(tournament=slug, round=match_round),
+            welcome=(
                 f"🎯 **Match Channel Created — Round {match_round}!**\n\n"
                 f"**{discord_user1.mention}** 🆚 **{discord_user2.mention}**\n\n"
                 "📅 **Step 1 — Propose a match time:**\n"
@@ -66,42 +172,92 @@ class ChannelFactory:
                 "```/report_win winner:<@winner> video_link:<link>```\n\n"
                 "Good luck to both trainers — may the best one win! ⚔️"
             )
+        )
+
+    @staticmethod
+    def reward_spec(discord_user: discord.Member, category_id, slug) -> ChannelSpec:
+        return ChannelSpec(
+            f"{discord_user.display_name}-reward-{slug}",
+            [discord_user],
+            category_id,
+            topic=channel_topic(tournament=slug, reward=discord_user.id),
+            welcome=(
+                f"🎉 Thank you for participating {discord_user.mention}! "
+                "This is your reward channel. A staff member will contact you shortly."
+            )
+        )
 
-            return text_channel.name
+    async def tournament_match(self, guild: discord.Guild, users: list, category_id, match_round):
+        if len(users) != 2:
+            return False
+
+        if not guild:
+            return None
+
+        discord_id1 = users[0].discord_id
+        discord_id2 = users[1].discord_id
+
+        discord_user1 = guild.get_member(discord_id1)
+        discord_user2 = guild.get_member(discord_id2)
+
+        if not discord_user1 or not discord_user2:
+            return None
 
-        return None
+        return await self.tournament_match_for_members(guild, discord_user1, discord_user2, category_id, match_round)
 
-    async def tournament_rewards(self, guild: discord.Guild, users: list, category_id, slug) -> int:
+    async def tournament_match_for_members(self, guild: discord.Guild, discord_user1: discord.Member, discord_user2: discord.Member, category_id, match_round):
+        [result] = await self.create_channels(
+            guild, [self.match_spec(discord_user1, discord_user2, category_id, match_round)])
+        return result.channel.name if result.ok else None
+
+    async def tournament_rewards(self, guild: discord.Guild, participants: list, category_id, slug) -> int:
+        """Make sure every participant has a reward channel; returns how many are ready.
+
+        A channel id stored on the participant is trusted as long as the
+        channel still exists. Otherwise the channel is looked up by name in an
+        index built once per call, and only the missing ones are created
+        (concurrently). New ids are written to `participant.reward_channel_id`;
+        the caller's transaction persists them.
+        """
         if not guild:
-            return
+            return 0
 
-        text_channels = []
+        ready = 0
+        by_name: dict[str, discord.TextChannel] | None = None
+        specs = []
+        owners = []
+
+        for participant in participants:
+            if participant.reward_channel_id and guild.get_channel(participant.reward_channel_id):
+                ready += 1
+                continue
 
-        for user in users:
-            discord_user = guild.get_member(user.discord_id)
+            discord_user = guild.get_member(participant.user_link.discord_id)
             if not discord_user:
                 continue
 
-            channel_name = f"{discord_user.display_name}-reward-{slug}"
+            spec = self.reward_spec(discord_user, category_id, slug)
 
-            existing_channel = discord.utils.get(
-                guild.text_channels, name=channel_name)
-            if existing_channel:
-                text_channels.append(existing_channel)
+            if by_name is None:
+                by_name = {channel.name: channel for channel in guild.text_channels}
+            existing = by_name.get(spec.name) or by_name.get(_normalize_channel_name(spec.name))
+            if existing:
                 log.info(
-                    f"Skipping channel creation. Reason: Reward Channel already exists for user {user.username}.")
+                    f"Skipping channel creation. Reason: Reward Channel already exists for user {participant.user_link.username}.")
+                participant.reward_channel_id = existing.id
+                ready += 1
                 continue
 
-            text_channel = await self._base(guild, [discord_user], channel_name, category_id)
+            specs.append(spec)
+            owners.append(participant)
 
-            if text_channel:
-                await text_channel.send(
-                    f"🎉 Thank you for participating {discord_user.mention}! "
-                    "This is your reward channel. A staff member will contact you shortly."
-                )
-                text_channels.append(text_channel)
+        results = await self.create_channels(guild, specs)
+        for participant, result in zip(owners, results):
+            if result.ok:
+                participant.reward_channel_id = result.channel.id
+                ready += 1
 
-        return len(text_channels)
+        return ready
 
 
 class ChannelManager:
@@ -130,9 +286,32 @@ class ChannelManager:
         return channel_names
 
 
+class TeardownResult:
+    def __init__(self) -> None:
+        self.deleted = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: list[str] = []
+
+    def __repr__(self) -> str:
+        return f"<TeardownResult(deleted={self.deleted}, skipped={self.skipped}, failed={self.failed})>"
+
+
+def _retry_after(error: discord.HTTPException) -> float:
+    headers = getattr(error.response, "headers", None) or {}
+    for header in ("X-RateLimit-Reset-After", "Retry-After"):
+        try:
+            return float(headers[header])
+        except (KeyError, TypeError, ValueError):
+            continue
+    return 1.0
+
+
 class ChannelDestroyer:
-    def __init__(self, bot) -> None:
+    def __init__(self, bot, concurrency: int = 4, max_retries: int = 3) -> None:
         self.bot = bot
+        self.concurrency = concurrency
+        self.max_retries = max_retries
 
     async def __get_category_channels(self, guild: discord.Guild, category_id) -> list:
         if not guild:
@@ -146,8 +325,55 @@ class ChannelDestroyer:
 
         return channels
 
-    async def delete_channels(self, guild: discord.Guild, category_id):
-        channels = await self.__get_category_channels(guild, category_id)
-        for channel in channels:
-            if isinstance(channel, discord.TextChannel):
-                await channel.delete()
+    @staticmethod
+    def _matches(channel: discord.TextChannel, slug, match_round) -> bool:
+        if slug is None and match_round is None:
+            return True
+
+        tags = channel_tags(channel)
+        if slug is not None:
+            # Reward channels from before topics were set carry the slug in their name
+            if tags.get("tournament") != slug and not channel.name.endswith(f"-{slug}"):
+                return False
+        if match_round is not None and tags.get("round") != str(match_round):
+            return False
+        return True
+
+    async def _delete(self, channel: discord.TextChannel, semaphore: asyncio.Semaphore, result: TeardownResult) -> None:
+        async with semaphore:
+            for attempt in range(self.max_retries + 1):
+                try:
+                    await channel.delete()
+                    result.deleted += 1
+                    return
+                except discord.NotFound:
+                    result.skipped += 1
+                    return
+                except discord.HTTPException as e:
+                    if e.status == 429 and attempt < self.max_retries:
+                        await asyncio.sleep(_retry_after(e))
+                        continue
+                    log.info(f"Failed to delete channel {channel.name}: {e}")
+                    result.failed += 1
+                    result.errors.append(f"{channel.name}: {e}")
+                    return
+
+    async def delete_channels(self, guild: discord.Guild, category_id, *, slug=None, match_round=None) -> TeardownResult:
+        """Delete the text channels of a category, optionally only one tournament's or round's.
+
+        Deletes run concurrently; a failing channel is counted and the rest
+        still go through.
+        """
+        result = TeardownResult()
+        targets = []
+        for channel in await self.__get_category_channels(guild, category_id):
+            if isinstance(channel, discord.TextChannel) and self._matches(channel, slug, match_round):
+                targets.append(channel)
+            else:
+                result.skipped += 1
+
+        semaphore = asyncio.Semaphore(max(1, self.concurrency))
+        await asyncio.gather(*(self._delete(channel, semaphore, result) for channel in targets))
+
+        log.info(f"Channel teardown in category {category_id} (slug={slug}, round={match_round}): {result}")
+        return result
@@ -0,0 +1,147 @@
+import asyncio
+import functools
+import logging
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from database.database import Session
+
+log = logging.getLogger(__name__)
+
+DB_EXECUTOR_WORKERS = int(os.getenv("DB_EXECUTOR_WORKERS", 4))
+# Units of work slower than this (seconds, queue wait excluded) are logged
+DB_SLOW_UNIT_SECONDS = float(os.getenv("DB_SLOW_UNIT_SECONDS", 1.0))
+
+
+class UnitTiming:
+    __slots__ = ("calls", "errors", "total", "max", "waited")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.waited = 0.0
+
+
+class DbExecutor:
+    """Bounded thread pool for blocking `Session` work called from coroutines.
+
+    Each unit of work is a plain function taking a session as its first
+    argument; it runs inside its own `Session.begin()` on a worker thread
+    while the event loop keeps serving the gateway. Units must not touch
+    Discord and should return plain values: objects are expired once the
+    transaction commits.
+    """
+
+    def __init__(self, max_workers: int = DB_EXECUTOR_WORKERS, session_factory=Session) -> None:
+        self.max_workers = max_workers
+        self.session_factory = session_factory
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-offload")
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.running = 0
+        self.peak_in_flight = 0
+        # Submissions that found every worker busy and had to queue
+        self.saturated = 0
+        self.timings: dict[str, UnitTiming] = {}
+
+    def _record(self, name: str, waited: float, elapsed: float, ok: bool) -> None:
+        with self._lock:
+            timing = self.timings.setdefault(name, UnitTiming())
+            timing.calls += 1
+            timing.errors += not ok
+            timing.total += elapsed
+            timing.max = max(timing.max, elapsed)
+            timing.waited += waited
+
+        if elapsed > DB_SLOW_UNIT_SECONDS:
+            log.warning(f"[db_offload] {name} took {elapsed:.2f}s (queued {waited * 1000:.0f} ms)")
+
+    def _done(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    async def _submit(self, name: str, fn, args, kwargs):
+        submitted = time.perf_counter()
+
+        def work():
+            started = time.perf_counter()
+            with self._lock:
+                self.running += 1
+            ok = False
+            try:
+                with self.session_factory.begin() as session:
+                    result = fn(session, *args, **kwargs)
+                ok = True
+                return result
+            finally:
+                with self._lock:
+                    self.running -= 1
+                self._record(name, started - submitted, time.perf_counter() - started, ok)
+
+        with self._lock:
+            if self.in_flight >= self.max_workers:
+                self.saturated += 1
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        # The done callback also fires when a queued unit is cancelled before it ran
+        future = self._executor.submit(work)
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    async def run(self, fn, /, *args, **kwargs):
+        """Run `fn(session, *args, **kwargs)` in the pool and return its result."""
+        return await self._submit(fn.__qualname__, fn, args, kwargs)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "running": self.running,
+                "queued": max(self.in_flight - self.running, 0),
+                "utilization": self.running / self.max_workers,
+                "peak_in_flight": self.peak_in_flight,
+                "saturated": self.saturated,
+                "units": {
+                    name: {
+                        "calls": timing.calls,
+                        "errors": timing.errors,
+                        "avg_ms": timing.total / timing.calls * 1000,
+                        "max_ms": timing.max * 1000,
+                        "avg_wait_ms": timing.waited / timing.calls * 1000,
+                    }
+                    for name, timing in self.timings.items()
+                },
+            }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+db_executor = DbExecutor()
+
+
+def offload(fn=None, *, name: str | None = None):
+    """Turn `def unit(session, ...)` into `async def unit(...)` that runs on `db_executor`.
+
+        @offload
+        def load_scores(session, tournament_id):
+            ...
+
+        scores = await load_scores(tournament_id)
+    """
+
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            return await db_executor._submit(label, fn, args, kwargs)
+
+        return wrapper
+
+    return decorate(fn) if fn is not None else decorate
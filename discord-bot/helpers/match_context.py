@@ -0,0 +1,132 @@
+import sqlalchemy as sa
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased, contains_eager
+from database.models import Tournament, TournamentParticipants, TournamentMatches, User
+
+
+class MatchContext:
+    """A tournament match together with its tournament, both participants and both users.
+
+    Everything is loaded by one joined query, so reading any of the
+    attributes below never goes back to the database.
+    """
+
+    def __init__(self, match: TournamentMatches) -> None:
+        self.match = match
+        self.tournament: Tournament = match.tournament_link
+        self.participant1: TournamentParticipants | None = match.participant1_link
+        self.participant2: TournamentParticipants | None = match.participant2_link
+        self.user1: User | None = self.participant1.user_link if self.participant1 else None
+        self.user2: User | None = self.participant2.user_link if self.participant2 else None
+
+    @property
+    def participants(self) -> list[TournamentParticipants]:
+        return [p for p in (self.participant1, self.participant2) if p]
+
+    @property
+    def users(self) -> list[User]:
+        return [u for u in (self.user1, self.user2) if u]
+
+    def participant_for(self, discord_id: int) -> TournamentParticipants | None:
+        if self.user1 and self.user1.discord_id == discord_id:
+            return self.participant1
+        if self.user2 and self.user2.discord_id == discord_id:
+            return self.participant2
+        return None
+
+    def user_for(self, discord_id: int) -> User | None:
+        for user in self.users:
+            if user.discord_id == discord_id:
+                return user
+        return None
+
+    def opponent_of(self, participant: TournamentParticipants) -> TournamentParticipants | None:
+        if participant is self.participant1:
+            return self.participant2
+        if participant is self.participant2:
+            return self.participant1
+        return None
+
+    def score_for(self, winning_participant: TournamentParticipants) -> str:
+        return "1-0" if winning_participant is self.participant1 else "0-1"
+
+
+def _match_context_stmt(p1, p2, u1, u2):
+    return (
+        select(TournamentMatches)
+        .join(TournamentMatches.tournament_link)
+        .outerjoin(p1, TournamentMatches.participant1_link.of_type(p1))
+        .outerjoin(u1, p1.user_link.of_type(u1))
+        .outerjoin(p2, TournamentMatches.participant2_link.of_type(p2))
+        .outerjoin(u2, p2.user_link.of_type(u2))
+        .options(
+            contains_eager(TournamentMatches.tournament_link),
+            contains_eager(TournamentMatches.participant1_link.of_type(p1))
+            .contains_eager(p1.user_link.of_type(u1)),
+            contains_eager(TournamentMatches.participant2_link.of_type(p2))
+            .contains_eager(p2.user_link.of_type(u2)),
+        )
+    )
+
+
+def _aliases():
+    return (
+        aliased(TournamentParticipants),
+        aliased(TournamentParticipants),
+        aliased(User),
+        aliased(User),
+    )
+
+
+def load_match_context(session, tournament_id: int, challonge_match_id: int) -> MatchContext | None:
+    """Load the match with this challonge id in a tournament."""
+    p1, p2, u1, u2 = _aliases()
+    stmt = _match_context_stmt(p1, p2, u1, u2).where(
+        TournamentMatches.tournament_id == tournament_id,
+        TournamentMatches.challonge_id == challonge_match_id,
+    )
+    match = session.scalars(stmt).first()
+    return MatchContext(match) if match else None
+
+
+def load_match_context_for_players(session, slug: str, discord_id1: int, discord_id2: int, only_unfinished: bool = True) -> MatchContext | None:
+    """Load the match between two Discord users in a tournament, in either slot order."""
+    p1, p2, u1, u2 = _aliases()
+    conditions = [
+        Tournament.slug == slug,
+        sa.or_(
+            sa.and_(u1.discord_id == discord_id1, u2.discord_id == discord_id2),
+            sa.and_(u1.discord_id == discord_id2, u2.discord_id == discord_id1),
+        )
+    ]
+    if only_unfinished:
+        conditions.append(TournamentMatches.completed.is_(False))
+
+    stmt = (
+        _match_context_stmt(p1, p2, u1, u2)
+        .where(*conditions)
+        # An open match first, otherwise the latest one they played
+        .order_by(TournamentMatches.completed, TournamentMatches.id.desc())
+        .limit(1)
+    )
+    match = session.scalars(stmt).first()
+    return MatchContext(match) if match else None
+
+
+def load_tournament_participant(session, slug: str, discord_id: int) -> TournamentParticipants | None:
+    """Load a Discord user's participant row with its tournament and user attached."""
+    stmt = (
+        select(TournamentParticipants)
+        .join(TournamentParticipants.tournament_link)
+        .join(TournamentParticipants.user_link)
+        .options(
+            contains_eager(TournamentParticipants.tournament_link),
+            contains_eager(TournamentParticipants.user_link),
+        )
+        .where(
+            Tournament.slug == slug,
+            User.discord_id == discord_id,
+        )
+    )
+    return session.scalars(stmt).first()
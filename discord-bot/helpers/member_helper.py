@@ -2,18 +2,35 @@ from sqlalchemy import select
 from database.models import User, TournamentParticipants
 
 
-def discord_id_to_member(session, discord_id):
-    stmt = select(User).where(User.discord_id == discord_id)
-    return session.scalars(stmt).first()
+def _member_by_discord_id(discord_id, *options):
+    return select(User).where(User.discord_id == discord_id).options(*options)
 
 
-def participant_id_to_member(session, tournament_id, participant_id):
-    stmt = (
+def _member_by_participant_id(tournament_id, participant_id, *options):
+    return (
         select(User)
         .join(TournamentParticipants, TournamentParticipants.user_id == User.id)
         .where(
             TournamentParticipants.tournament_id == tournament_id,
             TournamentParticipants.id == participant_id
         )
+        .options(*options)
     )
-    return session.scalars(stmt).first()
\ No newline at end of file
+
+
+def discord_id_to_member(session, discord_id, *options):
+    return session.scalars(_member_by_discord_id(discord_id, *options)).first()
+
+
+def participant_id_to_member(session, tournament_id, participant_id, *options):
+    return session.scalars(_member_by_participant_id(tournament_id, participant_id, *options)).first()
+
+
+async def discord_id_to_member_async(session, discord_id, *options):
+    """`discord_id_to_member` for an AsyncSession; pass loader options for relationships you read."""
+    return (await session.scalars(_member_by_discord_id(discord_id, *options))).first()
+
+
+async def participant_id_to_member_async(session, tournament_id, participant_id, *options):
+    """`participant_id_to_member` for an AsyncSession."""
+    return (await session.scalars(_member_by_participant_id(tournament_id, participant_id, *options))).first()
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Iterable
+
+# Discord rejects autocomplete responses with more choices than this
+MAX_CHOICES = 25
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams of each word, padded the way pg_trgm pads them."""
+    grams = set()
+    for word in text.lower().split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+class FuzzyNameIndex:
+    """In-memory name lookup for autocomplete: prefix, substring, then typo-tolerant matches.
+
+    Names are keyed by id so renames and removals are cheap. Fuzzy matching
+    scores candidates by trigram similarity (shared / union), the same
+    measure pg_trgm uses.
+    """
+
+    def __init__(self, min_similarity: float = 0.3) -> None:
+        self.min_similarity = min_similarity
+        self._names: dict[int, str] = {}
+        self._grams: dict[int, set[str]] = {}
+        self._postings: dict[str, set[int]] = defaultdict(set)
+        self._sorted: list[tuple[str, int]] = []
+        self.loaded = False
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def load(self, rows: Iterable[tuple[int, str]]) -> None:
+        self._names.clear()
+        self._grams.clear()
+        self._postings.clear()
+        for key, name in rows:
+            self._insert(key, name)
+        self._sorted = sorted((name.lower(), key) for key, name in self._names.items())
+        self.loaded = True
+
+    def _insert(self, key: int, name: str) -> None:
+        grams = trigrams(name)
+        self._names[key] = name
+        self._grams[key] = grams
+        for gram in grams:
+            self._postings[gram].add(key)
+
+    def add(self, key: int, name: str) -> None:
+        """Add a name, or replace the name stored under `key`."""
+        self.remove(key)
+        self._insert(key, name)
+        entry = (name.lower(), key)
+        self._sorted.insert(bisect_left(self._sorted, entry), entry)
+
+    def remove(self, key: int) -> None:
+        name = self._names.pop(key, None)
+        if name is None:
+            return
+        for gram in self._grams.pop(key, ()):
+            postings = self._postings.get(gram)
+            if postings:
+                postings.discard(key)
+                if not postings:
+                    del self._postings[gram]
+        entry = (name.lower(), key)
+        i = bisect_left(self._sorted, entry)
+        if i < len(self._sorted) and self._sorted[i] == entry:
+            del self._sorted[i]
+
+    def _similar(self, needle: str) -> list[tuple[float, int]]:
+        query = trigrams(needle)
+        if not query:
+            return []
+
+        shared: dict[int, int] = defaultdict(int)
+        for gram in query:
+            for key in self._postings.get(gram, ()):
+                shared[key] += 1
+
+        scored = []
+        for key, count in shared.items():
+            similarity = count / (len(query) + len(self._grams[key]) - count)
+            if similarity >= self.min_similarity:
+                scored.append((similarity, key))
+        scored.sort(key=lambda item: (-item[0], self._names[item[1]].lower()))
+        return scored
+
+    def search(self, current: str, limit: int = MAX_CHOICES) -> list[str]:
+        needle = (current or "").strip().lower()
+        if not needle:
+            return [self._names[key] for _, key in self._sorted[:limit]]
+
+        results: list[int] = []
+        seen: set[int] = set()
+
+        def take(key: int) -> bool:
+            if key not in seen:
+                seen.add(key)
+                results.append(key)
+            return len(results) >= limit
+
+        # Prefix matches straight from the sorted list
+        i = bisect_left(self._sorted, (needle, -1))
+        while i < len(self._sorted) and self._sorted[i][0].startswith(needle):
+            if take(self._sorted[i][1]):
+                return [self._names[key] for key in results]
+            i += 1
+
+        for lowered, key in self._sorted:
+            if needle in lowered and take(key):
+                return [self._names[key] for key in results]
+
+        for _, key in self._similar(needle):
+            if take(key):
+                break
+
+        return [self._names[key] for key in results]
+
+    def resolve(self, name: str) -> str | None:
+        """The stored name `name` most likely refers to: exact (any case), else the closest match."""
+        needle = (name or "").strip().lower()
+        if not needle:
+            return None
+
+        i = bisect_left(self._sorted, (needle, -1))
+        if i < len(self._sorted) and self._sorted[i][0] == needle:
+            return self._names[self._sorted[i][1]]
+
+        similar = self._similar(needle)
+        return self._names[similar[0][1]] if similar else None
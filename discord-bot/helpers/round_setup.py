@@ -0,0 +1,140 @@
+import logging
+import time
+
+import discord
+
+from sqlalchemy import select
+from sqlalchemy.orm import aliased
+from database.models import TournamentParticipants, TournamentMatches, User
+from .channel_management import ChannelFactory, ChannelResult
+
+log = logging.getLogger(__name__)
+
+
+def load_round_pairings(session, tournament_id: int, rounds: list[int]):
+    """Discord ids of both players for every match in `rounds`, in one query.
+
+    Rows are plain values (round, challonge_id, discord_id1, discord_id2), so
+    they stay usable after the session is closed.
+    """
+    p1 = aliased(TournamentParticipants)
+    p2 = aliased(TournamentParticipants)
+    u1 = aliased(User)
+    u2 = aliased(User)
+
+    stmt = (
+        select(
+            TournamentMatches.round,
+            TournamentMatches.challonge_id,
+            u1.discord_id.label("discord_id1"),
+            u2.discord_id.label("discord_id2"),
+        )
+        .select_from(TournamentMatches)
+        .outerjoin(p1, p1.id == TournamentMatches.participant1_id)
+        .outerjoin(u1, u1.id == p1.user_id)
+        .outerjoin(p2, p2.id == TournamentMatches.participant2_id)
+        .outerjoin(u2, u2.id == p2.user_id)
+        .where(
+            TournamentMatches.tournament_id == tournament_id,
+            TournamentMatches.round.in_(rounds),
+        )
+        .order_by(TournamentMatches.id)
+    )
+    return session.execute(stmt).all()
+
+
+class RoundSetupJob:
+    """Creates the match channels of a round concurrently and reports progress.
+
+    Channels go through `ChannelFactory.create_channels`, which bounds how
+    many are created at once. The progress embed is edited at most every
+    `progress_interval` seconds.
+    """
+
+    def __init__(
+            self,
+            channel_factory: ChannelFactory,
+            guild: discord.Guild,
+            pairings: list,
+            category_id: int,
+            *,
+            title: str,
+            slug: str | None = None,
+            progress_channel: discord.abc.Messageable | None = None,
+            progress_interval: float = 2.0) -> None:
+        self.channel_factory = channel_factory
+        self.guild = guild
+        self.pairings = pairings
+        self.category_id = category_id
+        self.title = title
+        self.slug = slug
+        self.progress_channel = progress_channel
+        self.progress_interval = progress_interval
+
+        self.created = 0
+        self.skipped = 0
+        self.failed = 0
+        self._message: discord.Message | None = None
+        self._last_edit = 0.0
+
+    @property
+    def done(self) -> int:
+        return self.created + self.skipped + self.failed
+
+    def _embed(self, finished: bool = False) -> discord.Embed:
+        total = len(self.pairings)
+        color = discord.Color.green() if finished and not self.failed else (
+            discord.Color.orange() if finished else discord.Color.blurple())
+        embed = discord.Embed(
+            title=f"{'✅' if finished else '⏳'} {self.title}",
+            description=f"Match channels: **{self.done}/{total}**",
+            color=color
+        )
+        embed.add_field(name="Created", value=str(self.created), inline=True)
+        embed.add_field(name="Skipped", value=str(self.skipped), inline=True)
+        embed.add_field(name="Failed", value=str(self.failed), inline=True)
+        embed.timestamp = discord.utils.utcnow()
+        return embed
+
+    async def _report(self, finished: bool = False) -> None:
+        if not self.progress_channel:
+            return
+
+        now = time.monotonic()
+        if not finished and self._message and now - self._last_edit < self.progress_interval:
+            return
+        self._last_edit = now
+
+        try:
+            if self._message is None:
+                self._message = await self.progress_channel.send(embed=self._embed(finished))
+            else:
+                await self._message.edit(embed=self._embed(finished))
+        except discord.HTTPException as e:
+            log.info(f"[round_setup] Could not update progress embed: {e}")
+
+    async def _on_result(self, result: ChannelResult) -> None:
+        if result.ok:
+            self.created += 1
+        else:
+            self.failed += 1
+        await self._report()
+
+    async def run(self) -> int:
+        """Create every channel and return how many were created."""
+        specs = []
+        for match_round, challonge_id, discord_id1, discord_id2 in self.pairings:
+            discord_user1 = self.guild.get_member(discord_id1) if discord_id1 else None
+            discord_user2 = self.guild.get_member(discord_id2) if discord_id2 else None
+            if not discord_user1 or not discord_user2:
+                log.info(f"[round_setup] Skipping match {challonge_id}: players {discord_id1}, {discord_id2}")
+                self.skipped += 1
+                continue
+            specs.append(ChannelFactory.match_spec(discord_user1, discord_user2, self.category_id, match_round, self.slug))
+
+        await self._report()
+        await self.channel_factory.create_channels(self.guild, specs, on_result=self._on_result)
+        await self._report(finished=True)
+
+        log.info(f"[round_setup] {self.title}: created={self.created}, skipped={self.skipped}, failed={self.failed}")
+        return self.created
@@ -0,0 +1,44 @@
+import sqlalchemy as sa
+
+from sqlalchemy import select
+from database.models import Pokemon, User
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _similarity_search(session, column, term: str, *conditions, limit: int = 25):
+    """Rows ranked by trigram similarity of `column` to `term`.
+
+    Both the `%` similarity operator and the substring ILIKE are served by
+    the column's gin_trgm_ops index (see migration d27a9c4e8b13), so this
+    stays an index scan where a plain leading-wildcard ILIKE seq-scans.
+    """
+    term = (term or "").strip()
+    if not term:
+        return []
+
+    entity = column.class_
+    score = sa.func.similarity(column, term).label("score")
+    stmt = (
+        select(entity, score)
+        .where(
+            sa.or_(
+                column.op("%")(term),
+                column.ilike(f"%{_escape_like(term)}%", escape="\\"),
+            ),
+            *conditions
+        )
+        .order_by(score.desc(), column)
+        .limit(limit)
+    )
+    return session.execute(stmt).all()
+
+
+def search_pokemon(session, term: str, *conditions, limit: int = 25) -> list[Pokemon]:
+    return [row[0] for row in _similarity_search(session, Pokemon.name, term, *conditions, limit=limit)]
+
+
+def search_users(session, term: str, *conditions, limit: int = 25) -> list[tuple[User, float]]:
+    return [(row[0], row[1]) for row in _similarity_search(session, User.username, term, *conditions, limit=limit)]
@@ -0,0 +1,82 @@
+import logging
+
+from sqlalchemy import select
+from database.models import Tournament
+
+log = logging.getLogger(__name__)
+
+# Discord rejects autocomplete responses with more choices than this
+MAX_CHOICES = 25
+
+
+class TournamentIndexEntry:
+    __slots__ = ("name", "slug", "ongoing", "finished", "_keys")
+
+    def __init__(self, name: str, slug: str, ongoing: bool, finished: bool) -> None:
+        self.name = name
+        self.slug = slug
+        self.ongoing = bool(ongoing)
+        self.finished = finished
+        self._keys = (name.lower(), slug.lower())
+
+    def rank(self, needle: str) -> int | None:
+        """0 for a prefix match on name or slug, 1 for a substring match, None otherwise."""
+        if not needle:
+            return 0
+        if any(key.startswith(needle) for key in self._keys):
+            return 0
+        if any(needle in key for key in self._keys):
+            return 1
+        return None
+
+
+class TournamentNameIndex:
+    """Tournament names and slugs kept in memory for autocomplete.
+
+    Loaded with one query on first use; commands that create, delete, start
+    or end a tournament call `invalidate()` after committing and the next
+    keystroke reloads.
+    """
+
+    def __init__(self, session_factory, limit: int = MAX_CHOICES) -> None:
+        self.session_factory = session_factory
+        self.limit = limit
+        self._entries: list[TournamentIndexEntry] | None = None
+
+    def load(self) -> None:
+        stmt = (
+            select(Tournament.name, Tournament.slug, Tournament.ongoing, Tournament.winner_id.is_not(None))
+            .order_by(Tournament.ongoing, Tournament.id.desc())
+        )
+        with self.session_factory() as session:
+            rows = session.execute(stmt).all()
+
+        self._entries = [TournamentIndexEntry(*row) for row in rows]
+        log.info(f"[tournament_index] Loaded {len(self._entries)} tournaments")
+
+    def invalidate(self) -> None:
+        self._entries = None
+
+    def search(self, current: str, *, ongoing: bool | None = None, finished: bool | None = None) -> list[TournamentIndexEntry]:
+        """Prefix matches first, then substring matches, at most `limit` results."""
+        if self._entries is None:
+            self.load()
+
+        needle = (current or "").strip().lower()
+        prefix = []
+        substring = []
+        for entry in self._entries:
+            if ongoing is not None and entry.ongoing != ongoing:
+                continue
+            if finished is not None and entry.finished != finished:
+                continue
+
+            rank = entry.rank(needle)
+            if rank == 0:
+                prefix.append(entry)
+                if len(prefix) >= self.limit:
+                    break
+            elif rank == 1 and len(substring) < self.limit:
+                substring.append(entry)
+
+        return (prefix + substring)[:self.limit]
@@ -0,0 +1,117 @@
+import logging
+
+from sqlalchemy import select, func, update
+from database.models import Tournament, TournamentMatches
+from .db_offload import DbExecutor, db_executor
+
+log = logging.getLogger(__name__)
+
+
+class TournamentState:
+    """Process-wide view of the current tournament, its current and max round.
+
+    Loaded with one aggregate query on `executor` and shared by every
+    consumer. The view is read-only: changes go to the database (e.g. through
+    `override_current_round`), then `invalidate()` marks it stale. Reading
+    never queries; commands `await refresh()` first, which reloads only when
+    stale. Commands invalidate after every event that can move it (reports,
+    round setup, starting/ending or switching tournaments).
+    """
+
+    def __init__(self, executor: DbExecutor = db_executor) -> None:
+        self.executor = executor
+        self._current_tournament: str | None = None
+        self._current_round: int | None = None
+        self._max_round: int | None = None
+        self._loaded = False
+        # Bumped by invalidate(), so a load that raced with it stays stale
+        self._generation = 0
+
+    @staticmethod
+    def _query(session) -> tuple[str | None, int | None, int | None]:
+        stmt = (
+            select(
+                Tournament.slug,
+                # Lowest unfinished round; None once every round > 0 is played
+                func.coalesce(
+                    Tournament.current_round_override,
+                    func.min(TournamentMatches.round).filter(
+                        TournamentMatches.completed.is_(False),
+                        TournamentMatches.round > 0
+                    ),
+                ),
+                func.coalesce(
+                    Tournament.max_round_override,
+                    func.max(TournamentMatches.round).filter(
+                        TournamentMatches.round > 0
+                    ),
+                ),
+            )
+            .outerjoin(TournamentMatches, TournamentMatches.tournament_id == Tournament.id)
+            .where(Tournament.current_tournament.is_(True))
+            .group_by(Tournament.id, Tournament.slug)
+            .order_by(Tournament.id)
+            .limit(1)
+        )
+
+        row = session.execute(stmt).first()
+        return tuple(row) if row else (None, None, None)
+
+    async def load(self) -> None:
+        generation = self._generation
+        row = await self.executor.run(self._query)
+        self._current_tournament, self._current_round, self._max_round = row
+        self._loaded = generation == self._generation
+        log.info(
+            f"[tournament_state] Loaded tournament={self._current_tournament}, "
+            f"round={self._current_round}, max_round={self._max_round}")
+
+    def invalidate(self) -> None:
+        self._loaded = False
+        self._generation += 1
+
+    async def refresh(self) -> None:
+        """Reload if invalidated since the last load."""
+        if not self._loaded:
+            await self.load()
+
+    @staticmethod
+    def _update(session, values: dict[str, int | None]) -> bool:
+        result = session.execute(
+            update(Tournament)
+            .where(Tournament.current_tournament.is_(True))
+            .values(**values)
+        )
+        return result.rowcount > 0
+
+    async def _override(self, **values: int | None) -> bool:
+        updated = await self.executor.run(self._update, values)
+        self.invalidate()
+        await self.refresh()
+        return updated
+
+    async def override_current_round(self, value: int | None) -> bool:
+        """Pin the current round of the current tournament (None goes back to deriving it).
+
+        Returns False when no tournament is current.
+        """
+        return await self._override(current_round_override=value)
+
+    async def override_max_round(self, value: int | None) -> bool:
+        """Pin the max round of the current tournament (None goes back to deriving it).
+
+        Returns False when no tournament is current.
+        """
+        return await self._override(max_round_override=value)
+
+    @property
+    def current_tournament(self) -> str | None:
+        return self._current_tournament
+
+    @property
+    def current_round(self) -> int | None:
+        return self._current_round
+
+    @property
+    def max_round(self) -> int | None:
+        return self._max_round
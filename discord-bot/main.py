@@ -6,56 +6,71 @@ import asyncio
 from flask import Flask
 import threading
 
+from database.database import async_engine
+from helpers import db_executor
+from render_worker import render_worker
+
 # Load environment variables
 BOT_TOKEN = str(os.getenv("DISCORD_TOKEN"))
 GUILD_ID = os.getenv("GUILD_ID")
 
+# Nothing below is built at import time: render workers are spawned
+# processes and re-import this module as __mp_main__
+
 # Flask web server setup
-app = Flask(__name__)
+def create_app() -> Flask:
+    app = Flask(__name__)
 
-@app.route("/")
-def home():
-    return "Bot is alive!"
+    @app.route("/")
+    def home():
+        return "Bot is alive!"
+
+    return app
 
 def run_webserver():
     port = int(os.environ.get("PORT", 10000))
-    app.run(host="0.0.0.0", port=port)
+    create_app().run(host="0.0.0.0", port=port)
 
 # Logging setup
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s",
-    handlers=[
-        logging.FileHandler(filename="discord.log", encoding="utf-8", mode="w"),
-        logging.StreamHandler()
-    ]
-)
+def setup_logging():
+    # Called only when run as a script, so workers don't truncate discord.log
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        handlers=[
+            logging.FileHandler(filename="discord.log", encoding="utf-8", mode="w"),
+            logging.StreamHandler()
+        ]
+    )
 
-logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
 
 # Bot setup
-intents = discord.Intents.all()
-bot = commands.Bot(
-    command_prefix="/",
-    intents=intents
-)
-
-@bot.event
-async def on_ready():
-    """Handles the event when the Discord bot has successfully connected and is ready."""
-    logging.info("Loaded cogs: %s", list(bot.cogs.keys()))
-    logging.info(f"We have successfully logged in as {bot.user}")
-    logging.info("------------------------------------------------")
-
-    await bot.change_presence(activity=discord.Game(name="Pokemon Blaze Online"))
-    print(f"\nWe have successfully logged in as {bot.user}.\n------------------------------------------------")
-    
-    # Sync the command tree for slash commands
-    await bot.tree.sync()
-    print("Slash commands synced")
-    logging.info("Slash commands synced")
-
-async def load_all_extensions():
+def create_bot() -> commands.Bot:
+    intents = discord.Intents.all()
+    bot = commands.Bot(
+        command_prefix="/",
+        intents=intents
+    )
+
+    @bot.event
+    async def on_ready():
+        """Handles the event when the Discord bot has successfully connected and is ready."""
+        logging.info("Loaded cogs: %s", list(bot.cogs.keys()))
+        logging.info(f"We have successfully logged in as {bot.user}")
+        logging.info("------------------------------------------------")
+
+        await bot.change_presence(activity=discord.Game(name="Pokemon Blaze Online"))
+        print(f"\nWe have successfully logged in as {bot.user}.\n------------------------------------------------")
+
+        # Sync the command tree for slash commands
+        await bot.tree.sync()
+        print("Slash commands synced")
+        logging.info("Slash commands synced")
+
+    return bot
+
+async def load_all_extensions(bot: commands.Bot):
     """Loads all Python files ending with '.py' in the 'cogs' directory as extensions."""
     if not os.path.exists("./cogs"):
         logging.warning("No 'cogs' directory found. Skipping extension loading.")
@@ -74,9 +89,16 @@ async def main():
     # Start Flask web server in a new thread
     threading.Thread(target=run_webserver).start()
 
+    bot = create_bot()
     async with bot:
-        await load_all_extensions()
-        await bot.start(BOT_TOKEN)
+        await load_all_extensions(bot)
+        try:
+            await bot.start(BOT_TOKEN)
+        finally:
+            db_executor.shutdown()
+            render_worker.shutdown()
+            await async_engine.dispose()
 
 if __name__ == "__main__":
+    setup_logging()
     asyncio.run(main())
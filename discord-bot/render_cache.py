@@ -0,0 +1,197 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from urllib.parse import parse_qs, urlparse
+
+log = logging.getLogger(__name__)
+
+RENDER_CACHE_DIR = os.getenv("RENDER_CACHE_DIR", os.path.join("cache", "renders"))
+RENDER_CACHE_MAX_MB = float(os.getenv("RENDER_CACHE_MAX_MB", 128))
+# Pastes, parsed teams and popularity counters kept in memory
+RENDER_MEMORY_ITEMS = int(os.getenv("RENDER_MEMORY_ITEMS", 512))
+# A team requested this often is answered with the Discord attachment of an
+# earlier post instead of a new upload
+RENDER_REUSE_AFTER = int(os.getenv("RENDER_REUSE_AFTER", 3))
+# Used when an attachment URL carries no expiry of its own (seconds)
+RENDER_ATTACHMENT_TTL = float(os.getenv("RENDER_ATTACHMENT_TTL", 6 * 3600))
+
+# Bump whenever the image layout changes so old renders aren't served
+# (2: renders with placeholder sprites were cached before)
+RENDER_VERSION = 2
+
+
+def team_key(team: list[dict]) -> str:
+    """Hash of the parsed team: identical teams share a render whatever paste they came from."""
+    payload = json.dumps({"version": RENDER_VERSION, "team": team}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def attachment_expiry(url: str) -> float:
+    """Wall-clock expiry of a Discord CDN URL, from its signed `ex` parameter."""
+    try:
+        return int(parse_qs(urlparse(url).query)["ex"][0], 16)
+    except (KeyError, IndexError, ValueError):
+        return time.time() + RENDER_ATTACHMENT_TTL
+
+
+class RenderEntry:
+    __slots__ = ("requests", "attachment_url", "attachment_expires")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.attachment_url: str | None = None
+        self.attachment_expires = 0.0
+
+
+class RenderCache:
+    """Encoded team images on disk, keyed by `team_key`.
+
+    `renders/<key>.png` holds the PNG; its mtime is its last use, and the
+    least recently used go first once the directory outgrows `max_bytes`.
+    In memory, pastes (immutable) map to their parsed team so a repeat
+    `/pp` skips the download, and popular teams remember the attachment
+    URL Discord gave their last upload.
+    """
+
+    def __init__(self, directory: str = RENDER_CACHE_DIR,
+                 max_bytes: int = int(RENDER_CACHE_MAX_MB * 1024 * 1024),
+                 max_items: int = RENDER_MEMORY_ITEMS) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_items = max_items
+        self._lock = threading.Lock()
+        self._pastes: OrderedDict[str, list[dict]] = OrderedDict()
+        self._entries: OrderedDict[str, RenderEntry] = OrderedDict()
+        self._disk_bytes: int | None = None
+        self.stats = {
+            "paste_hits": 0,
+            "attachment_hits": 0,
+            "disk_hits": 0,
+            "renders": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def _bounded(mapping: OrderedDict, key, value, limit: int) -> None:
+        mapping[key] = value
+        mapping.move_to_end(key)
+        while len(mapping) > limit:
+            mapping.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    # Pastes ---------------------------------------------------------------
+
+    def team_for(self, url: str) -> list[dict] | None:
+        with self._lock:
+            team = self._pastes.get(url.rstrip("/"))
+            if team is not None:
+                self._pastes.move_to_end(url.rstrip("/"))
+                self.stats["paste_hits"] += 1
+            return team
+
+    def remember_team(self, url: str, team: list[dict]) -> None:
+        with self._lock:
+            self._bounded(self._pastes, url.rstrip("/"), team, self.max_items)
+
+    # Renders --------------------------------------------------------------
+
+    def lookup(self, key: str) -> tuple[str | None, bytes | None]:
+        """(attachment URL, None) for a popular team with a live upload, else (None, PNG or None)."""
+        with self._lock:
+            entry = self._entries.get(key) or RenderEntry()
+            entry.requests += 1
+            self._bounded(self._entries, key, entry, self.max_items)
+            if (entry.requests > RENDER_REUSE_AFTER and entry.attachment_url
+                    and entry.attachment_expires - time.time() > 60):
+                self.stats["attachment_hits"] += 1
+                return entry.attachment_url, None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None, None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        with self._lock:
+            self.stats["disk_hits"] += 1
+        return None, data
+
+    def store(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self.stats["renders"] += 1
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            log.warning(f"[render_cache] Could not cache render {key[:12]}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is not None:
+                self._disk_bytes += len(data)
+        self._evict()
+
+    def remember_attachment(self, key: str, url: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.attachment_url = url
+                entry.attachment_expires = attachment_expiry(url)
+
+    def _scan(self) -> list[tuple[float, int, str]]:
+        renders = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except OSError:
+            return renders
+        for entry in entries:
+            if entry.name.endswith(".png"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                renders.append((stat.st_mtime, stat.st_size, entry.path))
+        return renders
+
+    def _evict(self) -> None:
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan())
+            if self._disk_bytes <= self.max_bytes:
+                return
+
+            renders = sorted(self._scan())
+            total = sum(size for _, size, _ in renders)
+            for _, size, path in renders:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                self.stats["evictions"] += 1
+            self._disk_bytes = total
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats, "pastes": len(self._pastes), "disk_bytes": self._disk_bytes}
+
+
+render_cache = RenderCache()
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+log = logging.getLogger(__name__)
+
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", min(2, os.cpu_count() or 1)))
+# Renders allowed to wait for a free worker; beyond that /pp is turned away
+RENDER_QUEUE_SIZE = int(os.getenv("RENDER_QUEUE_SIZE", 8))
+# Seconds a caller waits for its render, queue time included
+RENDER_TIMEOUT = float(os.getenv("RENDER_TIMEOUT", 45))
+
+
+class RenderQueueFull(Exception):
+    pass
+
+
+def _warm_up() -> None:
+    # Pay for Pillow and the fonts once per process, not on the first job
+    import generate_team_image  # noqa: F401
+
+
+def _render(team: list[dict]) -> tuple[bytes, bool, float, float]:
+    from generate_team_image import render_team
+
+    started = time.time()
+    data, complete = render_team(team)
+    return data, complete, started, time.time() - started
+
+
+class RenderWorker:
+    """Small process pool that turns a parsed team into PNG bytes.
+
+    Pillow drawing and the sprite downloads run in worker processes, in
+    parallel on several cores, while the event loop keeps serving the
+    gateway. Workers are spawned, not forked, so they don't inherit the
+    bot's threads; they share the sprite cache through its disk tier.
+
+    At most `workers + queue_size` renders are in flight. A render that
+    times out keeps its slot until the worker actually finishes it, so the
+    bound stays honest.
+    """
+
+    def __init__(self, workers: int = RENDER_WORKERS, queue_size: int = RENDER_QUEUE_SIZE,
+                 timeout: float = RENDER_TIMEOUT) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        # Completed with placeholders for assets that failed or were too slow
+        self.degraded = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.restarts = 0
+        self.total_render = 0.0
+        self.max_render = 0.0
+        self.total_wait = 0.0
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_up
+            )
+        return self._executor
+
+    def _restart(self, broken: ProcessPoolExecutor) -> None:
+        # A worker died (e.g. out of memory); the executor is unusable afterwards
+        if self._executor is broken:
+            log.warning("[render_worker] Render pool broke, starting a new one")
+            self._executor = None
+            self.restarts += 1
+            broken.shutdown(wait=False, cancel_futures=True)
+
+    def _done(self, _future) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    async def render(self, team: list[dict]) -> tuple[bytes, bool]:
+        """PNG bytes for `team` and whether every asset made it in.
+
+        Raises RenderQueueFull or asyncio.TimeoutError.
+        """
+        with self._lock:
+            if self.in_flight >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise RenderQueueFull(f"{self.in_flight} renders already in progress")
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+
+        submitted = time.time()
+        pool = self._pool()
+        try:
+            future = pool.submit(_render, team)
+        except BrokenProcessPool:
+            self._restart(pool)
+            pool = self._pool()
+            try:
+                future = pool.submit(_render, team)
+            except Exception:
+                self._done(None)
+                raise
+        except Exception:
+            self._done(None)
+            raise
+        future.add_done_callback(self._done)
+
+        try:
+            data, complete, started, elapsed = await asyncio.wait_for(asyncio.wrap_future(future), self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            log.warning(f"[render_worker] Render gave up after {self.timeout:g}s")
+            raise
+        except BrokenProcessPool:
+            with self._lock:
+                self.errors += 1
+            self._restart(pool)
+            raise
+        except Exception:
+            with self._lock:
+                self.errors += 1
+            raise
+
+        with self._lock:
+            self.completed += 1
+            self.degraded += not complete
+            self.total_render += elapsed
+            self.max_render = max(self.max_render, elapsed)
+            self.total_wait += max(started - submitted, 0.0)
+        return data, complete
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            running = min(self.in_flight, self.workers)
+            return {
+                "workers": self.workers,
+                "running": running,
+                "queued": self.in_flight - running,
+                "queue_size": self.queue_size,
+                "peak_in_flight": self.peak_in_flight,
+                "completed": self.completed,
+                "degraded": self.degraded,
+                "errors": self.errors,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "restarts": self.restarts,
+                "avg_render_ms": (self.total_render / self.completed * 1000) if self.completed else 0.0,
+                "max_render_ms": self.max_render * 1000,
+                "avg_wait_ms": (self.total_wait / self.completed * 1000) if self.completed else 0.0,
+            }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+render_worker = RenderWorker()
@@ -0,0 +1,228 @@
+import hashlib
+import io
+import logging
+import os
+import re
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Callable
+from PIL import Image
+
+log = logging.getLogger(__name__)
+
+SPRITE_CACHE_DIR = os.getenv("SPRITE_CACHE_DIR", os.path.join("cache", "sprites"))
+SPRITE_CACHE_MAX_MB = float(os.getenv("SPRITE_CACHE_MAX_MB", 256))
+SPRITE_MEMORY_ITEMS = int(os.getenv("SPRITE_MEMORY_ITEMS", 128))
+# Names that had no image are not asked for again for this long (seconds)
+SPRITE_NEGATIVE_TTL = float(os.getenv("SPRITE_NEGATIVE_TTL", 3600))
+
+
+class SpriteStore:
+    """Decoded sprites and item icons by normalized key, e.g. "pokemon/garchomp".
+
+    Two tiers: an LRU of decoded RGBA images in memory, in front of a
+    content-addressed disk cache. On disk, `blobs/<sha256>.png` holds the
+    image bytes once however many names share them, and `names/<key>` holds
+    the hash a name resolves to. A blob's mtime is its last use; once the
+    blobs outgrow `max_bytes`, the least recently used go first. The layout
+    only needs atomic renames, so several processes can share one directory.
+    """
+
+    def __init__(self, directory: str = SPRITE_CACHE_DIR, max_items: int = SPRITE_MEMORY_ITEMS,
+                 max_bytes: int = int(SPRITE_CACHE_MAX_MB * 1024 * 1024)) -> None:
+        self.directory = directory
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, Image.Image] = OrderedDict()
+        self._missing: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._disk_bytes: int | None = None
+        self.stats = {
+            "memory_hits": 0,
+            "pack_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "not_found": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+        }
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    # Disk tier ------------------------------------------------------------
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", f"{digest}.png")
+
+    def _name_path(self, key: str) -> str:
+        parts = [re.sub(r"[^a-z0-9_-]+", "_", part.lower()) or "_" for part in key.split("/")]
+        return os.path.join(self.directory, "names", *parts)
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _read_disk(self, key: str) -> bytes | None:
+        try:
+            with open(self._name_path(key), "r") as f:
+                digest = f.read().strip()
+            path = self._blob_path(digest)
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        try:
+            if not os.path.exists(path):
+                self._write_atomic(path, data)
+                with self._lock:
+                    if self._disk_bytes is not None:
+                        self._disk_bytes += len(data)
+            self._write_atomic(self._name_path(key), digest.encode())
+        except OSError as e:
+            log.warning(f"[sprite_store] Could not cache {key}: {e}")
+            return
+
+        self._evict_disk()
+
+    def _scan_blobs(self) -> list[tuple[float, int, str]]:
+        blobs = []
+        blob_dir = os.path.join(self.directory, "blobs")
+        try:
+            entries = list(os.scandir(blob_dir))
+        except OSError:
+            return blobs
+        for entry in entries:
+            if entry.name.endswith(".png"):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, entry.path))
+        return blobs
+
+    def _evict_disk(self) -> None:
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._scan_blobs())
+            if self._disk_bytes <= self.max_bytes:
+                return
+
+            # Other processes write too: work from what's actually on disk
+            blobs = sorted(self._scan_blobs())
+            total = sum(size for _, size, _ in blobs)
+            for _, size, path in blobs:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                self.stats["disk_evictions"] += 1
+            self._disk_bytes = total
+        # Name files pointing at an evicted blob are simply misses next time
+
+    # Memory tier ----------------------------------------------------------
+
+    def _remember(self, key: str, image: Image.Image) -> None:
+        with self._lock:
+            self._memory[key] = image
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_items:
+                self._memory.popitem(last=False)
+                self.stats["memory_evictions"] += 1
+
+    def _from_memory(self, key: str) -> Image.Image | None:
+        with self._lock:
+            image = self._memory.get(key)
+            if image is not None:
+                self._memory.move_to_end(key)
+            return image
+
+    # Public ---------------------------------------------------------------
+
+    def get(self, key: str, fetch: Callable[[], bytes | None],
+            local: Callable[[], bytes | None] | None = None) -> Image.Image | None:
+        """The image stored under `key`, calling `fetch()` for its bytes on a miss.
+
+        `local` (optional) reads bytes that ship with the bot, such as the
+        asset pack; they are tried before the disk cache and never copied
+        into it. `fetch` returns None when the thing doesn't exist
+        (remembered for SPRITE_NEGATIVE_TTL) and raises on transient errors,
+        which are passed on. Returns a copy the caller may resize or paste
+        freely, or None when there is no image.
+        """
+        image = self._from_memory(key)
+        if image is not None:
+            self._count("memory_hits")
+            return image.copy()
+
+        data = local() if local is not None else None
+        if data is not None:
+            try:
+                image = Image.open(io.BytesIO(data)).convert("RGBA")
+            except Exception as e:
+                log.warning(f"[sprite_store] Packed {key} is not a valid image: {e}")
+            else:
+                self._count("pack_hits")
+                self._remember(key, image)
+                return image.copy()
+
+        with self._lock:
+            missing_since = self._missing.get(key)
+        if missing_since is not None and time.monotonic() - missing_since < SPRITE_NEGATIVE_TTL:
+            self._count("not_found")
+            return None
+
+        data = self._read_disk(key)
+        fetched = data is None
+        if fetched:
+            self._count("misses")
+            try:
+                data = fetch()
+            except Exception as e:
+                # Transient (timeout, 5xx): not remembered, the caller decides
+                log.warning(f"[sprite_store] Fetching {key} failed: {e}")
+                raise
+            if data is None:
+                with self._lock:
+                    self._missing[key] = time.monotonic()
+                return None
+        else:
+            self._count("disk_hits")
+
+        try:
+            image = Image.open(io.BytesIO(data)).convert("RGBA")
+        except Exception as e:
+            log.warning(f"[sprite_store] {key} is not a valid image: {e}")
+            return None
+
+        if fetched:
+            self._write_disk(key, data)
+        self._remember(key, image)
+        return image.copy()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {**self.stats, "memory_items": len(self._memory), "disk_bytes": self._disk_bytes}
+
+
+sprite_store = SpriteStore()
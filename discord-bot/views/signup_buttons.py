@@ -1,12 +1,21 @@
 import discord
-# from database.database import Session
-from cogs.tournament import Tournaments
 
 
 class SignUpView(discord.ui.View):
     def __init__(self, bot, timeout: float | None = None):
         super().__init__(timeout=timeout)
-        self.tournament = Tournaments(bot)
+        self.bot = bot
+
+    @property
+    def tournament(self):
+        # Use the loaded cog so every view shares its state and Challonge client
+        return self.bot.get_cog("Tournaments")
+
+    async def __unavailable(self, interaction: discord.Interaction):
+        await interaction.response.send_message(
+            "⚠️ Tournaments are unavailable right now. Please try again later.",
+            ephemeral=True
+        )
 
     @discord.ui.button(
         label="Sign Up",
@@ -14,7 +23,10 @@ class SignUpView(discord.ui.View):
         emoji="📝",
         custom_id="tournament:sign_up"
     )
-    async def sign_up(self, interaction: discord.Interaction, button: discord.ui.Button):        
+    async def sign_up(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not self.tournament:
+            await self.__unavailable(interaction)
+            return
         await self.tournament.sign_up_tournament(interaction)
 
     @discord.ui.button(
@@ -24,4 +36,7 @@ class SignUpView(discord.ui.View):
         custom_id="tournament:unregister"
     )
     async def unregister(self, interaction: discord.Interaction, button: discord.ui.Button):
+        if not self.tournament:
+            await self.__unavailable(interaction)
+            return
         await self.tournament.unregister_tournament(interaction)